@@ -10,7 +10,7 @@
 # from import_export.admin import ImportExportActionModelAdmin
 
 # # Inter App Imports
-# from lookup.choices import STATE_TO_CITY_IDS
+# from lookup.validators import is_city_in_state
 
 # # Local Imports
 # from .models import User
@@ -38,7 +38,7 @@
 #         if self.cleaned_data.get('country') == 'IN':
 #             if not self.cleaned_data.get('city'):
 #                 self._errors['city'] = self.error_class(["Please choose a value for city"])
-#             if self.cleaned_data['city'] and self.cleaned_data['city'] not in STATE_TO_CITY_IDS[self.cleaned_data['state']]:
+#             if self.cleaned_data['city'] and not is_city_in_state(self.cleaned_data['city'], self.cleaned_data['state']):
 #                 self._errors['city'] = self.error_class(["Please choose a correct city value"])
 #         elif not self.cleaned_data.get('city_text'):
 #             self._errors['city_text'] = self.error_class(["Please enter a value for city"])
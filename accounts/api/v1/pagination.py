@@ -1,9 +1,17 @@
 # Python Imports
+import base64
+import heapq
+from collections import OrderedDict
 
 # Django Imports
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
 
 # Third Party Django Imports
-from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, LimitOffsetPagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 # Inter App Imports
 
@@ -17,3 +25,98 @@ class PostLimitOffsetPagination(LimitOffsetPagination):
 
 class PostPageNumberPagination(PageNumberPagination):
     page_size = 10
+
+
+class MessageCursorPagination(BasePagination):
+    """
+    Pages Through Messages Oldest to Newest By a Cursor On (sent_on, id).
+
+    Without a Cursor the Latest Page Is Returned. `?before=<cursor>` Loads
+    Older Messages And `?after=<cursor>` Loads Newer Ones, E.g. Those Sent
+    Since the Last Fetch. The Response Has Links to Both.
+
+    Each Queryset Passed In (E.g. One Per Direction of a Chat) Is Read Along
+    Its Own (.., sent_on, id) Index For At Most One Page, And the Reads Are
+    Merged, So a Page Costs the Same However Long the Chat Is.
+    """
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    before_query_param = 'before'
+    after_query_param = 'after'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def encode_cursor(self, message):
+        position = '{}|{}'.format(message.sent_on.isoformat(), message.id)
+        return base64.urlsafe_b64encode(position.encode('ascii')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            sent_on, message_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii').split('|')
+            sent_on, message_id = parse_datetime(sent_on), int(message_id)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if sent_on is None:
+            raise NotFound(self.invalid_cursor_message)
+        return sent_on, message_id
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    def paginate_querysets(self, querysets, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        before = request.query_params.get(self.before_query_param)
+        after = request.query_params.get(self.after_query_param)
+
+        if after:
+            sent_on, message_id = self.decode_cursor(after)
+            position_filter = Q(sent_on__gt=sent_on) | Q(sent_on=sent_on, id__gt=message_id)
+            ordering = ('sent_on', 'id')
+        elif before:
+            sent_on, message_id = self.decode_cursor(before)
+            position_filter = Q(sent_on__lt=sent_on) | Q(sent_on=sent_on, id__lt=message_id)
+            ordering = ('-sent_on', '-id')
+        else:
+            position_filter = Q()
+            ordering = ('-sent_on', '-id')
+
+        # One Extra Message Tells If There Is Another Page
+        parts = [list(queryset.filter(position_filter).order_by(*ordering)[:self.page_size + 1]) for queryset in querysets]
+        sort_key = lambda message: (message.sent_on, message.id)
+        messages = list(heapq.merge(*parts, key=sort_key, reverse=ordering[0].startswith('-')))
+        has_more = len(messages) > self.page_size
+        messages = messages[:self.page_size]
+
+        if not after:
+            messages.reverse()
+        self.has_older = has_more if not after else True
+        self.has_newer = has_more if after else bool(before)
+
+        self.older_cursor = self.encode_cursor(messages[0]) if messages else before or after
+        self.newer_cursor = self.encode_cursor(messages[-1]) if messages else after
+        return messages
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.paginate_querysets([queryset], request, view=view)
+
+    def get_link(self, query_param, cursor):
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.before_query_param)
+        url = remove_query_param(url, self.after_query_param)
+        return replace_query_param(url, query_param, cursor)
+
+    def get_paginated_response(self, data):
+        older = self.get_link(self.before_query_param, self.older_cursor) if self.has_older and self.older_cursor else None
+        # Always Given For the Latest Page Too, So Clients Can Poll For New Messages
+        newer = self.get_link(self.after_query_param, self.newer_cursor) if self.newer_cursor else None
+        return Response(OrderedDict([
+            ('older', older),
+            ('newer', newer),
+            ('has_newer', self.has_newer),
+            ('results', data),
+        ]))
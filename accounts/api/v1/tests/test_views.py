@@ -2,13 +2,17 @@
 import unittest
 import json
 import os
+import threading
 
 # inbuilt django imports
 from django.test import Client
 from django.core.urlresolvers import reverse
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.db.models import Q
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 # third-party django imports
 import pytest
@@ -19,6 +23,7 @@ from rest_framework import status
 from sportsvitae.shared.factories import UserFactory, MidoutUserFactory, CricketerFactory, FriendRequestFactory, MessageFactory, UserWallPostFactory, UserWallPostCommentFactory
 
 # local imports
+from accounts.events import EVENT_BROKERS, publish_event
 from accounts.models import FriendRequest, Message, UserWallPost, UserWallPostComment, UserNotification
 
 
@@ -394,15 +399,15 @@ class TestUserMessages(unittest.TestCase):
     def test_returns_no_messages_if_no_friend_id_parameter(self):
         message = MessageFactory(sender=self.sender, recipient=self.recipient)
         response = self.client.get(self.url)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data['results'], [])
 
     def test_returns_messages_in_response(self):
         Message.objects.all().delete()
         message = MessageFactory(sender=self.sender, recipient=self.recipient)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertTrue(response.data)
-        self.assertEqual(len(response.data), Message.objects.all().count())
+        self.assertTrue(response.data['results'])
+        self.assertEqual(len(response.data['results']), Message.objects.all().count())
 
     def test_returns_chat_messages_in_response(self):
         Message.objects.all().delete()
@@ -411,7 +416,7 @@ class TestUserMessages(unittest.TestCase):
         message3 = MessageFactory(sender=self.sender)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(len(response.data), 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_returns_only_sent_chat_messages_not_deleted_by_sender_in_response(self):
         Message.objects.all().delete()
@@ -423,8 +428,8 @@ class TestUserMessages(unittest.TestCase):
         message6 = MessageFactory(sender=self.sender, recipient=self.recipient)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(len(response.data), 4)
-        messages_data = response.data
+        self.assertEqual(len(response.data['results']), 4)
+        messages_data = response.data['results']
         messages_ids_data = [x['id'] for x in messages_data]
         self.assertNotIn(message1.id, messages_ids_data)
         self.assertIn(message2.id, messages_ids_data)
@@ -443,8 +448,8 @@ class TestUserMessages(unittest.TestCase):
         message6 = MessageFactory(sender=self.sender, recipient=self.recipient)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(len(response.data), 6)
-        messages_data = response.data
+        self.assertEqual(len(response.data['results']), 6)
+        messages_data = response.data['results']
         messages_ids_data = [x['id'] for x in messages_data]
         self.assertIn(message1.id, messages_ids_data)
         self.assertIn(message2.id, messages_ids_data)
@@ -463,8 +468,8 @@ class TestUserMessages(unittest.TestCase):
         message6 = MessageFactory(sender=self.sender, recipient=self.recipient)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(len(response.data), 4)
-        messages_data = response.data
+        self.assertEqual(len(response.data['results']), 4)
+        messages_data = response.data['results']
         messages_ids_data = [x['id'] for x in messages_data]
         self.assertIn(message1.id, messages_ids_data)
         self.assertNotIn(message2.id, messages_ids_data)
@@ -483,8 +488,8 @@ class TestUserMessages(unittest.TestCase):
         message6 = MessageFactory(sender=self.sender, recipient=self.recipient)
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(len(response.data), 6)
-        messages_data = response.data
+        self.assertEqual(len(response.data['results']), 6)
+        messages_data = response.data['results']
         messages_ids_data = [x['id'] for x in messages_data]
         self.assertIn(message1.id, messages_ids_data)
         self.assertIn(message2.id, messages_ids_data)
@@ -499,8 +504,8 @@ class TestUserMessages(unittest.TestCase):
         message2 = MessageFactory(sender=self.recipient, recipient=self.sender, text='world')
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         response = self.client.get(url)
-        self.assertEqual(response.data[0]['text'], message1.text)
-        self.assertEqual(response.data[1]['text'], message2.text)
+        self.assertEqual(response.data['results'][0]['text'], message1.text)
+        self.assertEqual(response.data['results'][1]['text'], message2.text)
 
     def test_returns_correct_keys_in_get_response(self):
         Message.objects.all().delete()
@@ -508,7 +513,7 @@ class TestUserMessages(unittest.TestCase):
         url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
         expected_keys = ['sender', 'recipient', 'text', 'sent_on', 'id']
         response = self.client.get(url)
-        map(lambda key:self.assertIn(key, response.data[0]), expected_keys)
+        map(lambda key:self.assertIn(key, response.data['results'][0]), expected_keys)
 
     def test_returns_201_response_on_post(self):
         self.assertEqual(self.response.status_code, status.HTTP_201_CREATED)
@@ -555,6 +560,43 @@ class TestUserMessages(unittest.TestCase):
         response = self.client.post(self.url, self.post_data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def create_chat(self, count):
+        Message.objects.all().delete()
+        return [MessageFactory(sender=self.sender if index % 2 else self.recipient, recipient=self.recipient if index % 2 else self.sender, text=str(index)) for index in range(count)]
+
+    def test_returns_latest_page_in_ascending_order(self):
+        messages = self.create_chat(5)
+        url = reverse('user_messages_api') + '?friend_id={}&page_size=2'.format(self.recipient.id)
+        response = self.client.get(url)
+        self.assertEqual([x['id'] for x in response.data['results']], [messages[3].id, messages[4].id])
+        self.assertTrue(response.data['older'])
+        self.assertFalse(response.data['has_newer'])
+
+    def test_older_links_walk_back_through_chat(self):
+        messages = self.create_chat(5)
+        url = reverse('user_messages_api') + '?friend_id={}&page_size=2'.format(self.recipient.id)
+        message_ids = []
+        while url:
+            response = self.client.get(url)
+            message_ids = [x['id'] for x in response.data['results']] + message_ids
+            url = response.data['older']
+        self.assertEqual(message_ids, [message.id for message in messages])
+
+    def test_newer_link_returns_messages_sent_since(self):
+        self.create_chat(2)
+        url = reverse('user_messages_api') + '?friend_id={}'.format(self.recipient.id)
+        newer_url = self.client.get(url).data['newer']
+        self.assertEqual(self.client.get(newer_url).data['results'], [])
+
+        message = MessageFactory(sender=self.recipient, recipient=self.sender)
+        response = self.client.get(newer_url)
+        self.assertEqual([x['id'] for x in response.data['results']], [message.id])
+
+    def test_returns_404_on_invalid_cursor(self):
+        url = reverse('user_messages_api') + '?friend_id={}&before=invalid'.format(self.recipient.id)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
 
 @pytest.mark.django_db
 class TestDeleteFriendChatHistory(unittest.TestCase):
@@ -1450,3 +1492,76 @@ class TestMarkFriendRequestsViewed(unittest.TestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('friend_requests_viewed', response.data)
         self.assertIn('This field is required.', response.data['friend_requests_viewed'])
+
+
+@pytest.mark.django_db(transaction=True)
+class TestUserEvents(unittest.TestCase):
+
+    def setUp(self):
+        settings_override = override_settings(EVENTS_BROKER='accounts.events.LocalEventBroker')  # No Shared Cache Server in Tests
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        EVENT_BROKERS.clear()
+        self.client = Client()
+        self.user = CricketerFactory().user
+        self.friend = CricketerFactory().user
+        self.client.login(username=self.user.email, password=settings.TEST_USER_PASSWORD)
+        self.url = reverse('user_events')
+
+    def tearDown(self):
+        EVENT_BROKERS.clear()
+
+    def test_returns_current_version_without_version(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data, {'version': 0, 'events': []})
+
+    @override_settings(EVENTS_LONG_POLL_SECONDS=0)
+    def test_returns_no_events_if_nothing_changed(self):
+        response = self.client.get(self.url + '?version=0')
+        self.assertEqual(response.data, {'version': 0, 'events': []})
+
+    @override_settings(EVENTS_LONG_POLL_SECONDS=5)
+    def test_returns_event_published_while_waiting(self):
+        threading.Timer(0.05, publish_event, args=(self.user.id, 'notifications_viewed'), kwargs={'user_notification_ids': [1]}).start()
+        response = self.client.get(self.url + '?version=0')
+        self.assertEqual(response.data, {'version': 1, 'events': [{'type': 'notifications_viewed', 'user_notification_ids': [1]}]})
+
+    def test_returns_new_message_event(self):
+        message = MessageFactory(sender=self.friend, recipient=self.user)
+        response = self.client.get(self.url + '?version=0')
+        self.assertEqual(response.data['version'], 1)
+        self.assertEqual(response.data['events'], [{'type': 'message_received', 'message_id': message.id, 'sender_id': self.friend.id}])
+
+    @override_settings(EVENTS_LONG_POLL_SECONDS=0)
+    def test_does_not_query_messages_while_waiting(self):
+        self.client.get(self.url)  # Loads the Session And User Once
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.url + '?version=0')
+        self.assertFalse([query for query in queries if 'accounts_message' in query['sql']])
+
+    def test_returns_400_on_invalid_version(self):
+        response = self.client.get(self.url + '?version=latest')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@pytest.mark.django_db
+class TestProcessMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.user = UserFactory()
+        self.client.login(username=self.user.email, password=settings.TEST_USER_PASSWORD)
+        self.url = reverse('process_metrics')
+
+    def test_returns_403_for_non_staff_user(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_returns_metrics_to_staff_user(self):
+        self.user.is_staff = True
+        self.user.save()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['pid'], os.getpid())
+        self.assertIn('queue_depth', response.data['password_hashing'])
+        self.assertIn('render_time_p99', response.data['mail_rendering'])
@@ -9,7 +9,7 @@ from rest_framework.routers import DefaultRouter
 # Inter App Imports
 
 # Local Imports
-from .views import SendFriendRequest, MarkFriendRequestsViewed, AcceptFriendRequest, RejectFriendRequest, CancelFriendRequest, UnfriendUser, UserMessages, MarkUserMessagesRead, DeleteFriendChatHistory, ForgotPassword, ResendVerificationMail, UserWallPostCreateDestroyViewSet, UserWallPostCommentLikeView, UserWallPostCommentUnlikeView, UserWallPostCommentDestroyView, MarkUserNotificationsViewed, OtherUserPosts, UserTourCompleted, UserTourCompletedStatus
+from .views import SendFriendRequest, MarkFriendRequestsViewed, AcceptFriendRequest, RejectFriendRequest, CancelFriendRequest, UnfriendUser, UserMessages, MarkUserMessagesRead, DeleteFriendChatHistory, ForgotPassword, ResendVerificationMail, UserWallPostCreateDestroyViewSet, UserWallPostCommentLikeView, UserWallPostCommentUnlikeView, UserWallPostCommentDestroyView, MarkUserNotificationsViewed, UserEvents, ProcessMetrics, OtherUserPosts, UserTourCompleted, UserTourCompletedStatus
 
 router = DefaultRouter()
 router.register(r'user-wall-posts', UserWallPostCreateDestroyViewSet, base_name='user_wall_post')
@@ -27,6 +27,8 @@ urlpatterns = [
     url(r'^messages/mark-read/$', MarkUserMessagesRead.as_view(), name='mark_user_messages_viewed'),
     url(r'^friends/(?P<id>\d+)/messages/$', DeleteFriendChatHistory.as_view(), name='delete_friend_chat_history'),
     url(r'^notifications/mark-viewed/$', MarkUserNotificationsViewed.as_view(), name='mark_user_notifications_viewed'),
+    url(r'^events/$', UserEvents.as_view(), name='user_events'),
+    url(r'^metrics/$', ProcessMetrics.as_view(), name='process_metrics'),
     url(r'^forgot-password/$', ForgotPassword.as_view(), name='forgot_password'),
     url(r'^resend-verification-mail/$', ResendVerificationMail.as_view(), name='resend_verification_mail'),
     # Wall Post Comments
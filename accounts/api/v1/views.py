@@ -1,15 +1,18 @@
 # Python Imports
+import os
 from itertools import chain
 
 # Django Imports
 from django.http import Http404
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import Q
 
 # Third Party Django Imports
 from rest_framework.generics import  GenericAPIView, CreateAPIView, UpdateAPIView, ListCreateAPIView, DestroyAPIView, ListAPIView
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework import exceptions
 from rest_framework.mixins import CreateModelMixin, DestroyModelMixin
 from rest_framework.decorators import detail_route
@@ -20,12 +23,16 @@ from sportsvitae.shared.common_mixins import EmailVerifiedMixin, LoginRequiredMi
 from cricket.models import CricketTeamWallPost
 from sportsvitae.shared.rest_addons import CreateDestroyViewSet
 from cricket.api.v1.serializers import CricketTeamWallPostSerializer
-from accounts.models import FriendRequest, Message, UserWallPost, UserWallPostComment, UserNotification, User
+from accounts.models import Conversation, FriendRequest, Message, UserWallPost, UserWallPostComment, UserNotification, User
+from accounts.counters import add_to_user_counters, remove_friend_request_from_counters
+from accounts.events import get_event_version, publish_event, wait_for_events
+from accounts.hashing import PASSWORD_HASHING_POOL
+from accounts.mail_rendering import MAIL_RENDERER
 from accounts.utils import send_forgot_password_mail, send_email_verification_mail
 
 # Local Imports
 from .serializers import FriendRequestSerializer, UnfriendUserSerializer, SendMessageSerializer, ForgotPasswordSerializer, UserWallPostSerializer, UserWallPostCommentSerializer, MyWallPostSerializer, UserTourCompletedSerializer
-from .pagination import PostLimitOffsetPagination, PostPageNumberPagination
+from .pagination import MessageCursorPagination, PostLimitOffsetPagination, PostPageNumberPagination
 
 
 class UserTourCompleted(UpdateAPIView):
@@ -89,6 +96,12 @@ class SendFriendRequest(CreateAPIView):
     permission_classes = [IsAuthenticated, ]
     serializer_class = FriendRequestSerializer
 
+    def perform_create(self, serializer):
+        with transaction.atomic():
+            friend_request = serializer.save()
+            add_to_user_counters(friend_request.to_user_id, unviewed_friend_request_count=1)
+        publish_event(friend_request.to_user_id, 'friend_request_received', friend_request_id=friend_request.id, from_user_id=friend_request.from_user_id)
+
 
 class AcceptFriendRequest(APIView):
     """
@@ -110,10 +123,14 @@ class AcceptFriendRequest(APIView):
         if friend_request.to_user != request.user:
             raise exceptions.PermissionDenied()
 
-        friend_request.accept()  # Accept Friend Request
+        with transaction.atomic():
+            remove_friend_request_from_counters(friend_request, with_reverse_requests=True)  # Reverse Requests Are Deleted Too
+            friend_request.accept()  # Accept Friend Request
 
-        # Send Notifications
-        UserNotification.create_friend_request_accept_notification(friend_request.from_user, friend_request.to_user)
+            # Send Notifications
+            UserNotification.create_friend_request_accept_notification(friend_request.from_user, friend_request.to_user)
+            add_to_user_counters(friend_request.from_user_id, unviewed_notification_count=1)
+        publish_event(friend_request.from_user_id, 'notification_received')
 
         return Response()
 
@@ -138,7 +155,9 @@ class RejectFriendRequest(APIView):
         if friend_request.to_user != request.user:
             raise exceptions.PermissionDenied()
 
-        friend_request.reject()  # Reject Friend Request
+        with transaction.atomic():
+            remove_friend_request_from_counters(friend_request, with_reverse_requests=True)  # Reverse Requests Are Deleted Too
+            friend_request.reject()  # Reject Friend Request
         return Response()
 
 
@@ -162,7 +181,9 @@ class CancelFriendRequest(APIView):
         if friend_request.from_user != request.user:
             raise exceptions.PermissionDenied()
 
-        friend_request.cancel()  # Cancel Friend Request
+        with transaction.atomic():
+            remove_friend_request_from_counters(friend_request)
+            friend_request.cancel()  # Cancel Friend Request
         return Response()
 
 
@@ -198,7 +219,12 @@ class MarkFriendRequestsViewed(APIView):
         if not friend_request_ids:
             return Response(data={'friend_requests_viewed': 'This field is required.'}, status=400)
 
-        FriendRequest.objects.filter(to_user=request.user, id__in=friend_request_ids).update(viewed=True)
+        with transaction.atomic():
+            # Pending Requests First, They Are the Ones Counted
+            viewed_count = FriendRequest.objects.filter(to_user=request.user, id__in=friend_request_ids, accepted=False, viewed=False).update(viewed=True)
+            FriendRequest.objects.filter(to_user=request.user, id__in=friend_request_ids, viewed=False).update(viewed=True)
+            add_to_user_counters(request.user.id, unviewed_friend_request_count=-viewed_count)
+        publish_event(request.user.id, 'friend_requests_viewed', friend_request_ids=friend_request_ids)
 
         return Response(status=201)
 
@@ -208,7 +234,7 @@ class UserMessages(ListCreateAPIView):
     1. Sends a new message to a friend.
             Accepted Method: ["POST"]
 
-    2. Lists messages between a friend.
+    2. Lists messages between a friend, a page at a time (see MessageCursorPagination).
         Accepted Method: ["GET"]
 
     URL:
@@ -216,12 +242,22 @@ class UserMessages(ListCreateAPIView):
 
     permission_classes = [IsAuthenticated, ]
     serializer_class = SendMessageSerializer
+    pagination_class = MessageCursorPagination
 
     def get_queryset(self):
         friend_id = self.request.query_params.get('friend_id')
         if not friend_id:
             return Message.objects.none()
-        return Message.objects.filter(Q(sender=self.request.user, recipient_id=friend_id, deleted_by_sender=False) | Q(sender_id=friend_id, recipient=self.request.user, deleted_by_recipient=False))
+        return Message.objects.get_chat_history(self.request.user, friend_id)
+
+    def list(self, request, *args, **kwargs):
+        friend_id = request.query_params.get('friend_id')
+        querysets = Message.objects.get_chat_history_parts(request.user, friend_id) if friend_id else [Message.objects.none()]
+
+        # Sent And Received Messages Are Paged Separately Along the Index, Then Merged
+        messages = self.paginator.paginate_querysets(querysets, request, view=self)
+        serializer = self.get_serializer(messages, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class MarkUserMessagesRead(APIView):
@@ -237,7 +273,10 @@ class MarkUserMessagesRead(APIView):
         message_sender_ids = request.data.getlist('message_sender_ids[]', [])
         if not message_sender_ids:
             return Response(data={'message_sender_ids': 'This field is required.'}, status=400)
-        Message.objects.filter(recipient=request.user, sender_id__in=message_sender_ids).update(unread=False)
+        with transaction.atomic():
+            Message.objects.filter(recipient=request.user, unread=True, sender_id__in=message_sender_ids).update(unread=False)
+            Conversation.objects.mark_read(request.user, message_sender_ids)
+            publish_event(request.user.id, 'messages_read', sender_ids=message_sender_ids)
 
         return Response(status=201)
 
@@ -257,11 +296,15 @@ class DeleteFriendChatHistory(DestroyAPIView):
         if not self.request.user.friends.filter(id=friend_id).exists():
             return Response(status=404)
 
-        # Set Deleted Flag For Sent Messages
-        Message.objects.filter(sender=self.request.user, recipient_id=friend_id).update(deleted_by_sender=True)
+        with transaction.atomic():
+            # Set Deleted Flag For Sent Messages
+            Message.objects.filter(sender=self.request.user, recipient_id=friend_id).update(deleted_by_sender=True)
 
-        # Set Deleted Flag For Received Messages
-        Message.objects.filter(sender_id=friend_id, recipient=self.request.user).update(deleted_by_recipient=True)
+            # Set Deleted Flag For Received Messages
+            Message.objects.filter(sender_id=friend_id, recipient=self.request.user).update(deleted_by_recipient=True)
+
+            Conversation.objects.delete_history(self.request.user, friend_id)
+            publish_event(self.request.user.id, 'chat_history_deleted', friend_id=int(friend_id))
 
         return Response(status=204)
 
@@ -281,11 +324,66 @@ class MarkUserNotificationsViewed(APIView):
         if not user_notification_ids:
             return Response(data={'user_notifications_viewed': 'This field is required.'}, status=400)
 
-        UserNotification.objects.filter(id__in=user_notification_ids).update(viewed=True)
+        with transaction.atomic():
+            viewed_count = UserNotification.objects.filter(user=request.user, id__in=user_notification_ids, viewed=False).update(viewed=True)
+            add_to_user_counters(request.user.id, unviewed_notification_count=-viewed_count)
+        publish_event(request.user.id, 'notifications_viewed', user_notification_ids=user_notification_ids)
 
         return Response(status=201)
 
 
+class UserEvents(APIView):
+    """
+    Long Polls For Events (New Messages, Friend Requests Etc.) of the User.
+    URL: <host>/api/v1/accounts/events/?version=<version of the last response>
+    Accepted Method: ["GET"]
+
+    Waits Upto EVENTS_LONG_POLL_SECONDS For Events After `version`, Without
+    Querying the Database While Waiting. Without `version` the Current
+    Version Is Returned At Once. `events` Is null When the Client Missed
+    Events And Should Reload Its Counts.
+    """
+
+    permission_classes = [IsAuthenticated, ]
+
+    def get(self, request, *args, **kwargs):
+        try:
+            since_version = int(request.query_params['version'])
+        except KeyError:
+            since_version = None
+        except ValueError:
+            return Response(data={'version': 'A valid integer is required.'}, status=400)
+
+        if since_version is None:
+            return Response({'version': get_event_version(request.user.id), 'events': []})
+
+        # The Wait Can Be Long, Free the Database Connection For It
+        if not connection.in_atomic_block:
+            connection.close()
+
+        version, events = wait_for_events(request.user.id, since_version, settings.EVENTS_LONG_POLL_SECONDS)
+        return Response({'version': version, 'events': events})
+
+
+class ProcessMetrics(APIView):
+    """
+    Returns the Metrics of the Process Serving the Request (Each Worker Has
+    Its Own): the Password Hashing Queue Depth And Latency Percentiles, And
+    the Mail Render Time Percentiles.
+    URL: <host>/api/v1/accounts/metrics/
+    Accepted Method: ["GET"]
+    """
+
+    permission_classes = [IsAdminUser, ]
+
+    def get(self, request, *args, **kwargs):
+        return Response({
+            'pid': os.getpid(),
+            'password_hashing': PASSWORD_HASHING_POOL.get_metrics(),
+            'mail_rendering': MAIL_RENDERER.get_metrics(),
+        })
+
+
 class ForgotPassword(CreateAPIView):
     """
     Forgot Password
@@ -344,7 +442,9 @@ class UserWallPostCreateDestroyViewSet(CreateDestroyViewSet):
         to_user = user_wall_post.owner
         from_user = request.user
 
-        UserNotification.create_post_friend_liked_notification(from_user, to_user, 'Right', id=pk)
+        with transaction.atomic():
+            UserNotification.create_post_friend_liked_notification(from_user, to_user, 'Right', id=pk)
+            add_to_user_counters(to_user.id, unviewed_notification_count=1)
         return Response(status=201)
 
     @detail_route(methods=['post'])
@@ -377,7 +477,9 @@ class UserWallPostCreateDestroyViewSet(CreateDestroyViewSet):
 
         to_user = user_wall_post.owner
         from_user = request.user
-        UserNotification.create_post_friend_comment_notification(from_user, to_user, 'Right', id=pk)
+        with transaction.atomic():
+            UserNotification.create_post_friend_comment_notification(from_user, to_user, 'Right', id=pk)
+            add_to_user_counters(to_user.id, unviewed_notification_count=1)
         return Response(data=post_comment_serializer.data, status=201)
 
 
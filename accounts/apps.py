@@ -0,0 +1,22 @@
+# Python Imports
+
+# Django Imports
+from django.apps import AppConfig
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+class AccountsConfig(AppConfig):
+    name = 'accounts'
+
+    def ready(self):
+        # Connect the Signals That Invalidate Cached Users And Maintain User Stats
+        from . import stats, user_cache  # noqa
+
+        # Refuse to Start If Events Would Not Reach Other Processes
+        from .events import check_events_cache
+        check_events_cache()
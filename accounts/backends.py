@@ -1,4 +1,5 @@
 # Python Imports
+import re
 
 # Django Imports
 from django.contrib.auth import get_user_model
@@ -8,36 +9,33 @@ from django.contrib.auth import get_user_model
 # Inter App Imports
 
 # Local Imports
+from .user_cache import get_user_by_id
+
+
+MOBILE_REGEX = re.compile(r'^[6-9][0-9]{9}$')  # Indian Mobile Nos. Are 10 Digits, Starting With 6-9
 
 
 class EmailAuthenticationBackend(object):
     """
-    This Authentication Backend Authenticates a User Against an Email.
+    This Authentication Backend Only Loads Users For Sessions Logged In
+    Through It, Before IdentifierAuthenticationBackend (Which Also Authenticates
+    Emails) Replaced It. It Authenticates No One, Otherwise Every Failed Login
+    Would Fall Through to It For Another Query And Password Hash.
     """
 
     def authenticate(self, username=None, password=None):
         """
-        Authenticate Using the Email/password And Return a User
+        Emails Are Authenticated By IdentifierAuthenticationBackend
         """
 
-        UserModel = get_user_model()
-        try:
-            user = UserModel._default_manager.get_by_natural_key(username)
-            if user.check_password(password):
-                return user
-        except UserModel.DoesNotExist:
-            return None
+        return None
 
     def get_user(self, user_id):
         """
         Returns a User Against a Given User Id
         """
 
-        UserModel = get_user_model()
-        try:
-            return UserModel.objects.get(pk=user_id)
-        except UserModel.DoesNotExist:
-            return None
+        return get_user_by_id(user_id)
 
 
 class MobileAuthenticationBackend(object):
@@ -65,11 +63,7 @@ class MobileAuthenticationBackend(object):
         Returns a User Against a Given User Id
         """
 
-        UserModel = get_user_model()
-        try:
-            return UserModel.objects.get(pk=user_id)
-        except UserModel.DoesNotExist:
-            return None
+        return get_user_by_id(user_id)
 
 
 class SocialProfileIdAuthenticationBackend(object):
@@ -95,8 +89,58 @@ class SocialProfileIdAuthenticationBackend(object):
         Returns a User Against a Given User Id
         """
 
+        return get_user_by_id(user_id)
+
+
+class IdentifierAuthenticationBackend(object):
+    """
+    This Authentication Backend Authenticates a User Against an Email, a
+    Mobile No. Or a Social Id, Whichever the Username Looks Like, With a
+    Single Query On an Indexed Column.
+    """
+
+    def get_identifier_lookup(self, username):
+        """
+        Returns the User Field Lookup For the Username
+
+        Facebook And Google Ids Are 15 Digits Or Longer, So Only a Username
+        In the Exact Mobile No. Format Is Looked Up As a Mobile No.
+        """
+        if '@' in username:
+            return {'email': username}
+        if MOBILE_REGEX.match(username):
+            return {'mobile': username}
+        return {'social_profile_id': username}
+
+    def authenticate(self, username=None, password=None):
+        """
+        Authenticate Using the Email/Mobile/Social Id And Password And Return a User
+        """
+
         UserModel = get_user_model()
-        try:
-            return UserModel.objects.get(pk=user_id)
-        except UserModel.DoesNotExist:
+        if not username:
+            return None
+
+        # Mobile Nos. Are Not Unique, a No. Shared By Several Users Cannot Log In
+        users = list(UserModel._default_manager.filter(**self.get_identifier_lookup(username))[:2])
+        if len(users) != 1:
+            # Hash the Password Anyway, So Unknown Usernames Take As Long As Wrong Passwords
+            UserModel().set_password(password)
             return None
+
+        user = users[0]
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+
+    def user_can_authenticate(self, user):
+        """
+        Rejects Inactive Users, Like Django's ModelBackend
+        """
+        return getattr(user, 'is_active', True)
+
+    def get_user(self, user_id):
+        """
+        Returns a User Against a Given User Id
+        """
+
+        return get_user_by_id(user_id)
@@ -7,7 +7,7 @@
 # Inter App Imports
 
 # Local Imports
-from .models import FriendRequest, Message, UserNotification
+from .counters import get_user_counters
 
 
 def header_context(request):
@@ -19,19 +19,15 @@ def header_context(request):
 
     friends = list(request.user.friends.all())
 
-    friend_requests_notification_count = FriendRequest.objects.filter(to_user=request.user, accepted=False, viewed=False).count()
-
-    messages_notification_count = Message.objects.filter(recipient=request.user, unread=True, deleted_by_recipient=False).values_list('sender', flat=True).distinct().count()
-
-    user_notifications_count = UserNotification.objects.filter(user=request.user, viewed=False).count()
+    user_counters = get_user_counters(request.user.id)
 
     return {
         'latest_friend_requests': request.user.get_latest_friend_requests(),
-        'friend_requests_notification_count': friend_requests_notification_count,
+        'friend_requests_notification_count': user_counters['unviewed_friend_request_count'],
         'latest_received_messages': request.user.get_latest_received_messages(),
-        'messages_notification_count': messages_notification_count,
+        'messages_notification_count': user_counters['unread_message_sender_count'],
         'latest_user_notifications': request.user.get_latest_user_notifications(),
-        'user_notifications_count': user_notifications_count,
+        'user_notifications_count': user_counters['unviewed_notification_count'],
         'friend_suggestions': request.user.get_friend_suggestions(),
         'team_follow_suggestions': request.user.get_team_follow_suggestions(),
         'friends': friends,
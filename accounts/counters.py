@@ -0,0 +1,143 @@
+"""
+User Counters
+
+The Header Counts (Senders With Unread Messages, Unviewed Friend Requests,
+Unviewed Notifications) Are Kept in a UserCounters Row Per User, Moved in the
+Same Transaction As the Change, And Cached For USER_COUNTERS_CACHE_TTL Under a
+Versioned Key. Every Committed Change Moves the User to the Next Version.
+
+`reconcile_user_counters` Recounts the Rows, Repairing Drift From Changes
+Made Elsewhere (E.g. QuerySet.update).
+"""
+
+# Python Imports
+
+# Django Imports
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+COUNTER_FIELDS = ('unread_message_sender_count', 'unviewed_friend_request_count', 'unviewed_notification_count')
+
+
+def get_version_key(user_id):
+    return 'accounts.user_counters.{}.version'.format(user_id)
+
+
+def get_cache_key(user_id, version):
+    return 'accounts.user_counters.{}.{}'.format(user_id, version)
+
+
+def clear_cached_user_counters(user_id):
+    """
+    Moves the User to the Next Cache Version Once the Transaction Commits. A
+    Reader That Loaded the Counters Before the Commit Caches Them Under the
+    Old Version, Which Is No Longer Read.
+    """
+    def move_to_next_version():
+        try:
+            cache.incr(get_version_key(user_id))
+        except ValueError:  # No Version Yet, Or Evicted
+            cache.add(get_version_key(user_id), 1, timeout=None)
+    transaction.on_commit(move_to_next_version)
+
+
+def get_counted_model(model_name):
+    """
+    Returns the Accounts Model, Or None If It Is Not Installed (FriendRequest
+    And UserNotification Are Commented Out For Now), Which Counts as 0
+    """
+    try:
+        return apps.get_model('accounts', model_name)
+    except LookupError:
+        return None
+
+
+def count_user_counters(user_id):
+    """
+    Returns the Counters Counted From the Message, FriendRequest And UserNotification Tables
+    """
+    Message = apps.get_model('accounts', 'Message')
+    FriendRequest = get_counted_model('FriendRequest')
+    UserNotification = get_counted_model('UserNotification')
+
+    return {
+        'unread_message_sender_count': Message.objects.get_unread_sender_ids(user_id).count(),
+        'unviewed_friend_request_count': FriendRequest.objects.filter(to_user_id=user_id, accepted=False, viewed=False).count() if FriendRequest else 0,
+        'unviewed_notification_count': UserNotification.objects.filter(user_id=user_id, viewed=False).count() if UserNotification else 0,
+    }
+
+
+def reconcile_user_counters(user_id):
+    """
+    Recounts the User's Counters. Returns True If They Had Drifted.
+    """
+    UserCounters = apps.get_model('accounts', 'UserCounters')
+
+    counters = count_user_counters(user_id)
+    user_counters, created = UserCounters.objects.get_or_create(user_id=user_id, defaults=dict(counters, reconciled_on=timezone.now()))
+    drifted = not created and any(getattr(user_counters, field) != counters[field] for field in COUNTER_FIELDS)
+    if not created:
+        UserCounters.objects.filter(user_id=user_id).update(reconciled_on=timezone.now(), **counters)
+    clear_cached_user_counters(user_id)
+    return drifted
+
+
+def add_to_user_counters(user_id, **changes):
+    """
+    Adds the Changes to the User's Counters, E.g. unviewed_notification_count=1
+    """
+    UserCounters = apps.get_model('accounts', 'UserCounters')
+
+    changes = {field: change for field, change in changes.items() if change}
+    if not changes:
+        return
+
+    if not UserCounters.objects.filter(user_id=user_id).update(**{field: F(field) + change for field, change in changes.items()}):
+        reconcile_user_counters(user_id)  # No Row Yet, Counting Also Includes This Change
+        return
+    clear_cached_user_counters(user_id)
+
+
+def remove_friend_request_from_counters(friend_request, with_reverse_requests=False):
+    """
+    Takes a Friend Request About to Be Accepted Or Deleted, And Optionally the
+    Reverse Requests Deleted With It, Off the Unviewed Counts. Call It Before
+    the Change, in the Same Transaction.
+    """
+    FriendRequest = apps.get_model('accounts', 'FriendRequest')
+
+    if not friend_request.accepted and not friend_request.viewed:
+        add_to_user_counters(friend_request.to_user_id, unviewed_friend_request_count=-1)
+    if with_reverse_requests:
+        reverse_count = FriendRequest.objects.filter(from_user_id=friend_request.to_user_id, to_user_id=friend_request.from_user_id, accepted=False, viewed=False).count()
+        add_to_user_counters(friend_request.from_user_id, unviewed_friend_request_count=-reverse_count)
+
+
+def get_user_counters(user_id):
+    """
+    Returns {Counter Field: Count} of the User, From the Cache If Possible
+    """
+    UserCounters = apps.get_model('accounts', 'UserCounters')
+
+    cache_key = get_cache_key(user_id, cache.get(get_version_key(user_id), 0))
+    counters = cache.get(cache_key)
+    if counters is not None:
+        return counters
+
+    counters = UserCounters.objects.filter(user_id=user_id).values(*COUNTER_FIELDS).first()
+    if counters is None:
+        reconcile_user_counters(user_id)
+        counters = UserCounters.objects.filter(user_id=user_id).values(*COUNTER_FIELDS).first()
+    cache.set(cache_key, counters, settings.USER_COUNTERS_CACHE_TTL)
+    return counters
@@ -2,9 +2,8 @@
 import datetime
 
 # Django Imports
-from django.core.mail import send_mail
-from django.core.mail import EmailMessage
-from django.template.loader import render_to_string
+from django.conf import settings
+from django.core.management import call_command
 from django.utils import timezone
 from django.db.models import Q
 
@@ -12,10 +11,35 @@ from django.db.models import Q
 from django_cron import CronJobBase, Schedule
 
 # Inter App Imports
+from competition_mania.shared.utils import iter_queryset_chunks
 from cricket.models import Cricketer, CricketMatchBattingStat, CricketMatchBowlingStat, CricketMatchWicketKeepingStat
 
 # Local Imports
+from .mail_rendering import render_mail
+from .mailing import BatchMailer, build_html_mail
 from .models import User
+from .revocation import TOKEN_REVOCATION_STORE
+from .stats import rebuild_user_stats
+
+
+def get_cricketers_without_recent_stats(since):
+    """
+    Returns Cricketers Not Mailed Since `since` Who Have No Batting, Bowling Or
+    Wicket Keeping Stat in a Match Added Since Then.
+
+    The Exclusion Is Done By the Database With Subqueries, So No Ids Are
+    Loaded Into Python And the Query Size Does Not Grow With the Data.
+    """
+    recent_stats_filter = {'match_stat__match_date__gte': since, 'match_stat__match': None}
+    batsmen = CricketMatchBattingStat.objects.filter(batsman__isnull=False, **recent_stats_filter).values('batsman')  # NOT IN Matches Nothing If the Subquery Has a Null
+    bowlers = CricketMatchBowlingStat.objects.filter(bowler__isnull=False, **recent_stats_filter).values('bowler')
+    wicketkeepers = CricketMatchWicketKeepingStat.objects.filter(wicketkeeper__isnull=False, **recent_stats_filter).values('wicketkeeper')
+
+    return Cricketer.objects.filter(last_inactivity_mail__lte=since).exclude(Q(id__in=batsmen) | Q(id__in=bowlers) | Q(id__in=wicketkeepers))
+
+
+def get_recipients(mails):
+    return {recipient for mail in mails for recipient in mail.recipients()}
 
 
 class CompleteYourProfileReminder(CronJobBase):
@@ -27,15 +51,20 @@ class CompleteYourProfileReminder(CronJobBase):
     def do(self):
         inactivity_days = 30
         thirty_days = datetime.date.today()-datetime.timedelta(inactivity_days)
-        inactive_users = User.objects.filter(last_profile_complation_mail__lte=thirty_days, registration_midout=True)
+        inactive_users = User.objects.filter(last_profile_complation_mail__lte=thirty_days, registration_midout=True).only('id', 'email')
         subject = '[Important] Inactivity Notice'
-        body = render_to_string('accounts/mailers/profile_not_completed.html', context={})
-        for user in inactive_users:
-            recipient = [user.email]
+        body = render_mail('accounts/mailers/profile_not_completed.html', context={})
 
-            send_mail(subject=subject, message='', from_email='info@sportsvitae.com', recipient_list=recipient, fail_silently=True, html_message=body)
+        delivered_mails = []
+        with BatchMailer(delivered=delivered_mails.extend) as batch_mailer:
+            for users in iter_queryset_chunks(inactive_users, settings.CRON_REMINDER_CHUNK_SIZE):
+                batch_mailer.send(build_html_mail(subject=subject, html_message=body, from_email='info@sportsvitae.com', recipient_list=[user.email]) for user in users)
 
-        inactive_users.update(last_profile_complation_mail=timezone.now())
+                # Checkpoint: Mailed Users No Longer Match the Filter, So a Rerun After a Crash Resumes From Here
+                # Users Whose Mails Failed Are Left Unmarked, So the Next Run Mails Them Again
+                mailed_emails = get_recipients(delivered_mails)
+                del delivered_mails[:]
+                User.objects.filter(id__in=[user.id for user in users if user.email in mailed_emails]).update(last_profile_complation_mail=timezone.now())
 
 
 class AddMatchStatsReminder(CronJobBase):
@@ -48,21 +77,46 @@ class AddMatchStatsReminder(CronJobBase):
         inactivity_days = 10
         ten_days = datetime.date.today() - datetime.timedelta(inactivity_days)
 
-        batsmen = CricketMatchBattingStat.objects.filter(match_stat__match_date__gte=ten_days, match_stat__match=None).values_list('batsman', flat=True)
-        bowlers = CricketMatchBowlingStat.objects.filter(match_stat__match_date__gte=ten_days, match_stat__match=None).values_list('bowler', flat=True)
-        wicketkeepers = CricketMatchWicketKeepingStat.objects.filter(match_stat__match_date__gte=ten_days, match_stat__match=None).values_list('wicketkeeper', flat=True)
-
-        cricketer_ids = list(batsmen) + list(bowlers) + list(wicketkeepers)
-        cricketer_ids = set(cricketer_ids)
-
-        cricketers = Cricketer.objects.exclude(id__in=cricketer_ids).filter(last_inactivity_mail__lte=ten_days)
+        cricketers = get_cricketers_without_recent_stats(ten_days).select_related('user').only('id', 'user__email')
 
         # recipient_list = []
         subject = '[Important] Inactivity Notice'
-        body = render_to_string('accounts/mailers/inactivity_mail.html', context={})
-        for cricketer in cricketers:
-            recipient = [cricketer.user.email]
+        body = render_mail('accounts/mailers/inactivity_mail.html', context={})
+
+        delivered_mails = []
+        with BatchMailer(delivered=delivered_mails.extend) as batch_mailer:
+            for cricketer_chunk in iter_queryset_chunks(cricketers, settings.CRON_REMINDER_CHUNK_SIZE):
+                batch_mailer.send(build_html_mail(subject=subject, html_message=body, from_email='info@sportsvitae.com', recipient_list=[cricketer.user.email]) for cricketer in cricketer_chunk)
 
-            send_mail(subject=subject, message='', from_email='info@sportsvitae.com', recipient_list=recipient, fail_silently=True, html_message=body)
+                # Checkpoint: Mailed Cricketers No Longer Match the Filter, So a Rerun After a Crash Resumes From Here
+                # Cricketers Whose Mails Failed Are Left Unmarked, So the Next Run Mails Them Again
+                mailed_emails = get_recipients(delivered_mails)
+                del delivered_mails[:]
+                Cricketer.objects.filter(id__in=[cricketer.id for cricketer in cricketer_chunk if cricketer.user.email in mailed_emails]).update(last_inactivity_mail=timezone.now())
+
+
+class PruneRevokedTokens(CronJobBase):
+    RUN_AT_TIMES = ['03:00']
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'accounts.PruneRevokedTokens'
 
-        cricketers.update(last_inactivity_mail=timezone.now())
+    def do(self):
+        TOKEN_REVOCATION_STORE.prune()
+
+
+class RebuildUserStats(CronJobBase):
+    RUN_AT_TIMES = ['04:00']
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'accounts.RebuildUserStats'
+
+    def do(self):
+        rebuild_user_stats()
+
+
+class ReconcileUserCounters(CronJobBase):
+    RUN_AT_TIMES = ['04:30']
+    schedule = Schedule(run_at_times=RUN_AT_TIMES)
+    code = 'accounts.ReconcileUserCounters'
+
+    def do(self):
+        call_command('reconcile_user_counters')
@@ -0,0 +1,104 @@
+"""
+Digest Mails
+
+Notifications That Would Otherwise Go Out As One Mail Per Event (E.g. Every
+Completed Signup to care@) Are Added As Lines to a Digest. A Digest Is Sent As
+One Summary Mail Once Its Oldest Line Is MAIL_DIGEST_INTERVAL_SECONDS Old Or
+It Has MAIL_DIGEST_BUFFER_SIZE Lines, Whichever Comes First.
+
+Lines Are Stored in the DigestEvent Table in the Caller's Transaction, Like
+Outbox Mails, And Digests Are Flushed Into the Outbox By `send_queued_mails`.
+"""
+
+# Python Imports
+from datetime import timedelta
+
+# Django Imports
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min
+from django.utils import timezone
+from django.utils.html import escape
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from .outbox import queue_mail
+
+
+class MailDigest(object):
+
+    def __init__(self, name, subject, from_email, recipient_list):
+        self.name = name
+        self.subject = subject
+        self.from_email = from_email
+        self.recipient_list = recipient_list
+
+    def add(self, line):
+        DigestEvent = apps.get_model('accounts', 'DigestEvent')
+        return DigestEvent.objects.create(digest=self.name, line=line)
+
+    def get_body(self, lines):
+        return '{} new since the last digest:<br><br>{}'.format(len(lines), '<br>'.join(escape(line) for line in lines))
+
+    def flush(self):
+        """
+        Queues the Oldest Upto MAIL_DIGEST_BUFFER_SIZE Lines As One Mail.
+        Returns the Number of Lines Sent, 0 If Another Worker Took Them First.
+        """
+        DigestEvent = apps.get_model('accounts', 'DigestEvent')
+
+        with transaction.atomic():
+            events = list(DigestEvent.objects.filter(digest=self.name).order_by('id')[:settings.MAIL_DIGEST_BUFFER_SIZE])
+            if not events:
+                return 0
+
+            # Lines Are Claimed By Deleting Them, So Concurrent Flushes Never Send a Line Twice
+            deleted_count, deleted_per_model = DigestEvent.objects.filter(id__in=[event.id for event in events]).delete()
+            if deleted_count != len(events):
+                transaction.set_rollback(True)
+                return 0
+
+            queue_mail(subject=self.subject.format(count=len(events)), html_message=self.get_body([event.line for event in events]), from_email=self.from_email, recipient_list=self.recipient_list)
+            return len(events)
+
+
+NEW_USER_DIGEST = MailDigest(
+    name='new_users',
+    subject='[Important] {count} New Users Have Joined!',
+    from_email='root@sportsvitae.com',
+    recipient_list=['care@sportsvitae.com'],
+)
+
+DIGESTS = {digest.name: digest for digest in (NEW_USER_DIGEST,)}
+
+
+def flush_due_digests():
+    """
+    Flushes Every Digest Whose Oldest Line Is Due Or Whose Buffer Is Full.
+    Returns the Number of Lines Sent.
+    """
+    DigestEvent = apps.get_model('accounts', 'DigestEvent')
+
+    due_before = timezone.now() - timedelta(seconds=settings.MAIL_DIGEST_INTERVAL_SECONDS)
+    pending = DigestEvent.objects.values('digest').annotate(line_count=Count('id'), oldest_created_on=Min('created_on'))
+
+    sent_count = 0
+    for digest_pending in pending:
+        digest = DIGESTS.get(digest_pending['digest'])
+        if digest is None:
+            continue
+
+        # A Due Digest Is Sent Whole, Otherwise Only Full Buffers Go Out
+        line_count = digest_pending['line_count']
+        min_line_count = 1 if digest_pending['oldest_created_on'] <= due_before else settings.MAIL_DIGEST_BUFFER_SIZE
+        while line_count >= min_line_count:
+            flushed_count = digest.flush()
+            if not flushed_count:
+                break
+            line_count -= flushed_count
+            sent_count += flushed_count
+    return sent_count
@@ -0,0 +1,242 @@
+"""
+User Events
+
+Changes a User's Open Pages Should Show (New Messages, Friend Requests Etc.)
+Are Published As Small Events With a Per User Version. The Events Endpoint
+Long Polls the Broker For Events Newer Than the Version the Client Has: the
+Request Waits Upto EVENTS_LONG_POLL_SECONDS, Reading Only the Cache, Never
+the Database.
+
+The Broker Is Loaded From EVENTS_BROKER. CacheEventBroker Keeps Versions And
+Events in the Cache Named By EVENTS_CACHE_ALIAS, Which Must Be Shared By All
+Processes (E.g. Memcached), Or the Project Refuses to Start. Requests Waiting
+in the Publishing Process Are Woken At Once, Those in Other Processes Within
+EVENTS_WAIT_CHECK_SECONDS. LocalEventBroker Keeps Them in the Process, For
+Tests And Single Process Deployments.
+"""
+
+# Python Imports
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+class CacheEventBroker(object):
+    """
+    Keeps Each User's Version As a Cache Counter, And Each Event Under Its
+    Version For EVENTS_TIMEOUT Seconds. Clients More Than `buffer_size`
+    Events Behind Reload Instead.
+
+    Waiting Requests Recheck the Version Every `check_seconds`, And Are Woken
+    Earlier By Publishes From Their Own Process.
+    """
+
+    def __init__(self, cache_alias=None, buffer_size=None, timeout=None, check_seconds=None):
+        self.cache = caches[cache_alias or settings.EVENTS_CACHE_ALIAS]
+        self.buffer_size = buffer_size or settings.EVENTS_BUFFER_SIZE
+        self.timeout = timeout or settings.EVENTS_TIMEOUT
+        self.check_seconds = check_seconds or settings.EVENTS_WAIT_CHECK_SECONDS
+        self.lock = threading.Lock()
+        self.conditions = weakref.WeakValueDictionary()  # Only Users With Waiting Requests
+
+    def get_condition(self, user_id):
+        with self.lock:
+            condition = self.conditions.get(user_id)
+            if condition is None:
+                condition = self.conditions[user_id] = threading.Condition()
+            return condition
+
+    def notify(self, user_id):
+        with self.lock:
+            condition = self.conditions.get(user_id)
+        if condition is not None:
+            with condition:
+                condition.notify_all()
+
+    def get_version_key(self, user_id):
+        return 'accounts.events.{}.version'.format(user_id)
+
+    def get_event_key(self, user_id, version):
+        return 'accounts.events.{}.{}'.format(user_id, version)
+
+    def publish(self, user_id, event):
+        version_key = self.get_version_key(user_id)
+        self.cache.add(version_key, 0, timeout=None)
+        try:
+            version = self.cache.incr(version_key)
+        except ValueError:  # Evicted Since the add, Clients Reload On the Next Poll
+            return None
+        self.cache.set(self.get_event_key(user_id, version), event, self.timeout)
+        self.notify(user_id)
+        return version
+
+    def get_version(self, user_id):
+        return self.cache.get(self.get_version_key(user_id), 0)
+
+    def poll(self, user_id, since_version):
+        """
+        Returns:
+
+            (version, events After `since_version`), events Being None If the
+            Client Must Reload Instead
+        """
+        version = self.get_version(user_id)
+        if since_version > version or version - since_version > self.buffer_size:
+            return version, None
+
+        keys = [self.get_event_key(user_id, event_version) for event_version in range(since_version + 1, version + 1)]
+        events = self.cache.get_many(keys)
+        if len(events) != len(keys):
+            return version, None  # Expired Or Evicted
+        return version, [events[key] for key in keys]
+
+    def wait(self, user_id, since_version, timeout):
+        """
+        Waits Upto `timeout` Seconds For Events After `since_version`. Returns
+        the Same As poll().
+        """
+        deadline = time.monotonic() + timeout
+        condition = self.get_condition(user_id)  # Held Until the Wait Ends, So Publishes Can Find It
+        while self.get_version(user_id) == since_version:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with condition:
+                condition.wait(min(remaining, self.check_seconds))
+        return self.poll(user_id, since_version)
+
+
+class LocalEventBroker(object):
+    """
+    In Process Pub/Sub, For Tests And Single Process Deployments. Keeps the
+    Latest `buffer_size` Events of Upto `max_users` Users (Least Recently
+    Published Dropped First).
+    """
+
+    def __init__(self, buffer_size=None, max_users=None):
+        self.buffer_size = buffer_size or settings.EVENTS_BUFFER_SIZE
+        self.max_users = max_users or settings.EVENTS_MAX_USERS
+        self.lock = threading.Lock()
+        self.versions = OrderedDict()
+        self.events = {}
+        self.conditions = {}
+
+    def get_condition(self, user_id):
+        # One Condition Per User, So a Publish Only Wakes That User's Requests
+        condition = self.conditions.get(user_id)
+        if condition is None:
+            condition = self.conditions[user_id] = threading.Condition(self.lock)
+        return condition
+
+    def publish(self, user_id, event):
+        with self.lock:
+            version = self.versions.pop(user_id, 0) + 1
+            self.versions[user_id] = version
+            self.events.setdefault(user_id, deque(maxlen=self.buffer_size)).append((version, event))
+            self.get_condition(user_id).notify_all()
+
+            while len(self.versions) > self.max_users:
+                dropped_user_id, dropped_version = self.versions.popitem(last=False)
+                self.events.pop(dropped_user_id, None)
+                self.conditions.pop(dropped_user_id, None)  # Waiting Requests Still Hold It, And Time Out
+        return version
+
+    def get_version(self, user_id):
+        with self.lock:
+            return self.versions.get(user_id, 0)
+
+    def poll(self, user_id, since_version):
+        """
+        Returns:
+
+            (version, events After `since_version`), events Being None If Some
+            Were Already Dropped And the Client Must Reload Instead
+        """
+        with self.lock:
+            return self.get_events_since(user_id, since_version)
+
+    def get_events_since(self, user_id, since_version):
+        # Called With the Lock Held
+        version = self.versions.get(user_id, 0)
+        if since_version > version:
+            return version, None
+        events = [event for event_version, event in self.events.get(user_id, ()) if event_version > since_version]
+        if version - since_version > len(events):
+            return version, None
+        return version, events
+
+    def wait(self, user_id, since_version, timeout):
+        """
+        Waits Upto `timeout` Seconds For Events After `since_version`. Returns
+        the Same As poll().
+        """
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            condition = self.get_condition(user_id)
+            while self.versions.get(user_id, 0) == since_version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                condition.wait(remaining)
+            return self.get_events_since(user_id, since_version)
+
+
+PER_PROCESS_CACHE_BACKENDS = (
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.locmem.LocMemCache',
+)
+
+
+def check_events_cache():
+    """
+    Raises ImproperlyConfigured If the CacheEventBroker Is Used With a Cache
+    Each Process Keeps For Itself, Where Events Published By One Process Never
+    Reach Requests Waiting in Another.
+    """
+    if not issubclass(import_string(settings.EVENTS_BROKER), CacheEventBroker):
+        return
+
+    backend = settings.CACHES.get(settings.EVENTS_CACHE_ALIAS, {}).get('BACKEND')
+    if backend is None or backend in PER_PROCESS_CACHE_BACKENDS:
+        raise ImproperlyConfigured('EVENTS_CACHE_ALIAS must name a CACHES entry shared by all processes (e.g. memcached), {!r} is {}.'.format(settings.EVENTS_CACHE_ALIAS, backend or 'not configured'))
+
+
+EVENT_BROKERS = {}
+
+
+def get_event_broker():
+    # Built Once Per Broker Path, So Tests Can Swap It With override_settings
+    broker = EVENT_BROKERS.get(settings.EVENTS_BROKER)
+    if broker is None:
+        broker = EVENT_BROKERS[settings.EVENTS_BROKER] = import_string(settings.EVENTS_BROKER)()
+    return broker
+
+
+def publish_event(user_id, event_type, **data):
+    """
+    Publishes an Event to the User Once the Current Transaction Commits
+    """
+    event = dict(data, type=event_type)
+    transaction.on_commit(lambda: get_event_broker().publish(user_id, event))
+
+
+def get_event_version(user_id):
+    return get_event_broker().get_version(user_id)
+
+
+def wait_for_events(user_id, since_version, timeout):
+    return get_event_broker().wait(user_id, since_version, timeout)
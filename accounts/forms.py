@@ -8,14 +8,20 @@ from django.contrib.admin.widgets import AdminDateWidget
 # Third Party Django Imports
 
 # Inter App Imports
-from lookup.choices import REGISTRATION_SOURCE_MAPPING, STATE_TO_CITY_IDS
+from competition_mania.shared.utils import PhaseTimer
+from lookup.choices import REGISTRATION_SOURCE_MAPPING
+from lookup.validators import is_city_in_state
 
 # Local Imports
+from .hashing import PasswordHashingBusy, make_password
 from .models import User
 from .validators import validate_full_name
 from .utils import get_first_and_last_name
 
 
+HASHING_BUSY_MESSAGE = 'We are receiving too many requests right now. Please try again in a moment.'
+
+
 class LoginForm(forms.Form):
     """
     Login Form
@@ -24,19 +30,30 @@ class LoginForm(forms.Form):
     email = forms.EmailField(max_length=255, widget=forms.TextInput(attrs={'placeholder': 'Email ID'}))
     password = forms.CharField(widget=forms.PasswordInput(attrs={'placeholder': 'Password'}))
 
+    def __init__(self, *args, **kwargs):
+        self.timer = kwargs.pop('timer', None) or PhaseTimer()
+        super(LoginForm, self).__init__(*args, **kwargs)
+
     def clean_email(self):
-        email = self.cleaned_data['email'].lower()
-        if not User.objects.filter(email=email).exists():
-            raise forms.ValidationError('This email is not registered with us.')
-        return email
+        return self.cleaned_data['email'].lower()
 
     def clean(self):
-        # import ipdb; ipdb.set_trace()
         cleaned_data = super(LoginForm, self).clean()
-        if not self._errors:
-            self.user = authenticate(username=cleaned_data['email'], password=cleaned_data['password'])
-            if not self.user:
+        if self._errors:
+            return cleaned_data
+
+        try:
+            with self.timer.phase('authenticate'):
+                self.user = authenticate(username=cleaned_data['email'], password=cleaned_data['password'])
+        except PasswordHashingBusy:
+            raise forms.ValidationError(HASHING_BUSY_MESSAGE)
+
+        if not self.user:
+            # Only Failed Logins Look Up Which Message to Show
+            if User.objects.filter(email=cleaned_data['email']).exists():
                 self._errors['email'] = self.error_class(['EMAIL ID and Password do not match'])
+            else:
+                self._errors['email'] = self.error_class(['This email is not registered with us.'])
         return cleaned_data
 
     def get_authenticated_user(self):
@@ -64,11 +81,20 @@ class UserRegistrationForm(forms.ModelForm):
             raise forms.ValidationError('Email id already exists')
         return self.cleaned_data.get('email', '').lower()
 
+    def clean(self):
+        cleaned_data = super(UserRegistrationForm, self).clean()
+        if not self._errors:
+            try:
+                self.password_hash = make_password('IGotThePower')
+            except PasswordHashingBusy:
+                raise forms.ValidationError(HASHING_BUSY_MESSAGE)
+        return cleaned_data
+
     def save(self, commit=True):
         user = super(UserRegistrationForm, self).save(commit=False)
         user.first_name = self.cleaned_data.get('first_name', None)
         user.last_name = self.cleaned_data.get('last_name', None)
-        user.set_password('IGotThePower')
+        user.password = self.password_hash  # Hashed While Cleaning
         if commit:
             user.save()
         return user
@@ -105,7 +131,7 @@ class UserProfileFormMixin(forms.ModelForm):
         if self.cleaned_data.get('country') == 'IN':
             if not self.cleaned_data.get('city'):
                 self._errors['city'] = self.error_class(["Please choose a value for city"])
-            if self.cleaned_data['city'] and self.cleaned_data['city'] not in STATE_TO_CITY_IDS[self.cleaned_data['state']]:
+            if self.cleaned_data['city'] and not is_city_in_state(self.cleaned_data['city'], self.cleaned_data['state']):
                 self._errors['city'] = self.error_class(["Please choose a correct city value"])
         elif not self.cleaned_data.get('city_text'):
             self._errors['city_text'] = self.error_class(["Please enter a value for city"])
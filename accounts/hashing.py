@@ -0,0 +1,139 @@
+# Python Imports
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Django Imports
+from django.conf import settings
+from django.contrib.auth import hashers
+
+# Third Party Django Imports
+
+# Inter App Imports
+from competition_mania.shared.utils import get_percentiles
+
+# Local Imports
+
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHashingBusy(Exception):
+    """
+    Raised When the Hashing Queue Stays Full For PASSWORD_HASHING_QUEUE_TIMEOUT
+    """
+
+
+class PasswordHashingPool(object):
+    """
+    Runs Password Hashing (PBKDF2 Etc.) in a Pool of PASSWORD_HASHING_POOL_SIZE
+    Processes, So a Signup Or Login Spike Does Not Tie Up the Request Threads
+    Of Every Worker On Cpu Bound Work.
+
+    At Most PASSWORD_HASHING_QUEUE_SIZE Hashes Are Queued Or Running Per
+    Process. Callers Beyond That Wait Upto PASSWORD_HASHING_QUEUE_TIMEOUT
+    Seconds For a Slot, Then PasswordHashingBusy Is Raised (Backpressure).
+    A Pool Size of 0 Hashes On the Calling Thread.
+    """
+
+    def __init__(self, pool_size, queue_size, queue_timeout, latency_sample_size=1000):
+        self.pool_size = pool_size
+        self.queue_timeout = queue_timeout
+        self.queue_slots = threading.BoundedSemaphore(queue_size)
+        self.executor = None
+        self.executor_pid = None
+        self.lock = threading.Lock()
+
+        # Metrics
+        self.queue_depth = 0
+        self.hash_count = 0
+        self.rejected_count = 0
+        self.latencies = deque(maxlen=latency_sample_size)
+
+    def get_executor(self):
+        # Created On First Use in Each Process, Never Inherited Across a Fork
+        with self.lock:
+            if self.executor is None or self.executor_pid != os.getpid():
+                self.executor = ProcessPoolExecutor(max_workers=self.pool_size)
+                self.executor_pid = os.getpid()
+            return self.executor
+
+    def run(self, function, *args):
+        if not self.queue_slots.acquire(timeout=self.queue_timeout):
+            with self.lock:
+                self.rejected_count += 1
+            logger.warning('Password hashing queue is full, rejecting request.')
+            raise PasswordHashingBusy()
+
+        with self.lock:
+            self.queue_depth += 1
+        start = time.perf_counter()
+        try:
+            if not self.pool_size:
+                return function(*args)
+            return self.get_executor().submit(function, *args).result()
+        finally:
+            latency = time.perf_counter() - start
+            with self.lock:
+                self.queue_depth -= 1
+                self.hash_count += 1
+                self.latencies.append(latency)
+            self.queue_slots.release()
+
+    def make_password(self, raw_password):
+        return self.run(hashers.make_password, raw_password)
+
+    def check_password(self, raw_password, encoded_password, setter=None):
+        """
+        Checks the Password in the Pool. Django Decides Whether the Stored Hash
+        Needs an Upgrade; the Setter Is Then Called Here, in the Request Process.
+        """
+        is_correct, must_update = self.run(check_password_in_worker, raw_password, encoded_password)
+        if must_update and setter:
+            setter(raw_password)
+        return is_correct
+
+    def get_metrics(self):
+        """
+        Returns Queue Depth, Counts And Hash Latency Percentiles (In Seconds)
+        Over the Latest Hashes of This Process.
+        """
+        with self.lock:
+            latencies = list(self.latencies)
+            metrics = {
+                'queue_depth': self.queue_depth,
+                'hash_count': self.hash_count,
+                'rejected_count': self.rejected_count,
+            }
+
+        for key, latency in get_percentiles(latencies).items():
+            metrics['latency_{}'.format(key)] = latency
+        return metrics
+
+
+def check_password_in_worker(raw_password, encoded_password):
+    """
+    Returns Whether the Password Is Correct, And Whether Django Would Upgrade
+    the Stored Hash. Module Level, So the Pool Can Pickle It.
+    """
+    updates = []
+    is_correct = hashers.check_password(raw_password, encoded_password, setter=updates.append)
+    return is_correct, bool(updates)
+
+
+PASSWORD_HASHING_POOL = PasswordHashingPool(
+    pool_size=settings.PASSWORD_HASHING_POOL_SIZE,
+    queue_size=settings.PASSWORD_HASHING_QUEUE_SIZE,
+    queue_timeout=settings.PASSWORD_HASHING_QUEUE_TIMEOUT,
+)
+
+
+def make_password(raw_password):
+    return PASSWORD_HASHING_POOL.make_password(raw_password)
+
+
+def check_password(raw_password, encoded_password, setter=None):
+    return PASSWORD_HASHING_POOL.check_password(raw_password, encoded_password, setter)
@@ -0,0 +1,95 @@
+# Python Imports
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+# Django Imports
+from django.conf import settings
+from django.template.loader import get_template
+
+# Third Party Django Imports
+
+# Inter App Imports
+from competition_mania.shared.utils import get_percentiles
+
+# Local Imports
+
+
+class MailRenderer(object):
+    """
+    Renders Mailer Templates, Each Compiled Once Per Process Instead of Being
+    Loaded And Parsed By render_to_string On Every Mail.
+
+    render_many() Renders a Campaign's Mails in a Pool of MAIL_RENDER_POOL_SIZE
+    Processes. Render Times Are Kept For Percentiles in get_metrics().
+    """
+
+    def __init__(self, pool_size, render_time_sample_size=10000):
+        self.pool_size = pool_size
+        self.templates = {}
+        self.lock = threading.Lock()
+        self.render_times = deque(maxlen=render_time_sample_size)
+
+    def get_template(self, template_name):
+        template = self.templates.get(template_name)
+        if template is None:
+            template = self.templates[template_name] = get_template(template_name)
+        return template
+
+    def render_timed(self, template_name, context):
+        """
+        Returns (Rendered Template, Seconds Taken)
+        """
+        start = time.perf_counter()
+        rendered = self.get_template(template_name).render(context)
+        return rendered, time.perf_counter() - start
+
+    def record_render_times(self, render_times):
+        with self.lock:
+            self.render_times.extend(render_times)
+
+    def render(self, template_name, context):
+        rendered, seconds = self.render_timed(template_name, context)
+        self.record_render_times([seconds])
+        return rendered
+
+    def render_many(self, template_name, contexts, chunk_size=100):
+        """
+        Renders the Template For Each Context, in Order. Contexts Must Be
+        Picklable When the Pool Is Used.
+        """
+        contexts = list(contexts)
+        if self.pool_size <= 1 or len(contexts) <= chunk_size:
+            results = [self.render_timed(template_name, context) for context in contexts]
+        else:
+            with ProcessPoolExecutor(max_workers=self.pool_size) as executor:
+                results = list(executor.map(render_in_worker, [template_name] * len(contexts), contexts, chunksize=chunk_size))
+
+        self.record_render_times([seconds for rendered, seconds in results])
+        return [rendered for rendered, seconds in results]
+
+    def get_metrics(self):
+        """
+        Returns the Render Count And Render Time Percentiles (In Seconds) Over
+        the Latest Renders of This Process.
+        """
+        with self.lock:
+            render_times = list(self.render_times)
+
+        metrics = {'render_count': len(render_times)}
+        for key, render_time in get_percentiles(render_times).items():
+            metrics['render_time_{}'.format(key)] = render_time
+        return metrics
+
+
+MAIL_RENDERER = MailRenderer(pool_size=settings.MAIL_RENDER_POOL_SIZE)
+
+
+def render_in_worker(template_name, context):
+    # Runs in a Pool Process, Which Compiles Each Template Once in Its Own MAIL_RENDERER
+    return MAIL_RENDERER.render_timed(template_name, context)
+
+
+def render_mail(template_name, context):
+    return MAIL_RENDERER.render(template_name, context)
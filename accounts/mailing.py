@@ -0,0 +1,185 @@
+# Python Imports
+import logging
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+# Django Imports
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+logger = logging.getLogger(__name__)
+
+
+def build_html_mail(subject, html_message, from_email, recipient_list):
+    """
+    Same Mail As send_mail(message='', html_message=...) Builds
+    """
+    mail = EmailMultiAlternatives(subject=subject, body='', from_email=from_email, to=recipient_list)
+    mail.attach_alternative(html_message, 'text/html')
+    return mail
+
+
+def iter_chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def is_transient_error(error):
+    """
+    Dropped Connections, Timeouts And 4xx Replies Are Worth a Retry. Refused
+    Recipients And 5xx Replies Are Not.
+    """
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return True
+
+
+class BatchMailer(object):
+    """
+    Sends Many Mails Over a Few Long Lived Connections Instead of Opening One
+    Connection Per Mail.
+
+    Mails Are Sent in Chunks of `chunk_size`, With `connection_count`
+    Connections Sending Chunks in Parallel. A Mail Whose Recipients Are Refused
+    Is Counted As Failed And the Chunk Goes On. On a Transient Error the Mails
+    Not Yet Delivered Are Retried On a Fresh Connection, Upto `retries` Times
+    Per Chunk, Then Counted As Failed. After Every Chunk `delivered(mails)` Is
+    Called With the Chunk's Delivered Mails, And `progress(sent_count,
+    failed_count)` With the Counts So Far. With Several Connections They Are
+    Called From the Sending Threads.
+    """
+
+    def __init__(self, chunk_size=None, connection_count=None, retries=None, progress=None, delivered=None):
+        self.chunk_size = chunk_size or settings.MAIL_BATCH_CHUNK_SIZE
+        self.connection_count = connection_count or settings.MAIL_BATCH_CONNECTION_COUNT
+        self.retries = settings.MAIL_BATCH_RETRIES if retries is None else retries
+        self.progress = progress
+        self.delivered = delivered
+        self.local = threading.local()
+        self.connections = []
+        self.lock = threading.Lock()
+        self.sent_count = 0
+        self.failed_count = 0
+        self.keep_open = False
+        self.executor = None
+
+    def get_connection(self):
+        # One Connection Per Sending Thread, Opened Once And Reused For Every Chunk
+        if getattr(self.local, 'connection', None) is None:
+            self.local.connection = get_connection(fail_silently=False)
+            self.local.connection.open()
+            with self.lock:
+                self.connections.append(self.local.connection)
+        return self.local.connection
+
+    def reset_connection(self):
+        connection = getattr(self.local, 'connection', None)
+        self.local.connection = None
+        if connection is not None:
+            try:
+                connection.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+
+    def send_chunk(self, chunk):
+        delivered_mails = []
+        retries_left = self.retries
+        index = 0
+        while index < len(chunk):
+            try:
+                # One Mail Per Call, So a Failure Shows Which Mails Were Already Delivered
+                mail_sent_count = self.get_connection().send_messages(chunk[index:index + 1]) or 0
+            except (smtplib.SMTPException, OSError) as error:
+                if not is_transient_error(error):
+                    logger.warning('Sending a mail to %s failed: %r', ', '.join(chunk[index].recipients()), error)
+                    index += 1
+                    continue
+
+                self.reset_connection()
+                if not retries_left:
+                    logger.warning('Sending %s mails of a chunk failed after %s retries: %r', len(chunk) - index, self.retries, error)
+                    break
+                retries_left -= 1
+                continue
+
+            if mail_sent_count:
+                delivered_mails.append(chunk[index])
+            index += 1
+
+        with self.lock:
+            self.sent_count += len(delivered_mails)
+            self.failed_count += len(chunk) - len(delivered_mails)
+            sent_total, failed_total = self.sent_count, self.failed_count
+
+        logger.info('Sent %s mails, %s failed so far.', sent_total, failed_total)
+        if self.delivered:
+            self.delivered(delivered_mails)
+        if self.progress:
+            self.progress(sent_total, failed_total)
+
+    def __enter__(self):
+        # Inside a With Block Connections Stay Open Across send() Calls
+        self.keep_open = True
+        return self
+
+    def __exit__(self, *exc_info):
+        self.keep_open = False
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+        for connection in self.connections:
+            try:
+                connection.close()
+            except (smtplib.SMTPException, OSError):
+                pass
+        self.connections = []
+        self.local = threading.local()
+
+    def send(self, mails):
+        """
+        Sends an Iterable of EmailMessages, Which Is Consumed One Chunk At a Time.
+
+        Returns:
+
+            (sent_count, failed_count) So Far
+        """
+        try:
+            if self.connection_count > 1:
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(max_workers=self.connection_count)
+
+                # Only a Few Chunks Are Built Ahead of the Connections Sending Them
+                pending = []
+                for chunk in iter_chunks(mails, self.chunk_size):
+                    pending.append(self.executor.submit(self.send_chunk, chunk))
+                    if len(pending) >= 2 * self.connection_count:
+                        pending.pop(0).result()
+                for future in pending:
+                    future.result()
+            else:
+                for chunk in iter_chunks(mails, self.chunk_size):
+                    self.send_chunk(chunk)
+        finally:
+            if not self.keep_open:
+                self.close()
+
+        return self.sent_count, self.failed_count
@@ -0,0 +1,99 @@
+# Python Imports
+import datetime
+import time
+import tracemalloc
+
+# Django Imports
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connection
+from django.db.models import Max
+
+# Third Party Django Imports
+
+# Inter App Imports
+from cricket.models import Cricketer, CricketMatchStat, CricketMatchBattingStat, CricketMatchBowlingStat, CricketMatchWicketKeepingStat
+
+# Local Imports
+from ...cron import get_cricketers_without_recent_stats
+from ...models import User
+
+
+def get_cricketers_without_recent_stats_in_python(since):
+    """
+    The Exclusion As AddMatchStatsReminder Did It Before, With Ids Collected in Python
+    """
+    batsmen = CricketMatchBattingStat.objects.filter(match_stat__match_date__gte=since, match_stat__match=None).values_list('batsman', flat=True)
+    bowlers = CricketMatchBowlingStat.objects.filter(match_stat__match_date__gte=since, match_stat__match=None).values_list('bowler', flat=True)
+    wicketkeepers = CricketMatchWicketKeepingStat.objects.filter(match_stat__match_date__gte=since, match_stat__match=None).values_list('wicketkeeper', flat=True)
+    cricketer_ids = set(list(batsmen) + list(bowlers) + list(wicketkeepers))
+    return Cricketer.objects.exclude(id__in=cricketer_ids).filter(last_inactivity_mail__lte=since)
+
+
+def measure(get_cricketers, since):
+    """
+    Returns (Matching Count, Seconds, Peak Python Memory in Bytes), Or None If the Query Fails
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        count = get_cricketers(since).count()
+    except DatabaseError:  # E.g. Sqlite's 'too many SQL variables'
+        return None
+    finally:
+        seconds = time.perf_counter() - start
+        current_memory, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, seconds, peak_memory
+
+
+class Command(BaseCommand):
+    help = 'Compares the AddMatchStatsReminder exclusion in Python and in SQL over growing seeded data, in a throwaway test database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', default='1000,10000,50000', help='Comma separated numbers of active cricketers to seed.')
+        parser.add_argument('--inactive', type=int, default=1000, help='Number of inactive cricketers to seed.')
+
+    def seed_cricketers(self, start, count, match_stat=None):
+        # Ids Are Not Set By bulk_create On Every Database, the New Rows Are Those After the Last Id
+        last_user_id = User.objects.aggregate(last_user_id=Max('id'))['last_user_id'] or 0
+        User.objects.bulk_create([User(email='benchmark{}@test.com'.format(index), first_name='Jon', last_name='Snow') for index in range(start, start + count)])
+        users = User.objects.filter(id__gt=last_user_id).only('id')
+
+        cricketers = [Cricketer(user=user, role='BM', batsman_handling='R', batting_position='TO') for user in users]
+        Cricketer.objects.bulk_create(cricketers)
+        if match_stat is None:
+            return
+
+        cricketer_ids = Cricketer.objects.filter(user_id__gt=last_user_id).values_list('id', flat=True)
+        CricketMatchBattingStat.objects.bulk_create([
+            CricketMatchBattingStat(match_stat=match_stat, batsman_id=cricketer_id, batting_position_number=1, dismissal_method='B', dismissal_by='Dinda', runs=123, balls_played=66, fours=4, sixes=7)
+            for cricketer_id in cricketer_ids
+        ])
+
+    def handle(self, *args, **options):
+        sizes = sorted(int(size) for size in options['sizes'].split(','))
+        since = datetime.date.today() - datetime.timedelta(10)
+        last_mail_date = datetime.date.today() - datetime.timedelta(30)
+
+        # Seeded Data Goes to a Test Database That Is Destroyed Afterwards
+        database_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            match_stat = CricketMatchStat.objects.create(match=None, against='KKR', match_date=datetime.date.today())
+            self.seed_cricketers(0, options['inactive'])
+            seeded_count = 0
+            for size in sizes:
+                self.seed_cricketers(options['inactive'] + seeded_count, size - seeded_count, match_stat=match_stat)
+                seeded_count = size
+                Cricketer.objects.update(last_inactivity_mail=last_mail_date)
+
+                self.stdout.write('{:,} active cricketers:'.format(size))
+                for label, get_cricketers in (('ids in python', get_cricketers_without_recent_stats_in_python), ('subqueries   ', get_cricketers_without_recent_stats)):
+                    result = measure(get_cricketers, since)
+                    if result is None:
+                        self.stdout.write('    {}  query failed'.format(label))
+                        continue
+                    count, seconds, peak_memory = result
+                    self.stdout.write('    {}  {:,} to mail  {:8.1f} ms  {:10,.0f} KiB peak'.format(label, count, seconds * 1000, peak_memory / 1024))
+        finally:
+            connection.creation.destroy_test_db(database_name, verbosity=0)
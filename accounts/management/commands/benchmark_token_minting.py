@@ -0,0 +1,44 @@
+# Python Imports
+import time
+
+# Django Imports
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from ...utils import encode_token, encode_tokens
+
+
+TARGET_TOKENS_PER_SECOND = 100000
+
+
+class Command(BaseCommand):
+    help = 'Measures auto-login token minting throughput, one at a time and in a batch.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100000, help='Number of tokens to mint.')
+        parser.add_argument('--token-type', type=int, default=1, help='Token type to mint.')
+
+    def handle(self, *args, **options):
+        token_type = options['token_type']
+        users = [get_user_model()(id=user_id) for user_id in range(1, options['users'] + 1)]  # Unsaved, Only the Id Is Needed
+
+        start = time.perf_counter()
+        for user in users:
+            encode_token(user, token_type)
+        single_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for user, token in encode_tokens(users, token_type):
+            pass
+        batch_seconds = time.perf_counter() - start
+
+        batch_rate = len(users) / batch_seconds
+        self.stdout.write('encode_token, one call per user: {:,.0f} tokens/s'.format(len(users) / single_seconds))
+        self.stdout.write('encode_tokens, one batch:        {:,.0f} tokens/s'.format(batch_rate))
+        if batch_rate < TARGET_TOKENS_PER_SECOND:
+            self.stderr.write('Batch throughput is below the target of {:,} tokens/s.'.format(TARGET_TOKENS_PER_SECOND))
@@ -0,0 +1,98 @@
+# Python Imports
+import random
+import re
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from ...models import Message, User
+
+
+def get_message_queries(user, friend):
+    """
+    Returns (Name, QuerySet) For Each Way the Message Table Is Read. Updates
+    Are Explained As the Select of the Rows They Update.
+    """
+    sent_messages, received_messages = Message.objects.get_chat_history_parts(user, friend.id)
+    return [
+        ('chat history sent (UserMessages)', sent_messages.order_by('-sent_on', '-id')[:21]),
+        ('chat history received (UserMessages)', received_messages.order_by('-sent_on', '-id')[:21]),
+        ('unread senders (header_context)', Message.objects.get_unread_sender_ids(user)),
+        ('mark read (MarkUserMessagesRead)', Message.objects.filter(recipient=user, unread=True, sender_id__in=[friend.id])),
+        ('delete sent (DeleteFriendChatHistory)', Message.objects.filter(sender=user, recipient_id=friend.id)),
+        ('delete received (DeleteFriendChatHistory)', Message.objects.filter(sender_id=friend.id, recipient=user)),
+    ]
+
+
+def explain(queryset):
+    sql, params = queryset.query.sql_with_params()
+    prefix = 'EXPLAIN QUERY PLAN ' if connection.vendor == 'sqlite' else 'EXPLAIN '
+    with connection.cursor() as cursor:
+        cursor.execute(prefix + sql, params)
+        return [' '.join(str(column) for column in row) for row in cursor.fetchall()]
+
+
+def is_full_scan(plan, table_name):
+    """
+    Returns If the Plan Reads Every Row of the Table
+    """
+    plan_text = '\n'.join(plan)
+    if connection.vendor == 'postgresql':
+        return 'Seq Scan on {}'.format(table_name) in plan_text
+    if connection.vendor == 'sqlite':
+        # SEARCH Is an Index Lookup, SCAN Reads the Whole Table Or a Whole Index
+        return re.search(r'\bSCAN (TABLE )?{}\b'.format(table_name), plan_text) is not None
+    if connection.vendor == 'mysql':
+        return any(table_name in line and ' ALL ' in ' {} '.format(line) for line in plan)
+    raise CommandError('Plans on {} are not supported.'.format(connection.vendor))
+
+
+class Command(BaseCommand):
+    help = 'Prints the query plan of every Message query against a seeded throwaway test database, failing if any reads the whole table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200, help='Number of users to seed.')
+        parser.add_argument('--messages', type=int, default=50000, help='Number of messages to seed.')
+
+    def seed(self, user_count, message_count):
+        User.objects.bulk_create([User(email='explain{}@test.com'.format(index), first_name='Jon', last_name='Snow') for index in range(user_count)])
+        user_ids = list(User.objects.values_list('id', flat=True))
+
+        # Bulk Created, Without Conversations, Which These Queries Do Not Read
+        messages = []
+        for index in range(message_count):
+            sender_id, recipient_id = random.sample(user_ids, 2)
+            messages.append(Message(sender_id=sender_id, recipient_id=recipient_id, text='Winter is coming', unread=random.random() < 0.1, deleted_by_sender=random.random() < 0.05, deleted_by_recipient=random.random() < 0.05))
+        Message.objects.bulk_create(messages, batch_size=1000)
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        return User.objects.order_by('id')[:2]
+
+    def handle(self, *args, **options):
+        # Seeded Data Goes to a Test Database That Is Destroyed Afterwards
+        database_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            user, friend = self.seed(options['users'], options['messages'])
+
+            full_scans = []
+            for name, queryset in get_message_queries(user, friend):
+                plan = explain(queryset)
+                self.stdout.write('{}:'.format(name))
+                for line in plan:
+                    self.stdout.write('    {}'.format(line))
+                if is_full_scan(plan, Message._meta.db_table):
+                    full_scans.append(name)
+        finally:
+            connection.creation.destroy_test_db(database_name, verbosity=0)
+
+        if full_scans:
+            raise CommandError('Full scans of {}: {}'.format(Message._meta.db_table, ', '.join(full_scans)))
+        self.stdout.write('No query scans the whole {} table.'.format(Message._meta.db_table))
@@ -0,0 +1,36 @@
+# Python Imports
+
+# Django Imports
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+# Third Party Django Imports
+
+# Inter App Imports
+from competition_mania.shared.utils import iter_queryset_chunks
+
+# Local Imports
+from ...counters import reconcile_user_counters
+
+
+class Command(BaseCommand):
+    help = "Recounts every user's header counters, repairing those that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='Number of users loaded at a time.')
+        parser.add_argument('--user-id', type=int, action='append', help='Only reconcile these users (repeatable).')
+
+    def handle(self, *args, **options):
+        users = get_user_model().objects.only('id')
+        if options['user_id']:
+            users = users.filter(id__in=options['user_id'])
+
+        user_count = drifted_count = 0
+        for chunk in iter_queryset_chunks(users, options['chunk_size']):
+            for user in chunk:
+                user_count += 1
+                if reconcile_user_counters(user.id):
+                    drifted_count += 1
+                    self.stdout.write('Repaired counters of user {}.'.format(user.id))
+
+        self.stdout.write('Reconciled {} users, {} had drifted.'.format(user_count, drifted_count))
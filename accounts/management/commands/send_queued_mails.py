@@ -0,0 +1,39 @@
+# Python Imports
+import time
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from ...digests import flush_due_digests
+from ...outbox import drain_outbox
+
+
+class Command(BaseCommand):
+    help = 'Queues due digest mails and sends mails queued in the outbox, retrying failures with exponential backoff.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=settings.MAIL_OUTBOX_CONCURRENCY, help='Number of mails sent at a time.')
+        parser.add_argument('--batch-size', type=int, default=100, help='Number of mails claimed at a time.')
+        parser.add_argument('--sleep', type=float, default=5, help='Seconds to wait when no mail is due.')
+        parser.add_argument('--once', action='store_true', help='Send one batch and exit.')
+
+    def handle(self, *args, **options):
+        while True:
+            digest_line_count = flush_due_digests()
+            if digest_line_count:
+                self.stdout.write('Queued digests of {} lines.'.format(digest_line_count))
+
+            sent_count, failed_count = drain_outbox(batch_size=options['batch_size'], concurrency=options['concurrency'])
+            if sent_count or failed_count:
+                self.stdout.write('Sent {} mails, {} failed.'.format(sent_count, failed_count))
+
+            if options['once']:
+                break
+            if sent_count + failed_count < options['batch_size']:
+                time.sleep(options['sleep'])
@@ -1,13 +1,18 @@
 # Python Imports
 
 # Django Imports
+from django.apps import apps
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 
 # Third Party Django Imports
 
 # Inter App Imports
 
 # Local Imports
+from .counters import add_to_user_counters
 
 
 class UserManager(BaseUserManager):
@@ -37,3 +42,90 @@ class UserManager(BaseUserManager):
         user.is_superuser = True
         user.save(using=self._db)
         return user
+
+
+class MessageManager(models.Manager):
+
+    def get_chat_history(self, user, friend_id):
+        """
+        Returns the Messages Between the User And a Friend That the User Has Not Deleted
+        """
+        sent_messages, received_messages = self.get_chat_history_parts(user, friend_id)
+        return sent_messages | received_messages
+
+    def get_chat_history_parts(self, user, friend_id):
+        """
+        Returns get_chat_history As the Sent And the Received Messages, Which
+        Can Each Be Read in Order Along the (sender, recipient, sent_on, id) Index.
+        Deleted Messages Are Those Upto the Conversation's Marker, Not the
+        deleted_by_* Flags, Which Are Not in the Index.
+        """
+        Conversation = apps.get_model('accounts', 'Conversation')
+
+        deleted_up_to = Conversation.objects.get_deleted_up_to(user.id, int(friend_id))
+        return [
+            self.filter(sender=user, recipient_id=friend_id, id__gt=deleted_up_to),
+            self.filter(sender_id=friend_id, recipient=user, id__gt=deleted_up_to),
+        ]
+
+    def get_unread_sender_ids(self, user):
+        return self.filter(recipient=user, unread=True, deleted_by_recipient=False).values_list('sender', flat=True).distinct()
+
+
+class ConversationManager(models.Manager):
+
+    def get_pair_filter(self, user_id, other_user_id):
+        user_one_id, user_two_id = sorted((user_id, other_user_id))
+        return {'user_one_id': user_one_id, 'user_two_id': user_two_id}
+
+    def get_deleted_up_to(self, user_id, other_user_id):
+        """
+        Returns the Id of the Last Message the User Deleted in the Conversation, 0 If None
+        """
+        pair_filter = self.get_pair_filter(user_id, other_user_id)
+        side = 'user_one' if pair_filter['user_one_id'] == user_id else 'user_two'
+        return self.filter(**pair_filter).values_list(side + '_deleted_up_to', flat=True).first() or 0
+
+    def record_message(self, message):
+        """
+        Updates the Conversation of a Newly Sent Message. Call It in the
+        Transaction That Saves the Message.
+        """
+        pair_filter = self.get_pair_filter(message.sender_id, message.recipient_id)
+        conversation, created = self.get_or_create(**pair_filter)
+
+        # Locks the Row, So the Checks Below See Every Committed Message
+        conversation = self.select_for_update().get(pk=conversation.pk)
+        unread_field = 'user_one_unread_count' if message.recipient_id == conversation.user_one_id else 'user_two_unread_count'
+        if message.unread:
+            self.filter(pk=conversation.pk).update(**{unread_field: F(unread_field) + 1})
+            if not getattr(conversation, unread_field):
+                add_to_user_counters(message.recipient_id, unread_message_sender_count=1)
+        self.filter(Q(last_message=None) | Q(last_message_id__lt=message.id), pk=conversation.pk).update(last_message=message, last_message_on=message.sent_on)
+
+    def mark_read(self, user, other_user_ids):
+        """
+        Clears the User's Unread Counts in Conversations With the Other Users
+        """
+        read_count = self.filter(user_one=user, user_two_id__in=other_user_ids, user_one_unread_count__gt=0).update(user_one_unread_count=0)
+        read_count += self.filter(user_two=user, user_one_id__in=other_user_ids, user_two_unread_count__gt=0).update(user_two_unread_count=0)
+        add_to_user_counters(user.id, unread_message_sender_count=-read_count)
+
+    def delete_history(self, user, other_user_id):
+        """
+        Hides the Conversation's Messages Upto Now From the User
+        """
+        pair_filter = self.get_pair_filter(user.id, int(other_user_id))
+        side = 'user_one' if pair_filter['user_one_id'] == user.id else 'user_two'
+        read_count = self.filter(**pair_filter).filter(**{side + '_unread_count__gt': 0}).update(**{side + '_unread_count': 0})
+        self.filter(**pair_filter).update(**{side + '_deleted_up_to': Coalesce(F('last_message'), F(side + '_deleted_up_to'))})
+        add_to_user_counters(user.id, unread_message_sender_count=-read_count)
+
+    def get_inbox(self, user):
+        """
+        Returns the User's Conversations, Latest First, Without Those Whose
+        Messages the User Has All Deleted. Slice It to Get a Page.
+        """
+        return self.filter(
+            Q(user_one=user, last_message_id__gt=F('user_one_deleted_up_to')) | Q(user_two=user, last_message_id__gt=F('user_two_deleted_up_to'))
+        ).select_related('last_message', 'user_one', 'user_two').order_by('-last_message_on')
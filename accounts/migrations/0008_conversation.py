@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_conversations(apps, schema_editor):
+    """
+    Builds a Conversation For Every Pair of Users That Has Messages
+    """
+    Message = apps.get_model('accounts', 'Message')
+    Conversation = apps.get_model('accounts', 'Conversation')
+
+    conversations = {}
+    messages = Message.objects.order_by('id').values_list('id', 'sender_id', 'recipient_id', 'sent_on', 'unread', 'deleted_by_sender', 'deleted_by_recipient')
+    for message_id, sender_id, recipient_id, sent_on, unread, deleted_by_sender, deleted_by_recipient in messages.iterator():
+        user_one_id, user_two_id = sorted((sender_id, recipient_id))
+        conversation = conversations.get((user_one_id, user_two_id))
+        if conversation is None:
+            conversation = conversations[(user_one_id, user_two_id)] = Conversation(user_one_id=user_one_id, user_two_id=user_two_id)
+
+        conversation.last_message_id = message_id
+        conversation.last_message_on = sent_on
+        sender_side, recipient_side = ('user_one', 'user_two') if sender_id == user_one_id else ('user_two', 'user_one')
+        if deleted_by_sender:
+            setattr(conversation, sender_side + '_deleted_up_to', message_id)
+        if deleted_by_recipient:
+            setattr(conversation, recipient_side + '_deleted_up_to', message_id)
+        elif unread:
+            setattr(conversation, recipient_side + '_unread_count', getattr(conversation, recipient_side + '_unread_count') + 1)
+
+    Conversation.objects.bulk_create(conversations.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0007_digestevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Conversation',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('last_message_on', models.DateTimeField(blank=True, null=True)),
+                ('user_one_unread_count', models.IntegerField(default=0)),
+                ('user_two_unread_count', models.IntegerField(default=0)),
+                ('user_one_deleted_up_to', models.IntegerField(default=0)),
+                ('user_two_deleted_up_to', models.IntegerField(default=0)),
+                ('last_message', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='accounts.Message')),
+                ('user_one', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('user_two', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.AlterUniqueTogether(
+            name='conversation',
+            unique_together=set([('user_one', 'user_two')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='conversation',
+            index_together=set([('user_one', 'last_message_on'), ('user_two', 'last_message_on')]),
+        ),
+        migrations.RunPython(create_conversations, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accounts', '0010_message_chat_history_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserCounters',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread_message_sender_count', models.IntegerField(default=0)),
+                ('unviewed_friend_request_count', models.IntegerField(default=0)),
+                ('unviewed_notification_count', models.IntegerField(default=0)),
+                ('reconciled_on', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
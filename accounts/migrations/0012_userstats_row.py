@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.10 on 2026-10-18 12:00
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+def create_user_stats_row(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    UserStats = apps.get_model('accounts', 'UserStats')
+    registered_user_count = User.objects.filter(is_email_verified=True, registration_midout=False).count()
+    UserStats.objects.update_or_create(pk=1, defaults={'registered_user_count': registered_user_count})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0011_usercounters'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_user_stats_row, migrations.RunPython.noop),
+    ]
@@ -5,7 +5,7 @@ from operator import itemgetter, attrgetter
 
 # Django Imports
 from django.template.defaultfilters import slugify
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 from django.core.urlresolvers import reverse
 from django.contrib.auth.models import AbstractBaseUser
@@ -14,6 +14,7 @@ from django.contrib.auth import get_user_model
 from django.db.models import Q, Max
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
+from django.utils import timezone
 
 # Third Party Django Imports
 
@@ -24,7 +25,10 @@ from lookup.choices import GENDER_CHOICES, COUNTRY_CHOICES, STATE_CHOICES, CITY_
 # from cricket.models import CricketMatchBattingStat, CricketMatchBowlingStat, CricketMatch, CricketMatchWicketKeepingStat, CricketTeam
 
 # Local Imports
-from .managers import UserManager
+from .events import publish_event
+from .hashing import make_password, check_password
+from .managers import ConversationManager, MessageManager, UserManager
+from .stats import is_registered
 from .utils import get_first_and_last_name
 
 
@@ -60,13 +64,60 @@ class Message(models.Model):
     deleted_by_sender = models.BooleanField(default=False)  # Flag to Check If Chat History Deleted
     deleted_by_recipient = models.BooleanField(default=False)  # Flag to Check If Chat History Deleted
 
+    objects = MessageManager()
+
+    class Meta:
+        index_together = (
+            ('sender', 'recipient', 'sent_on', 'id'),  # Chat History Pages, Deleting It
+            ('recipient', 'unread', 'sender', 'deleted_by_recipient'),  # Unread Senders (Index Only), Marking Read
+        )
+
     def __str__(self):
         return self.text
 
     def save(self, *args, **kwargs):
         if self.sender == self.recipient:
             raise ValidationError('Cannot send message to ourselves.')
-        super(Message, self).save(*args, **kwargs)
+
+        created = self.pk is None
+        with transaction.atomic():
+            super(Message, self).save(*args, **kwargs)
+            if created:
+                Conversation.objects.record_message(self)
+                publish_event(self.recipient_id, 'message_received', message_id=self.id, sender_id=self.sender_id)
+
+
+class Conversation(models.Model):
+    """
+    Model For the Inbox Entry of a Pair of Users, Updated On Every New Message.
+
+    user_one Is the User With the Lower Id. Each Side Has Its Own Unread Count
+    And Deleted Upto Marker (Messages With Ids Upto It Are Deleted For That
+    User), So the Inbox Is Read Without Touching the Message Table.
+    """
+    user_one = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='+')
+    user_two = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='+')
+    last_message = models.ForeignKey(Message, blank=True, null=True, on_delete=models.SET_NULL, related_name='+')
+    last_message_on = models.DateTimeField(blank=True, null=True)
+    user_one_unread_count = models.IntegerField(default=0)
+    user_two_unread_count = models.IntegerField(default=0)
+    user_one_deleted_up_to = models.IntegerField(default=0)
+    user_two_deleted_up_to = models.IntegerField(default=0)
+
+    objects = ConversationManager()
+
+    class Meta:
+        unique_together = (('user_one', 'user_two'),)
+        index_together = (('user_one', 'last_message_on'), ('user_two', 'last_message_on'))
+
+    def __str__(self):
+        return '{} - {}'.format(self.user_one_id, self.user_two_id)
+
+    def get_other_user(self, user):
+        return self.user_two if user.id == self.user_one_id else self.user_one
+
+    def get_unread_count(self, user):
+        return self.user_one_unread_count if user.id == self.user_one_id else self.user_two_unread_count
 
 
 class User(AbstractBaseUser):
@@ -79,7 +130,7 @@ class User(AbstractBaseUser):
     first_name = models.CharField(max_length=30)
     last_name = models.CharField(max_length=30)
     gender = models.CharField(default='M', choices=GENDER_CHOICES, max_length=1)
-    mobile = models.CharField(blank=True, max_length=10)
+    mobile = models.CharField(blank=True, max_length=10, db_index=True)
     country = models.CharField(default='IN', choices=COUNTRY_CHOICES, max_length=2)
     state = models.IntegerField(blank=True, null=True, choices=STATE_CHOICES)
     state_text = models.CharField(blank=True, max_length=30)
@@ -113,6 +164,30 @@ class User(AbstractBaseUser):
     def __str__(self):
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        user = super(User, cls).from_db(db, field_names, values)
+        user._was_registered = is_registered(user)  # Previous State For the Registered User Count
+        return user
+
+    def set_password(self, raw_password):
+        """
+        Hashes the Password in the Password Hashing Pool
+        """
+        self.password = make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        """
+        Checks the Password in the Password Hashing Pool, Upgrading the Stored
+        Hash If the Preferred Hasher Has Changed.
+        """
+        def setter(raw_password):
+            self.set_password(raw_password)
+            self._password = None
+            self.save(update_fields=['password'])
+        return check_password(raw_password, self.password, setter)
+
     def has_perm(self, perm, obj=None):
         """
         Does the User Have a Specific Permission?
@@ -582,6 +657,103 @@ class User(AbstractBaseUser):
     #         self.create_slug()
 
 
+class RevokedToken(models.Model):
+    """
+    Model For Auto Login Tokens That Are Used Up Or Revoked.
+
+    Only a Hash of the Token Is Stored. Rows Are Pruned Once the Token Has
+    Expired Anyway (See accounts.cron.PruneRevokedTokens).
+    """
+    token_hash = models.CharField(max_length=64, unique=True)
+    revoked_on = models.DateTimeField(auto_now_add=True, db_index=True)
+    expires_on = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.token_hash
+
+
+class OutboxMail(models.Model):
+    """
+    Model For Mails Waiting to Be Sent By the `send_queued_mails` Worker.
+
+    Mails Are Queued in the Same Transaction As the Change That Causes Them,
+    So a Mail Goes Out If And Only If That Change Is Committed.
+    """
+    PENDING = 1
+    SENT = 2
+    FAILED = 3
+    STATUS_CHOICES = (
+        (PENDING, 'Pending'),
+        (SENT, 'Sent'),
+        (FAILED, 'Failed'),
+    )
+
+    subject = models.CharField(max_length=255)
+    html_message = models.TextField()
+    from_email = models.CharField(max_length=255)
+    recipients = models.TextField()  # Comma Separated
+    status = models.IntegerField(default=PENDING, choices=STATUS_CHOICES)
+    attempts = models.IntegerField(default=0)
+    next_attempt_on = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_on = models.DateTimeField(auto_now_add=True)
+    sent_on = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        index_together = (('status', 'next_attempt_on'),)
+
+    def __str__(self):
+        return self.subject
+
+    def get_recipient_list(self):
+        return self.recipients.split(',')
+
+
+class UserStats(models.Model):
+    """
+    Model For Counts Over the User Table, Kept in a Single Row (pk=1) So They
+    Are Read Without Scanning the Table.
+
+    The Row Is Created By Migration 0012, Kept Up to Date By the Signals in
+    accounts.stats And Rebuilt Daily By accounts.cron.RebuildUserStats, Which
+    Also Corrects Changes Made Without Signals (E.g. QuerySet.update).
+    """
+    registered_user_count = models.IntegerField(default=0)
+    rebuilt_on = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return 'Registered Users: {}'.format(self.registered_user_count)
+
+
+class DigestEvent(models.Model):
+    """
+    Model For Lines Waiting to Go Out in a Digest Mail (See accounts.digests).
+    """
+    digest = models.CharField(max_length=50)
+    line = models.TextField()
+    created_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        index_together = (('digest', 'created_on'),)
+
+    def __str__(self):
+        return self.line
+
+
+class UserCounters(models.Model):
+    """
+    Model For the Header Counts of a User, Moved On Every Change (See
+    accounts.counters) Instead of Being Counted On Every Page.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, primary_key=True, related_name='+')
+    unread_message_sender_count = models.IntegerField(default=0)
+    unviewed_friend_request_count = models.IntegerField(default=0)
+    unviewed_notification_count = models.IntegerField(default=0)
+    reconciled_on = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return str(self.user_id)
+
 # class FriendRequest(models.Model):
 #     """
 #     Model for storing Connect Requests.
@@ -0,0 +1,101 @@
+# Python Imports
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+# Django Imports
+from django.apps import apps
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import connection
+from django.utils import timezone
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+def queue_mail(subject, html_message, from_email, recipient_list):
+    """
+    Queues a Mail in the Outbox. Call It Inside the Transaction That Makes
+    the Change the Mail Is About.
+    """
+    OutboxMail = apps.get_model('accounts', 'OutboxMail')
+
+    return OutboxMail.objects.create(subject=subject, html_message=html_message, from_email=from_email, recipients=','.join(recipient_list))
+
+
+def get_retry_delay(attempts):
+    """
+    Exponential Backoff With Upto 10% Jitter, Capped At MAIL_OUTBOX_RETRY_MAX_SECONDS
+    """
+    delay = min(settings.MAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.MAIL_OUTBOX_RETRY_MAX_SECONDS)
+    return timedelta(seconds=delay * random.uniform(1, 1.1))
+
+
+def claim_due_mails(batch_size):
+    """
+    Returns Upto `batch_size` Due Mails, Each Leased For MAIL_OUTBOX_LEASE_SECONDS
+    So Other Workers Skip It. A Mail Is Only Claimed If Its next_attempt_on Is
+    Unchanged, So Two Workers Never Claim the Same Mail.
+    """
+    OutboxMail = apps.get_model('accounts', 'OutboxMail')
+
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=settings.MAIL_OUTBOX_LEASE_SECONDS)
+    due_mails = OutboxMail.objects.filter(status=OutboxMail.PENDING, next_attempt_on__lte=now).order_by('next_attempt_on')[:batch_size]
+
+    claimed_mails = []
+    for mail in due_mails:
+        if OutboxMail.objects.filter(pk=mail.pk, status=OutboxMail.PENDING, next_attempt_on=mail.next_attempt_on).update(next_attempt_on=lease_until):
+            claimed_mails.append(mail)
+    return claimed_mails
+
+
+def deliver_mail(mail):
+    """
+    Sends a Claimed Mail. Returns True If Sent, Otherwise Schedules a Retry
+    Or Gives Up After MAIL_OUTBOX_MAX_ATTEMPTS.
+    """
+    OutboxMail = apps.get_model('accounts', 'OutboxMail')
+
+    try:
+        send_mail(subject=mail.subject, message='', from_email=mail.from_email, recipient_list=mail.get_recipient_list(), html_message=mail.html_message)
+    except Exception as error:
+        attempts = mail.attempts + 1
+        if attempts >= settings.MAIL_OUTBOX_MAX_ATTEMPTS:
+            OutboxMail.objects.filter(pk=mail.pk).update(status=OutboxMail.FAILED, attempts=attempts, last_error=repr(error))
+        else:
+            OutboxMail.objects.filter(pk=mail.pk).update(attempts=attempts, next_attempt_on=timezone.now() + get_retry_delay(attempts), last_error=repr(error))
+        return False
+
+    OutboxMail.objects.filter(pk=mail.pk).update(status=OutboxMail.SENT, attempts=mail.attempts + 1, sent_on=timezone.now())
+    return True
+
+
+def deliver_mail_in_thread(mail):
+    try:
+        return deliver_mail(mail)
+    finally:
+        connection.close()  # Each Thread Has Its Own Db Connection
+
+
+def drain_outbox(batch_size=100, concurrency=1):
+    """
+    Claims And Sends One Batch of Due Mails, `concurrency` At a Time.
+
+    Returns:
+
+        (sent_count, failed_count)
+    """
+    mails = claim_due_mails(batch_size)
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(deliver_mail_in_thread, mails))
+    else:
+        results = [deliver_mail(mail) for mail in mails]
+
+    sent_count = results.count(True)
+    return sent_count, len(results) - sent_count
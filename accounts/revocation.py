@@ -0,0 +1,137 @@
+# Python Imports
+import hashlib
+import math
+import threading
+from datetime import datetime, timedelta
+
+# Django Imports
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from .models import RevokedToken
+from .utils import is_signed_token, unsign_token
+
+
+def get_token_hash(token):
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+def get_token_expires_on(token):
+    """
+    Returns When the Token Expires. Legacy Tokens Are Not Read, They Expire
+    Within EMAIL_TOKEN_EXPIRY_DAYS_LIMIT At the Latest.
+    """
+    token_data = unsign_token(token) if is_signed_token(token) else None
+    if token_data:
+        return datetime.fromtimestamp(token_data[2], timezone.utc)
+    return timezone.now() + timedelta(days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT)
+
+
+class BloomFilter(object):
+    """
+    Bit Array Telling If a Token Hash Was Definitely Never Added Or Possibly Was.
+    """
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(self.bit_count / capacity * math.log(2))))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def get_positions(self, token_hash):
+        # Double Hashing, the Two Hashes Are Taken From the Sha256 Hex Digest Itself
+        first_hash = int(token_hash[:16], 16)
+        second_hash = int(token_hash[16:32], 16) | 1
+        return [(first_hash + index * second_hash) % self.bit_count for index in range(self.hash_count)]
+
+    def add(self, token_hash):
+        for position in self.get_positions(token_hash):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, token_hash):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.get_positions(token_hash))
+
+
+class TokenRevocationStore(object):
+    """
+    Used Up Or Revoked Auto Login Tokens.
+
+    The RevokedToken Table Is Mirrored Into an In Memory Bloom Filter, So
+    Checking a Token That Was Never Revoked (The Common Case) Costs No Query.
+    Only Possible Hits Are Confirmed Against the Table. Tokens Revoked By
+    Other Processes Are Picked Up Every TOKEN_REVOCATION_SYNC_SECONDS.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom_filter = None
+        self.synced_on = None
+
+    def load(self, now):
+        token_hashes = list(RevokedToken.objects.filter(expires_on__gt=now).values_list('token_hash', flat=True))
+        capacity = max(settings.TOKEN_REVOCATION_BLOOM_CAPACITY, 2 * len(token_hashes))
+        bloom_filter = BloomFilter(capacity, settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE)
+        for token_hash in token_hashes:
+            bloom_filter.add(token_hash)
+        self.bloom_filter = bloom_filter
+
+    def sync(self):
+        now = timezone.now()
+        sync_interval = timedelta(seconds=settings.TOKEN_REVOCATION_SYNC_SECONDS)
+        if self.synced_on and now - self.synced_on < sync_interval:
+            return
+
+        with self.lock:
+            if self.synced_on and now - self.synced_on < sync_interval:
+                return
+
+            if self.bloom_filter is None or self.bloom_filter.count >= self.bloom_filter.capacity:
+                self.load(now)  # Rebuilding Also Drops Pruned Tokens
+            else:
+                # Overlap With the Previous Sync, So Rows Committed Late Are Not Missed
+                revoked_since = self.synced_on - sync_interval
+                for token_hash in RevokedToken.objects.filter(revoked_on__gte=revoked_since).values_list('token_hash', flat=True):
+                    self.bloom_filter.add(token_hash)
+            self.synced_on = now
+
+    def is_revoked(self, token):
+        token_hash = get_token_hash(token)
+        self.sync()
+        if token_hash not in self.bloom_filter:
+            return False
+        return RevokedToken.objects.filter(token_hash=token_hash).exists()
+
+    def revoke(self, token):
+        """
+        Revokes the Token. Returns False If It Was Already Revoked, So Callers
+        Using a Token Only Once Can Tell If They Lost a Race.
+        """
+        token_hash = get_token_hash(token)
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(token_hash=token_hash, expires_on=get_token_expires_on(token))
+            revoked = True
+        except IntegrityError:
+            revoked = False
+
+        self.sync()
+        self.bloom_filter.add(token_hash)
+        return revoked
+
+    def prune(self):
+        """
+        Deletes Tokens That Have Expired, They Are Rejected Anyway
+        """
+        deleted_count, deleted_per_model = RevokedToken.objects.filter(expires_on__lte=timezone.now()).delete()
+        return deleted_count
+
+
+TOKEN_REVOCATION_STORE = TokenRevocationStore()
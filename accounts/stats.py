@@ -0,0 +1,111 @@
+"""
+User Stats
+
+The Registered User Count (Email Verified, Registration Complete) Is Kept in
+the UserStats Row And Moved By One in the Same Transaction As Each User Save
+Or Delete That Changes It, So Reading It Never Scans the User Table. The Row
+Is Created By Migration 0012.
+
+Changes That Skip Signals (QuerySet.update, Raw Sql) Are Corrected By
+rebuild_user_stats, Run Daily By accounts.cron.RebuildUserStats.
+"""
+
+# Python Imports
+
+# Django Imports
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+REGISTRATION_FIELDS = ('is_email_verified', 'registration_midout')
+
+
+def is_registered(user):
+    """
+    Returns If the User Counts As Registered, Or None If Its Fields Were Not Loaded
+    """
+    if any(field not in user.__dict__ for field in REGISTRATION_FIELDS):
+        return None
+    return user.is_email_verified and not user.registration_midout
+
+
+def rebuild_user_stats():
+    """
+    Recounts the Stats From the User Table. Returns the Registered User Count.
+    """
+    UserStats = apps.get_model('accounts', 'UserStats')
+
+    registered_user_count = get_user_model().objects.filter(is_email_verified=True, registration_midout=False).count()
+    UserStats.objects.update_or_create(pk=1, defaults={'registered_user_count': registered_user_count, 'rebuilt_on': timezone.now()})
+    return registered_user_count
+
+
+def get_stored_registration_state(user_id):
+    """
+    Returns If the User's Saved Row Counts As Registered, By Primary Key
+    """
+    stored_user = get_user_model().objects.filter(pk=user_id).values(*REGISTRATION_FIELDS).first()
+    return bool(stored_user) and stored_user['is_email_verified'] and not stored_user['registration_midout']
+
+
+def get_registered_user_count():
+    UserStats = apps.get_model('accounts', 'UserStats')
+    return UserStats.objects.filter(pk=1).values_list('registered_user_count', flat=True).first() or 0
+
+
+def add_registered_users(count):
+    UserStats = apps.get_model('accounts', 'UserStats')
+    if not UserStats.objects.filter(pk=1).update(registered_user_count=F('registered_user_count') + count):
+        UserStats.objects.get_or_create(pk=1)  # Only Missing If the Table Was Emptied, RebuildUserStats Recounts It
+        UserStats.objects.filter(pk=1).update(registered_user_count=F('registered_user_count') + count)
+
+
+def saves_registration_fields(update_fields):
+    return update_fields is None or bool(set(REGISTRATION_FIELDS).intersection(update_fields))
+
+
+# User.from_db Sets _was_registered For Loaded Users. Users Loaded Without the
+# Registration Fields Have It Looked Up By Primary Key Before They Change.
+
+@receiver(pre_save, sender=settings.AUTH_USER_MODEL)
+def remember_stored_registration_state(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None or not saves_registration_fields(update_fields):
+        return
+    if getattr(instance, '_was_registered', None) is None:
+        instance._was_registered = get_stored_registration_state(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def count_saved_user(sender, instance, created, update_fields=None, **kwargs):
+    if not saves_registration_fields(update_fields):
+        return
+
+    was_registered = False if created else instance._was_registered
+    registered = is_registered(instance)  # Saved Fields Are Always Loaded
+    instance._was_registered = registered
+
+    if registered != was_registered:
+        add_registered_users(1 if registered else -1)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def remember_deleted_registration_state(sender, instance, **kwargs):
+    if getattr(instance, '_was_registered', None) is None:
+        instance._was_registered = get_stored_registration_state(instance.pk)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def count_deleted_user(sender, instance, **kwargs):
+    if instance._was_registered:
+        add_registered_users(-1)
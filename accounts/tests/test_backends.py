@@ -4,6 +4,8 @@ import unittest
 # inbuilt django imports
 from django.test import Client
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 # third-party django imports
 import pytest
@@ -12,7 +14,7 @@ import pytest
 from sportsvitae.shared.factories import UserFactory
 
 # local imports
-from ..backends import EmailAuthenticationBackend, MobileAuthenticationBackend
+from ..backends import EmailAuthenticationBackend, MobileAuthenticationBackend, IdentifierAuthenticationBackend
 
 
 @pytest.mark.django_db
@@ -22,18 +24,11 @@ class TestEmailAuthenticationBackend(unittest.TestCase):
         self.user = UserFactory()
         self.email_backend = EmailAuthenticationBackend()
 
-    def test_returns_user_if_valid_credentials(self):
-        user = self.email_backend.authenticate(username=self.user.email, password=settings.TEST_USER_PASSWORD)
-        self.assertIsNotNone(user)
-        self.assertEqual(user, self.user)
-
-    def test_returns_none_if_invalid_credentials(self):
-        user = self.email_backend.authenticate(username='a@a.com', password='aaaaaa')
-        self.assertIsNone(user)
-
-    def test_returns_none_if_valid_email_but_invalid_password(self):
-        user = self.email_backend.authenticate(username=self.user.email, password='aaaaaa')
+    def test_does_not_authenticate_valid_credentials(self):
+        with CaptureQueriesContext(connection) as queries:
+            user = self.email_backend.authenticate(username=self.user.email, password=settings.TEST_USER_PASSWORD)
         self.assertIsNone(user)
+        self.assertEqual(len(queries), 0)
 
     def test_returns_user_with_pk(self):
         user = self.email_backend.get_user(self.user.id)
@@ -73,3 +68,66 @@ class TestMobileAuthenticationBackend(unittest.TestCase):
     def test_does_not_return_user_with_invalid_pk(self):
         user = self.mobile_backend.get_user(999)
         self.assertIsNone(user)
+
+
+@pytest.mark.django_db
+class TestIdentifierAuthenticationBackend(unittest.TestCase):
+
+    def setUp(self):
+        self.user = UserFactory(mobile='9191919191', social_profile_id='100001234567890')
+        self.identifier_backend = IdentifierAuthenticationBackend()
+
+    def test_returns_user_if_valid_email_credentials(self):
+        user = self.identifier_backend.authenticate(username=self.user.email, password=settings.TEST_USER_PASSWORD)
+        self.assertEqual(user, self.user)
+
+    def test_returns_user_if_valid_mobile_credentials(self):
+        user = self.identifier_backend.authenticate(username=self.user.mobile, password=settings.TEST_USER_PASSWORD)
+        self.assertEqual(user, self.user)
+
+    def test_returns_user_if_valid_social_profile_id_credentials(self):
+        user = self.identifier_backend.authenticate(username=self.user.social_profile_id, password=settings.TEST_USER_PASSWORD)
+        self.assertEqual(user, self.user)
+
+    def test_returns_user_if_valid_short_numeric_social_profile_id_credentials(self):
+        user = UserFactory(social_profile_id='123456789')
+        self.assertEqual(self.identifier_backend.authenticate(username='123456789', password=settings.TEST_USER_PASSWORD), user)
+
+    def test_picks_lookup_from_username_format(self):
+        self.assertEqual(self.identifier_backend.get_identifier_lookup('a@a.com'), {'email': 'a@a.com'})
+        self.assertEqual(self.identifier_backend.get_identifier_lookup('9191919191'), {'mobile': '9191919191'})
+        self.assertEqual(self.identifier_backend.get_identifier_lookup('1234567890'), {'social_profile_id': '1234567890'})
+        self.assertEqual(self.identifier_backend.get_identifier_lookup('91919191'), {'social_profile_id': '91919191'})
+
+    def test_returns_none_if_invalid_credentials(self):
+        user = self.identifier_backend.authenticate(username='a@a.com', password='aaaaaa')
+        self.assertIsNone(user)
+
+    def test_returns_none_if_valid_mobile_but_invalid_password(self):
+        user = self.identifier_backend.authenticate(username=self.user.mobile, password='aaaaaa')
+        self.assertIsNone(user)
+
+    def test_returns_none_if_user_inactive(self):
+        self.user.is_active = False
+        self.user.save()
+        user = self.identifier_backend.authenticate(username=self.user.email, password=settings.TEST_USER_PASSWORD)
+        self.assertIsNone(user)
+
+    def test_returns_none_if_mobile_shared_by_users(self):
+        UserFactory(mobile=self.user.mobile)
+        user = self.identifier_backend.authenticate(username=self.user.mobile, password=settings.TEST_USER_PASSWORD)
+        self.assertIsNone(user)
+
+    def test_makes_one_query_for_failed_login(self):
+        for username in ('a@a.com', '9999999999', 'unknown-social-id'):
+            with CaptureQueriesContext(connection) as queries:
+                self.identifier_backend.authenticate(username=username, password='aaaaaa')
+            self.assertEqual(len(queries), 1)
+
+    def test_returns_user_with_pk(self):
+        user = self.identifier_backend.get_user(self.user.id)
+        self.assertEqual(user, self.user)
+
+    def test_does_not_return_user_with_invalid_pk(self):
+        user = self.identifier_backend.get_user(999)
+        self.assertIsNone(user)
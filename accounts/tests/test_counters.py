@@ -0,0 +1,91 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.core.cache import cache
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from sportsvitae.shared.factories import UserFactory, FriendRequestFactory, MessageFactory
+
+# local imports
+from ..counters import get_cache_key, get_user_counters, get_version_key, reconcile_user_counters, remove_friend_request_from_counters
+from ..models import Conversation, Message, UserCounters
+
+
+@pytest.mark.django_db(transaction=True)
+class TestUserCounters(unittest.TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = UserFactory()
+        self.friend = UserFactory()
+        self.other_friend = UserFactory()
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_unread_message_sender_count(self):
+        return get_user_counters(self.user.id)['unread_message_sender_count']
+
+    def test_counts_each_sender_with_unread_messages_once(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        MessageFactory(sender=self.friend, recipient=self.user)
+        MessageFactory(sender=self.other_friend, recipient=self.user)
+        MessageFactory(sender=self.user, recipient=self.friend)
+        self.assertEqual(self.get_unread_message_sender_count(), 2)
+
+    def test_first_message_creates_counters_row(self):
+        self.assertFalse(UserCounters.objects.filter(user_id=self.user.id).exists())
+        Message(sender=self.friend, recipient=self.user, text='Valar Morghulis!').save()
+        self.assertEqual(UserCounters.objects.get(user_id=self.user.id).unread_message_sender_count, 1)
+        self.assertEqual(get_user_counters(self.user.id), {'unread_message_sender_count': 1, 'unviewed_friend_request_count': 0, 'unviewed_notification_count': 0})
+
+    def test_marking_read_decrements_count(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        MessageFactory(sender=self.other_friend, recipient=self.user)
+        self.assertEqual(self.get_unread_message_sender_count(), 2)
+
+        Conversation.objects.mark_read(self.user, [self.friend.id])
+        self.assertEqual(self.get_unread_message_sender_count(), 1)
+        Conversation.objects.mark_read(self.user, [self.friend.id])
+        self.assertEqual(self.get_unread_message_sender_count(), 1)
+
+    def test_deleting_history_decrements_count(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        Conversation.objects.delete_history(self.user, self.friend.id)
+        self.assertEqual(self.get_unread_message_sender_count(), 0)
+
+    def test_reads_counters_from_cache(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        self.get_unread_message_sender_count()
+        UserCounters.objects.filter(user_id=self.user.id).update(unread_message_sender_count=5)
+        self.assertEqual(self.get_unread_message_sender_count(), 1)
+
+    def test_reconcile_repairs_drift(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        Message.objects.update(unread=False)  # Skips the Counters
+        self.assertTrue(reconcile_user_counters(self.user.id))
+        self.assertEqual(self.get_unread_message_sender_count(), 0)
+        self.assertFalse(reconcile_user_counters(self.user.id))
+
+    def test_counters_cached_before_a_change_are_not_read_after_it(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        stale_counters = get_user_counters(self.user.id)
+        stale_cache_key = get_cache_key(self.user.id, cache.get(get_version_key(self.user.id), 0))
+
+        MessageFactory(sender=self.other_friend, recipient=self.user)
+        cache.set(stale_cache_key, stale_counters)  # A Reader That Loaded the Row Before the Commit
+        self.assertEqual(self.get_unread_message_sender_count(), 2)
+
+    def test_removing_friend_request_applies_deltas(self):
+        friend_request = FriendRequestFactory(from_user=self.friend, to_user=self.user)
+        FriendRequestFactory(from_user=self.user, to_user=self.friend)
+        reconcile_user_counters(self.user.id)
+        reconcile_user_counters(self.friend.id)
+
+        remove_friend_request_from_counters(friend_request, with_reverse_requests=True)
+        self.assertEqual(get_user_counters(self.user.id)['unviewed_friend_request_count'], 0)
+        self.assertEqual(get_user_counters(self.friend.id)['unviewed_friend_request_count'], 0)
@@ -0,0 +1,71 @@
+# inbuilt python imports
+import unittest
+from datetime import timedelta
+
+# inbuilt django imports
+from django.test import override_settings
+from django.utils import timezone
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+
+# local imports
+from ..digests import NEW_USER_DIGEST, flush_due_digests
+from ..models import DigestEvent, OutboxMail
+from ..utils import send_admin_mail_on_user_profile_completion
+
+
+@pytest.mark.django_db
+class TestDigests(unittest.TestCase):
+
+    def setUp(self):
+        DigestEvent.objects.all().delete()
+        OutboxMail.objects.all().delete()
+
+    def tearDown(self):
+        DigestEvent.objects.all().delete()
+        OutboxMail.objects.all().delete()
+
+    def test_admin_mail_is_added_to_digest(self):
+        send_admin_mail_on_user_profile_completion('test@test.com')
+        self.assertEqual(OutboxMail.objects.count(), 0)
+        self.assertIn('test@test.com', DigestEvent.objects.get(digest=NEW_USER_DIGEST.name).line)
+
+    @override_settings(MAIL_DIGEST_ENABLED=False)
+    def test_admin_mail_is_queued_without_digest(self):
+        send_admin_mail_on_user_profile_completion('test@test.com')
+        self.assertEqual(OutboxMail.objects.count(), 1)
+        self.assertEqual(DigestEvent.objects.count(), 0)
+
+    def test_recent_lines_are_not_flushed(self):
+        NEW_USER_DIGEST.add('New User email: test@test.com')
+        self.assertEqual(flush_due_digests(), 0)
+        self.assertEqual(OutboxMail.objects.count(), 0)
+
+    def test_due_lines_are_flushed_into_one_mail(self):
+        for index in range(3):
+            NEW_USER_DIGEST.add('New User email: test{}@test.com'.format(index))
+        DigestEvent.objects.update(created_on=timezone.now() - timedelta(hours=2))
+
+        self.assertEqual(flush_due_digests(), 3)
+        mail = OutboxMail.objects.get()
+        self.assertEqual(mail.subject, '[Important] 3 New Users Have Joined!')
+        self.assertEqual(mail.get_recipient_list(), ['care@sportsvitae.com'])
+        for index in range(3):
+            self.assertIn('test{}@test.com'.format(index), mail.html_message)
+        self.assertEqual(DigestEvent.objects.count(), 0)
+
+    @override_settings(MAIL_DIGEST_BUFFER_SIZE=2)
+    def test_full_buffer_is_flushed_early(self):
+        for index in range(3):
+            NEW_USER_DIGEST.add('New User email: test{}@test.com'.format(index))
+
+        self.assertEqual(flush_due_digests(), 2)
+        self.assertEqual(OutboxMail.objects.count(), 1)
+        self.assertEqual(DigestEvent.objects.count(), 1)
+
+    def test_flush_without_lines(self):
+        self.assertEqual(NEW_USER_DIGEST.flush(), 0)
+        self.assertEqual(OutboxMail.objects.count(), 0)
@@ -0,0 +1,102 @@
+# inbuilt python imports
+import threading
+import time
+import unittest
+
+# inbuilt django imports
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..events import CacheEventBroker, LocalEventBroker, check_events_cache
+
+
+class EventBrokerTestsMixin(object):
+
+    def test_poll_returns_no_events(self):
+        self.assertEqual(self.broker.poll(1, 0), (0, []))
+
+    def test_poll_returns_events_after_version(self):
+        self.broker.publish(1, {'type': 'a'})
+        self.broker.publish(1, {'type': 'b'})
+        self.assertEqual(self.broker.poll(1, 1), (2, [{'type': 'b'}]))
+
+    def test_other_users_events_are_not_returned(self):
+        self.broker.publish(2, {'type': 'a'})
+        self.assertEqual(self.broker.poll(1, 0), (0, []))
+
+    def test_client_must_reload_after_dropped_events(self):
+        for index in range(5):
+            self.broker.publish(1, {'index': index})
+        self.assertEqual(self.broker.poll(1, 1), (5, None))
+        self.assertEqual(self.broker.poll(1, 2), (5, [{'index': 2}, {'index': 3}, {'index': 4}]))
+
+    def test_client_must_reload_after_broker_restart(self):
+        self.assertEqual(self.broker.poll(1, 7), (0, None))
+
+    def test_wait_times_out_without_events(self):
+        self.assertEqual(self.broker.wait(1, 0, 0.01), (0, []))
+
+    def test_wait_returns_events_after_version_at_once(self):
+        self.broker.publish(1, {'type': 'a'})
+        self.broker.publish(1, {'type': 'b'})
+        self.assertEqual(self.broker.wait(1, 1, 0), (2, [{'type': 'b'}]))
+
+    def test_wait_wakes_on_publish(self):
+        threading.Timer(0.05, self.broker.publish, args=(1, {'type': 'a'})).start()
+        start = time.monotonic()
+        self.assertEqual(self.broker.wait(1, 0, 5), (1, [{'type': 'a'}]))
+        self.assertLess(time.monotonic() - start, 1)
+
+
+class TestCacheEventBroker(EventBrokerTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        caches['default'].clear()
+        self.broker = CacheEventBroker(cache_alias='default', buffer_size=3, timeout=60, check_seconds=0.05)
+
+    def test_client_must_reload_after_events_expire(self):
+        self.broker.publish(1, {'type': 'a'})
+        self.broker.cache.delete(self.broker.get_event_key(1, 1))
+        self.assertEqual(self.broker.poll(1, 0), (1, None))
+
+    def test_wait_picks_up_events_published_by_other_processes(self):
+        other_process_broker = CacheEventBroker(cache_alias='default', buffer_size=3, timeout=60)  # Shares Only the Cache
+        threading.Timer(0.05, other_process_broker.publish, args=(1, {'type': 'a'})).start()
+        self.assertEqual(self.broker.wait(1, 0, 5), (1, [{'type': 'a'}]))
+
+
+class TestLocalEventBroker(EventBrokerTestsMixin, unittest.TestCase):
+
+    def setUp(self):
+        self.broker = LocalEventBroker(buffer_size=3, max_users=2)
+
+    def test_drops_least_recently_published_user(self):
+        for user_id in (1, 2, 3):
+            self.broker.publish(user_id, {'type': 'a'})
+        self.assertEqual(self.broker.get_version(1), 0)
+        self.assertEqual(self.broker.get_version(3), 1)
+
+
+class TestCheckEventsCache(unittest.TestCase):
+
+    @override_settings(EVENTS_BROKER='accounts.events.CacheEventBroker', EVENTS_CACHE_ALIAS='events', CACHES={'events': {'BACKEND': 'django.core.cache.backends.memcached.MemcachedCache', 'LOCATION': '127.0.0.1:11211'}})
+    def test_accepts_shared_cache(self):
+        check_events_cache()
+
+    @override_settings(EVENTS_BROKER='accounts.events.CacheEventBroker', EVENTS_CACHE_ALIAS='events', CACHES={'events': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_refuses_per_process_cache(self):
+        self.assertRaises(ImproperlyConfigured, check_events_cache)
+
+    @override_settings(EVENTS_BROKER='accounts.events.CacheEventBroker', EVENTS_CACHE_ALIAS='events', CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_refuses_missing_cache(self):
+        self.assertRaises(ImproperlyConfigured, check_events_cache)
+
+    @override_settings(EVENTS_BROKER='accounts.events.LocalEventBroker', EVENTS_CACHE_ALIAS='events', CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_ignores_cache_of_local_broker(self):
+        check_events_cache()
@@ -0,0 +1,74 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.contrib.auth import hashers
+from django.test import override_settings
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..hashing import PasswordHashingPool, PasswordHashingBusy
+from ..models import User
+
+
+class TestPasswordHashingPool(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = PasswordHashingPool(pool_size=1, queue_size=2, queue_timeout=0.01)
+
+    def test_makes_password_in_pool(self):
+        encoded_password = self.pool.make_password('dummy123')
+        self.assertTrue(hashers.check_password('dummy123', encoded_password))
+
+    def test_checks_password_in_pool(self):
+        encoded_password = hashers.make_password('dummy123')
+        self.assertTrue(self.pool.check_password('dummy123', encoded_password))
+        self.assertFalse(self.pool.check_password('aaaaaa', encoded_password))
+
+    @override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.PBKDF2PasswordHasher', 'django.contrib.auth.hashers.SHA1PasswordHasher'])
+    def test_calls_setter_if_hash_needs_upgrade(self):
+        encoded_password = hashers.make_password('dummy123', hasher='sha1')
+        upgraded_passwords = []
+        self.assertTrue(self.pool.check_password('dummy123', encoded_password, upgraded_passwords.append))
+        self.assertEqual(upgraded_passwords, ['dummy123'])
+
+    def test_does_not_call_setter_if_hash_is_current(self):
+        encoded_password = hashers.make_password('dummy123')
+        upgraded_passwords = []
+        self.assertTrue(self.pool.check_password('dummy123', encoded_password, upgraded_passwords.append))
+        self.assertEqual(upgraded_passwords, [])
+
+    def test_hashes_on_calling_thread_if_pool_size_is_zero(self):
+        pool = PasswordHashingPool(pool_size=0, queue_size=2, queue_timeout=0.01)
+        self.assertTrue(hashers.check_password('dummy123', pool.make_password('dummy123')))
+        self.assertIsNone(pool.executor)
+
+    def test_raises_busy_if_queue_stays_full(self):
+        self.pool.queue_slots.acquire()
+        self.pool.queue_slots.acquire()
+        self.assertRaises(PasswordHashingBusy, self.pool.make_password, 'dummy123')
+        self.assertEqual(self.pool.get_metrics()['rejected_count'], 1)
+
+    def test_reports_metrics(self):
+        self.pool.make_password('dummy123')
+        metrics = self.pool.get_metrics()
+        self.assertEqual(metrics['queue_depth'], 0)
+        self.assertEqual(metrics['hash_count'], 1)
+        self.assertGreater(metrics['latency_p99'], 0)
+
+
+class TestUserPassword(unittest.TestCase):
+
+    def test_set_password_hashes_password(self):
+        user = User(email='test@test.com')
+        user.set_password('dummy123')
+        self.assertNotEqual(user.password, 'dummy123')
+        self.assertTrue(user.check_password('dummy123'))
+
+    def test_check_password_rejects_wrong_password(self):
+        user = User(email='test@test.com')
+        user.set_password('dummy123')
+        self.assertFalse(user.check_password('aaaaaa'))
@@ -0,0 +1,50 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..mail_rendering import MailRenderer
+
+
+class TestMailRenderer(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = MailRenderer(pool_size=1)
+        self.context = {'host': 'testserver', 'token': 'some-token'}
+
+    def test_template_is_compiled_once(self):
+        template = self.renderer.get_template('accounts/mailers/forgot_password.html')
+        self.renderer.render('accounts/mailers/forgot_password.html', self.context)
+        self.assertIs(self.renderer.get_template('accounts/mailers/forgot_password.html'), template)
+
+    def test_render_uses_context(self):
+        body = self.renderer.render('accounts/mailers/forgot_password.html', self.context)
+        self.assertIn('http://testserver/', body)
+        self.assertIn('some-token', body)
+
+    def test_render_many_keeps_context_order(self):
+        contexts = [{'host': 'testserver', 'token': 'token-{}'.format(index)} for index in range(3)]
+        bodies = self.renderer.render_many('accounts/mailers/forgot_password.html', contexts)
+        self.assertEqual(len(bodies), 3)
+        for index, body in enumerate(bodies):
+            self.assertIn('token-{}'.format(index), body)
+
+    def test_render_many_in_pool(self):
+        renderer = MailRenderer(pool_size=2)
+        contexts = [{'host': 'testserver', 'token': 'token-{}'.format(index)} for index in range(5)]
+        bodies = renderer.render_many('accounts/mailers/forgot_password.html', contexts, chunk_size=2)
+        self.assertEqual(bodies, self.renderer.render_many('accounts/mailers/forgot_password.html', contexts))
+        self.assertEqual(renderer.get_metrics()['render_count'], 5)
+
+    def test_metrics(self):
+        self.assertEqual(self.renderer.get_metrics(), {'render_count': 0, 'render_time_p50': None, 'render_time_p90': None, 'render_time_p99': None})
+        self.renderer.render('accounts/mailers/forgot_password.html', self.context)
+        self.renderer.render_many('accounts/mailers/forgot_password.html', [self.context] * 2)
+        metrics = self.renderer.get_metrics()
+        self.assertEqual(metrics['render_count'], 3)
+        self.assertLessEqual(metrics['render_time_p50'], metrics['render_time_p99'])
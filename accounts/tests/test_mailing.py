@@ -0,0 +1,140 @@
+# inbuilt python imports
+import smtplib
+import unittest
+
+# inbuilt django imports
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import override_settings
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..mailing import BatchMailer, build_html_mail, iter_chunks
+
+
+class CountingEmailBackend(EmailBackend):
+    opened_count = 0
+    send_calls = []
+
+    def open(self):
+        CountingEmailBackend.opened_count += 1
+
+    def send_messages(self, messages):
+        CountingEmailBackend.send_calls.append(len(messages))
+        return super(CountingEmailBackend, self).send_messages(messages)
+
+
+class FlakyEmailBackend(EmailBackend):
+    failures_left = 0
+
+    def send_messages(self, messages):
+        if FlakyEmailBackend.failures_left:
+            FlakyEmailBackend.failures_left -= 1
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        return super(FlakyEmailBackend, self).send_messages(messages)
+
+
+class RefusingEmailBackend(EmailBackend):
+    refused_recipient = None
+    disconnect_recipient = None
+
+    def send_messages(self, messages):
+        for message in messages:
+            if RefusingEmailBackend.refused_recipient in message.recipients():
+                raise smtplib.SMTPRecipientsRefused({RefusingEmailBackend.refused_recipient: (550, b'No such user')})
+            if RefusingEmailBackend.disconnect_recipient in message.recipients():
+                RefusingEmailBackend.disconnect_recipient = None
+                raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        return super(RefusingEmailBackend, self).send_messages(messages)
+
+
+class TestIterChunks(unittest.TestCase):
+
+    def test_splits_into_chunks(self):
+        self.assertEqual(list(iter_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_returns_nothing_for_empty_iterable(self):
+        self.assertEqual(list(iter_chunks([], 2)), [])
+
+
+class TestBatchMailer(unittest.TestCase):
+
+    def setUp(self):
+        settings_override = override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.CountingEmailBackend')  # Only SimpleTestCase Classes Can Be Decorated
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        mail.outbox = []
+        CountingEmailBackend.opened_count = 0
+        CountingEmailBackend.send_calls = []
+        self.mails = [build_html_mail(subject='Test', html_message='<p>Test</p>', from_email='info@sportsvitae.com', recipient_list=['user{}@test.com'.format(index)]) for index in range(25)]
+
+    def test_sends_all_mails(self):
+        self.assertEqual(BatchMailer(chunk_size=10, connection_count=1).send(self.mails), (25, 0))
+        self.assertEqual(len(mail.outbox), 25)
+
+    def test_sends_over_one_connection(self):
+        BatchMailer(chunk_size=10, connection_count=1).send(iter(self.mails))
+        self.assertEqual(sum(CountingEmailBackend.send_calls), 25)
+        self.assertEqual(CountingEmailBackend.opened_count, 1)
+
+    def test_uses_at_most_connection_count_connections(self):
+        self.assertEqual(BatchMailer(chunk_size=5, connection_count=2).send(self.mails), (25, 0))
+        self.assertLessEqual(CountingEmailBackend.opened_count, 2)
+
+    def test_sends_html_message(self):
+        BatchMailer(chunk_size=10, connection_count=1).send(self.mails[:1])
+        self.assertEqual(mail.outbox[0].alternatives, [('<p>Test</p>', 'text/html')])
+
+    def test_reports_progress(self):
+        progress = []
+        BatchMailer(chunk_size=10, connection_count=1, progress=lambda sent_count, failed_count: progress.append(sent_count)).send(self.mails)
+        self.assertEqual(progress, [10, 20, 25])
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.FlakyEmailBackend')
+    def test_reconnects_and_retries_failed_chunk(self):
+        FlakyEmailBackend.failures_left = 1
+        self.assertEqual(BatchMailer(chunk_size=10, connection_count=1, retries=1).send(self.mails), (25, 0))
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.FlakyEmailBackend')
+    def test_counts_chunk_failed_after_retries(self):
+        FlakyEmailBackend.failures_left = 2
+        self.assertEqual(BatchMailer(chunk_size=10, connection_count=1, retries=1).send(self.mails), (15, 10))
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.RefusingEmailBackend')
+    def test_counts_refused_recipient_failed_without_retrying(self):
+        RefusingEmailBackend.refused_recipient = 'user3@test.com'
+        RefusingEmailBackend.disconnect_recipient = None
+        self.assertEqual(BatchMailer(chunk_size=10, connection_count=1, retries=1).send(self.mails), (24, 1))
+        self.assertEqual(len(mail.outbox), 24)
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.FlakyEmailBackend')
+    def test_reports_only_delivered_mails(self):
+        FlakyEmailBackend.failures_left = 2
+        delivered_mails = []
+        BatchMailer(chunk_size=10, connection_count=1, retries=1, delivered=delivered_mails.extend).send(self.mails)
+        self.assertEqual(delivered_mails, self.mails[10:])
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.RefusingEmailBackend')
+    def test_does_not_report_refused_mail_delivered(self):
+        RefusingEmailBackend.refused_recipient = 'user3@test.com'
+        RefusingEmailBackend.disconnect_recipient = None
+        delivered_mails = []
+        BatchMailer(chunk_size=10, connection_count=1, retries=1, delivered=delivered_mails.extend).send(self.mails)
+        self.assertEqual(delivered_mails, self.mails[:3] + self.mails[4:])
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_mailing.RefusingEmailBackend')
+    def test_retries_only_undelivered_mails(self):
+        RefusingEmailBackend.refused_recipient = None
+        RefusingEmailBackend.disconnect_recipient = 'user5@test.com'
+        self.assertEqual(BatchMailer(chunk_size=10, connection_count=1, retries=1).send(self.mails), (25, 0))
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), sorted(message.to[0] for message in self.mails))
+
+    def test_keeps_connections_open_across_sends_in_with_block(self):
+        with BatchMailer(chunk_size=10, connection_count=1) as batch_mailer:
+            batch_mailer.send(self.mails[:10])
+            batch_mailer.send(self.mails[10:])
+        self.assertEqual(CountingEmailBackend.opened_count, 1)
+        self.assertEqual(len(mail.outbox), 25)
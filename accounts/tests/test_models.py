@@ -16,7 +16,7 @@ import pytest
 from sportsvitae.shared.factories import UserFactory, MidoutUserFactory, CricketerFactory, ForeignUserFactory, FriendRequestFactory, MessageFactory, UserWallPostFactory, UserWallPostCommentFactory, CricketMatchStatFactory, CricketMatchBattingStatFactory, CricketMatchBowlingStatFactory, CricketTeamFactory, CricketMatchFactory, CricketTeamMemberFactory
 
 # local imports
-from ..models import User, FriendRequest, Message, UserWallPost, UserWallPostComment
+from ..models import User, Conversation, FriendRequest, Message, UserWallPost, UserWallPostComment
 from cricket.models import CricketMatchBattingStat, CricketMatchBowlingStat
 
 @pytest.mark.django_db
@@ -1254,3 +1254,56 @@ class TestUserWallPostComment(unittest.TestCase):
 
     def test_sent_on_date_set_automatically(self):
         self.assertTrue(self.message.sent_on)
+
+
+@pytest.mark.django_db
+class TestConversation(unittest.TestCase):
+
+    def setUp(self):
+        self.user = UserFactory()
+        self.friend = UserFactory()
+
+    def test_message_creates_one_conversation_per_pair(self):
+        MessageFactory(sender=self.user, recipient=self.friend)
+        MessageFactory(sender=self.friend, recipient=self.user)
+        self.assertEqual(Conversation.objects.filter(**Conversation.objects.get_pair_filter(self.user.id, self.friend.id)).count(), 1)
+
+    def test_conversation_tracks_last_message_and_unread_counts(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        message = MessageFactory(sender=self.friend, recipient=self.user)
+        conversation = Conversation.objects.get(**Conversation.objects.get_pair_filter(self.user.id, self.friend.id))
+        self.assertEqual(conversation.last_message, message)
+        self.assertEqual(conversation.last_message_on, message.sent_on)
+        self.assertEqual(conversation.get_unread_count(self.user), 2)
+        self.assertEqual(conversation.get_unread_count(self.friend), 0)
+
+    def test_mark_read_clears_unread_count(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        Conversation.objects.mark_read(self.user, [self.friend.id])
+        conversation = Conversation.objects.get(**Conversation.objects.get_pair_filter(self.user.id, self.friend.id))
+        self.assertEqual(conversation.get_unread_count(self.user), 0)
+
+    def test_inbox_is_ordered_by_latest_message(self):
+        other_friend = UserFactory()
+        MessageFactory(sender=self.friend, recipient=self.user)
+        MessageFactory(sender=other_friend, recipient=self.user)
+        inbox = list(Conversation.objects.get_inbox(self.user))
+        self.assertEqual([conversation.get_other_user(self.user) for conversation in inbox], [other_friend, self.friend])
+
+    def test_deleted_history_is_hidden_until_next_message(self):
+        MessageFactory(sender=self.friend, recipient=self.user)
+        Conversation.objects.delete_history(self.user, self.friend.id)
+        self.assertEqual(list(Conversation.objects.get_inbox(self.user)), [])
+        self.assertEqual(len(Conversation.objects.get_inbox(self.friend)), 1)
+
+        MessageFactory(sender=self.friend, recipient=self.user)
+        conversation = Conversation.objects.get_inbox(self.user).get()
+        self.assertEqual(conversation.get_unread_count(self.user), 1)
+
+    def test_chat_history_is_bounded_by_deleted_marker(self):
+        MessageFactory(sender=self.user, recipient=self.friend)
+        MessageFactory(sender=self.friend, recipient=self.user)
+        Conversation.objects.delete_history(self.user, self.friend.id)
+        message = MessageFactory(sender=self.friend, recipient=self.user)
+        self.assertEqual(list(Message.objects.get_chat_history(self.user, self.friend.id)), [message])
+        self.assertEqual(Message.objects.get_chat_history(self.friend, self.user.id).count(), 3)
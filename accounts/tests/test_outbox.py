@@ -0,0 +1,97 @@
+# inbuilt python imports
+import smtplib
+import unittest
+from datetime import timedelta
+
+# inbuilt django imports
+from django.conf import settings
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from sportsvitae.shared.factories import UserFactory
+
+# local imports
+from ..models import OutboxMail
+from ..outbox import queue_mail, claim_due_mails, drain_outbox, get_retry_delay
+from ..utils import send_forgot_password_mail
+
+
+class FailingEmailBackend(BaseEmailBackend):
+
+    def send_messages(self, email_messages):
+        raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+
+
+class TestGetRetryDelay(unittest.TestCase):
+
+    def test_doubles_delay_on_each_attempt(self):
+        for attempts in (1, 2, 3):
+            delay = get_retry_delay(attempts).total_seconds()
+            base_delay = settings.MAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+            self.assertGreaterEqual(delay, base_delay)
+            self.assertLessEqual(delay, base_delay * 1.1)
+
+    def test_caps_delay(self):
+        self.assertLessEqual(get_retry_delay(100).total_seconds(), settings.MAIL_OUTBOX_RETRY_MAX_SECONDS * 1.1)
+
+
+@pytest.mark.django_db
+class TestOutbox(unittest.TestCase):
+
+    def setUp(self):
+        mail.outbox = []
+        self.user = UserFactory()
+
+    def queue_test_mail(self):
+        return queue_mail(subject='Test', html_message='<p>Test</p>', from_email='support@sportsvitae.com', recipient_list=[self.user.email])
+
+    def test_mailer_queues_mail_without_sending(self):
+        send_forgot_password_mail(self.user)
+        self.assertEqual(OutboxMail.objects.filter(status=OutboxMail.PENDING).count(), 1)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_drain_sends_queued_mail(self):
+        self.queue_test_mail()
+        self.assertEqual(drain_outbox(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, [self.user.email])
+        self.assertEqual(OutboxMail.objects.get().status, OutboxMail.SENT)
+
+    def test_drain_does_not_resend_sent_mail(self):
+        self.queue_test_mail()
+        drain_outbox()
+        self.assertEqual(drain_outbox(), (0, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_claimed_mail_not_claimed_again(self):
+        self.queue_test_mail()
+        self.assertEqual(len(claim_due_mails(10)), 1)
+        self.assertEqual(len(claim_due_mails(10)), 0)
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_outbox.FailingEmailBackend')
+    def test_failed_mail_retried_with_backoff(self):
+        self.queue_test_mail()
+        self.assertEqual(drain_outbox(), (0, 1))
+        outbox_mail = OutboxMail.objects.get()
+        self.assertEqual(outbox_mail.status, OutboxMail.PENDING)
+        self.assertEqual(outbox_mail.attempts, 1)
+        self.assertIn('SMTPServerDisconnected', outbox_mail.last_error)
+        self.assertGreater(outbox_mail.next_attempt_on, timezone.now() + timedelta(seconds=settings.MAIL_OUTBOX_RETRY_BASE_SECONDS - 5))
+
+    @override_settings(EMAIL_BACKEND='accounts.tests.test_outbox.FailingEmailBackend', MAIL_OUTBOX_MAX_ATTEMPTS=1)
+    def test_mail_marked_failed_after_max_attempts(self):
+        self.queue_test_mail()
+        drain_outbox()
+        self.assertEqual(OutboxMail.objects.get().status, OutboxMail.FAILED)
+
+    def test_worker_command_sends_queued_mail(self):
+        self.queue_test_mail()
+        call_command('send_queued_mails', once=True, concurrency=1)
+        self.assertEqual(len(mail.outbox), 1)
@@ -0,0 +1,97 @@
+# inbuilt python imports
+import unittest
+from datetime import timedelta
+
+# inbuilt django imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from sportsvitae.shared.factories import UserFactory
+
+# local imports
+from ..models import User, RevokedToken
+from ..revocation import BloomFilter, TokenRevocationStore, get_token_hash, get_token_expires_on
+from ..utils import encode_token, encode_legacy_token
+
+
+class TestBloomFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.bloom_filter = BloomFilter(capacity=1000, error_rate=0.001)
+        self.token_hashes = [get_token_hash(str(index)) for index in range(1000)]
+        for token_hash in self.token_hashes:
+            self.bloom_filter.add(token_hash)
+
+    def test_contains_added_hashes(self):
+        for token_hash in self.token_hashes:
+            self.assertIn(token_hash, self.bloom_filter)
+
+    def test_false_positive_rate_within_error_rate(self):
+        other_token_hashes = [get_token_hash('other {}'.format(index)) for index in range(10000)]
+        false_positives = sum(1 for token_hash in other_token_hashes if token_hash in self.bloom_filter)
+        self.assertLess(false_positives, 50)
+
+    def test_counts_added_hashes(self):
+        self.assertEqual(self.bloom_filter.count, 1000)
+
+
+class TestGetTokenExpiresOn(unittest.TestCase):
+
+    def test_returns_expiry_of_signed_token(self):
+        token = encode_token(User(id=1), 1, days=2)
+        expires_on = get_token_expires_on(token)
+        self.assertAlmostEqual((expires_on - timezone.now()).total_seconds(), 2 * 86400, delta=5)
+
+    def test_returns_expiry_limit_for_legacy_token(self):
+        token = encode_legacy_token(email='a@a.com', token_type=1, days=2)
+        self.assertGreater(get_token_expires_on(token), timezone.now() + timedelta(days=2))
+
+
+@pytest.mark.django_db
+class TestTokenRevocationStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = TokenRevocationStore()
+        self.user = UserFactory()
+        self.token = encode_token(self.user, 1)
+
+    def test_token_not_revoked(self):
+        self.assertFalse(self.store.is_revoked(self.token))
+
+    def test_revoked_token(self):
+        self.store.revoke(self.token)
+        self.assertTrue(self.store.is_revoked(self.token))
+
+    def test_revoke_returns_false_if_already_revoked(self):
+        self.assertTrue(self.store.revoke(self.token))
+        self.assertFalse(self.store.revoke(self.token))
+
+    def test_stores_token_hash_only(self):
+        self.store.revoke(self.token)
+        self.assertFalse(RevokedToken.objects.filter(token_hash=self.token).exists())
+        self.assertTrue(RevokedToken.objects.filter(token_hash=get_token_hash(self.token)).exists())
+
+    def test_does_not_query_db_for_token_never_revoked(self):
+        self.store.revoke(encode_token(self.user, 1, days=1))
+        with CaptureQueriesContext(connection) as queries:
+            self.assertFalse(self.store.is_revoked(self.token))
+        self.assertEqual(len(queries), 0)
+
+    def test_picks_up_tokens_revoked_by_other_processes(self):
+        self.assertFalse(self.store.is_revoked(self.token))
+        TokenRevocationStore().revoke(self.token)
+        self.store.synced_on -= timedelta(days=1)
+        self.assertTrue(self.store.is_revoked(self.token))
+
+    def test_prunes_expired_tokens(self):
+        expired_token = encode_token(self.user, 1, days=-1)
+        self.store.revoke(expired_token)
+        self.store.revoke(self.token)
+        self.assertEqual(self.store.prune(), 1)
+        self.assertTrue(self.store.is_revoked(self.token))
+        self.assertFalse(self.store.is_revoked(expired_token))
@@ -0,0 +1,81 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from sportsvitae.shared.factories import UserFactory
+
+# local imports
+from ..models import User, UserStats
+from ..stats import get_registered_user_count, rebuild_user_stats
+
+
+@pytest.mark.django_db
+class TestUserStats(unittest.TestCase):
+
+    def setUp(self):
+        User.objects.all().delete()
+        UserStats.objects.all().delete()
+        self.user = UserFactory(is_email_verified=True, registration_midout=False)
+        UserFactory(is_email_verified=False, registration_midout=False)
+
+    def tearDown(self):
+        UserStats.objects.all().delete()
+
+    def test_counts_registered_users(self):
+        self.assertEqual(get_registered_user_count(), 1)
+
+    def test_reads_count_without_scanning_users(self):
+        get_registered_user_count()
+        with CaptureQueriesContext(connection) as queries:
+            get_registered_user_count()
+        self.assertEqual(len(queries), 1)
+        self.assertNotRegex(queries[0]['sql'], r'\baccounts_user\b')  # accounts_userstats Does Not Match
+
+    def test_completing_registration_increments_count(self):
+        user = UserFactory(is_email_verified=True, registration_midout=True)
+        self.assertEqual(get_registered_user_count(), 1)
+        user.registration_midout = False
+        user.save()
+        self.assertEqual(get_registered_user_count(), 2)
+
+    def test_saving_unchanged_user_keeps_count(self):
+        user = User.objects.get(id=self.user.id)
+        user.first_name = 'Arya'
+        user.save()
+        self.assertEqual(get_registered_user_count(), 1)
+
+    def test_saving_user_loaded_without_fields_keeps_count(self):
+        user = User.objects.only('id', 'first_name').get(id=self.user.id)
+        user.first_name = 'Arya'
+        user.save()
+        self.assertEqual(get_registered_user_count(), 1)
+
+    def test_changing_user_loaded_without_fields_moves_count(self):
+        user = User.objects.only('id').get(id=self.user.id)
+        user.registration_midout = True
+        user.save(update_fields=['registration_midout'])
+        self.assertEqual(get_registered_user_count(), 0)
+
+    def test_saving_user_does_not_count_users(self):
+        for user in (User.objects.get(id=self.user.id), User.objects.only('id').get(id=self.user.id)):
+            user.registration_midout = True
+            with CaptureQueriesContext(connection) as queries:
+                user.save()
+            self.assertFalse([query for query in queries if 'COUNT(' in query['sql']])
+
+    def test_deleting_user_decrements_count(self):
+        User.objects.get(id=self.user.id).delete()
+        self.assertEqual(get_registered_user_count(), 0)
+
+    def test_rebuild_corrects_updates_without_signals(self):
+        User.objects.update(is_email_verified=True)
+        self.assertEqual(get_registered_user_count(), 1)
+        self.assertEqual(rebuild_user_stats(), 2)
+        self.assertEqual(get_registered_user_count(), 2)
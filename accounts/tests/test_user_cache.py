@@ -0,0 +1,106 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from sportsvitae.shared.factories import UserFactory
+
+# local imports
+from ..backends import EmailAuthenticationBackend
+from ..models import User
+from ..user_cache import UserCache, USER_CACHE
+
+
+class TestUserCache(unittest.TestCase):
+
+    def setUp(self):
+        self.user = User(id=1, email='test@test.com')
+        self.loaded_user_ids = []
+        self.user_cache = UserCache(max_size=2, ttl=60)
+
+    def load_user(self, user_id):
+        self.loaded_user_ids.append(user_id)
+        return User(id=user_id, email='test{}@test.com'.format(user_id))
+
+    def test_loads_user_once(self):
+        self.user_cache.get(1, self.load_user)
+        self.user_cache.get(1, self.load_user)
+        self.assertEqual(self.loaded_user_ids, [1])
+
+    def test_returns_new_instance_on_each_hit(self):
+        first_user = self.user_cache.get(1, self.load_user)
+        second_user = self.user_cache.get(1, self.load_user)
+        self.assertEqual(first_user, second_user)
+        self.assertIsNot(first_user, second_user)
+
+    def test_evicts_least_recently_used_user(self):
+        self.user_cache.get(1, self.load_user)
+        self.user_cache.get(2, self.load_user)
+        self.user_cache.get(1, self.load_user)
+        self.user_cache.get(3, self.load_user)
+        self.user_cache.get(1, self.load_user)
+        self.user_cache.get(2, self.load_user)
+        self.assertEqual(self.loaded_user_ids, [1, 2, 3, 2])
+
+    def test_reloads_expired_user(self):
+        user_cache = UserCache(max_size=2, ttl=-1)
+        user_cache.get(1, self.load_user)
+        user_cache.get(1, self.load_user)
+        self.assertEqual(self.loaded_user_ids, [1, 1])
+
+    def test_reloads_invalidated_user(self):
+        self.user_cache.get(1, self.load_user)
+        self.user_cache.invalidate(1)
+        self.user_cache.get(1, self.load_user)
+        self.assertEqual(self.loaded_user_ids, [1, 1])
+
+    def test_does_not_cache_missing_user(self):
+        self.assertIsNone(self.user_cache.get(1, lambda user_id: None))
+        self.user_cache.get(1, self.load_user)
+        self.assertEqual(self.loaded_user_ids, [1])
+
+
+@pytest.mark.django_db
+class TestCachedGetUser(unittest.TestCase):
+
+    def setUp(self):
+        settings_override = override_settings(USER_CACHE_ENABLED=True)  # Only SimpleTestCase Classes Can Be Decorated
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        USER_CACHE.clear()
+        self.user = UserFactory()
+        self.email_backend = EmailAuthenticationBackend()
+
+    def test_returns_user_with_pk(self):
+        self.assertEqual(self.email_backend.get_user(self.user.id), self.user)
+
+    def test_returns_user_with_pk_from_session(self):
+        self.assertEqual(self.email_backend.get_user(str(self.user.id)), self.user)
+
+    def test_does_not_return_user_with_invalid_pk(self):
+        self.assertIsNone(self.email_backend.get_user(999))
+        self.assertIsNone(self.email_backend.get_user('abc'))
+
+    def test_does_not_query_db_for_cached_user(self):
+        self.email_backend.get_user(self.user.id)
+        with CaptureQueriesContext(connection) as queries:
+            self.email_backend.get_user(self.user.id)
+        self.assertEqual(len(queries), 0)
+
+    def test_returns_saved_changes(self):
+        self.email_backend.get_user(self.user.id)
+        self.user.first_name = 'Changed'
+        self.user.save()
+        self.assertEqual(self.email_backend.get_user(self.user.id).first_name, 'Changed')
+
+    def test_does_not_return_deleted_user(self):
+        self.email_backend.get_user(self.user.id)
+        User.objects.get(pk=self.user.id).delete()
+        self.assertIsNone(self.email_backend.get_user(self.user.id))
@@ -1,9 +1,13 @@
 # inbuilt python imports
+import types
 import unittest
 from datetime import datetime
 import base64
 
 # inbuilt django imports
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 
 # third-party django imports
 import pytest
@@ -15,7 +19,7 @@ from Crypto.Cipher import XOR
 from sportsvitae.shared.factories import UserFactory
 
 # local imports
-from ..utils import get_first_and_last_name, encode_token, decode_token, is_token_valid
+from ..utils import TOKEN_SEPARATOR, TOKEN_SIGNER, get_first_and_last_name, encode_token, encode_tokens, encode_legacy_token, read_signed_token, decode_token, is_token_valid
 from ..models import User
 
 
@@ -81,16 +85,65 @@ class TestFullNameSplitter(unittest.TestCase):
 class TestEncodeToken(unittest.TestCase):
 
     def setUp(self):
-        self.email = 'test@test.com'
+        self.user = User(id=1, email='test@test.com')
         self.token_type = 1
 
     def test_returns_token(self):
-        self.assertTrue(encode_token(email=self.email, token_type=self.token_type))
+        self.assertTrue(encode_token(user=self.user, token_type=self.token_type))
 
     def test_returns_token_as_string(self):
-        token = encode_token(email=self.email, token_type=self.token_type)
+        token = encode_token(user=self.user, token_type=self.token_type)
         self.assertTrue(isinstance(token, str))
 
+    def test_returns_url_safe_token(self):
+        token = encode_token(user=self.user, token_type=self.token_type)
+        self.assertRegex(token, r'^[\w.:-]+$')
+
+
+class TestEncodeTokens(unittest.TestCase):
+
+    def setUp(self):
+        self.users = [User(id=user_id) for user_id in range(1, 6)]
+        self.token_type = 1
+
+    def test_returns_generator(self):
+        self.assertTrue(isinstance(encode_tokens(self.users, self.token_type), types.GeneratorType))
+
+    def test_yields_user_with_token(self):
+        users = [user for user, token in encode_tokens(self.users, self.token_type)]
+        self.assertEqual(users, self.users)
+
+    def test_yields_tokens_signed_by_token_signer(self):
+        for user, token in encode_tokens(self.users, self.token_type):
+            value = token.rsplit(TOKEN_SEPARATOR, 1)[0]
+            self.assertTrue(value.startswith('{}.{}.'.format(user.id, self.token_type)))
+            self.assertEqual(token, TOKEN_SIGNER.sign(value))
+
+    def test_yields_readable_tokens(self):
+        for user, token in encode_tokens(self.users, self.token_type):
+            self.assertEqual(read_signed_token(token), (user.id, self.token_type, False))
+
+
+class TestReadSignedToken(unittest.TestCase):
+
+    def setUp(self):
+        self.user = User(id=7, email='test@test.com')
+        self.token = encode_token(user=self.user, token_type=1)
+
+    def test_returns_user_id_token_type_and_expiry(self):
+        self.assertEqual(read_signed_token(self.token), (7, 1, False))
+
+    def test_returns_expired_flag(self):
+        token = encode_token(user=self.user, token_type=1, days=-1)
+        self.assertEqual(read_signed_token(token), (7, 1, True))
+
+    def test_returns_none_for_tampered_token(self):
+        tampered_token = self.token.replace('7.', '8.', 1)
+        self.assertIsNone(read_signed_token(tampered_token))
+
+    def test_returns_none_for_garbage(self):
+        self.assertIsNone(read_signed_token('garbage:token'))
+
 
 @pytest.mark.django_db
 class TestDecodeToken(unittest.TestCase):
@@ -99,7 +152,7 @@ class TestDecodeToken(unittest.TestCase):
         self.user = UserFactory()
         self.email = self.user.email
         self.token_type = 1
-        self.token = encode_token(email=self.email, token_type=self.token_type)
+        self.token = encode_token(user=self.user, token_type=self.token_type)
 
     def test_decodes_token(self):
         user, token_type, token_expired = decode_token(self.token)
@@ -125,42 +178,47 @@ class TestDecodeToken(unittest.TestCase):
         token_bytestring = bytes(self.token, 'utf-8')
         self.assertRaises(TypeError, decode_token, token_bytestring)
 
-    def test_does_not_return_user_for_token_from_non_existent_email(self):
-        self.email = 'a@a.com'
-        token = encode_token(email=self.email, token_type=self.token_type)
+    def test_does_not_return_user_for_token_from_non_existent_user(self):
+        token = encode_token(user=User(id=999999), token_type=self.token_type)
         user, token_type, token_expired = decode_token(token)
         self.assertIsNone(user)
-
-    def test_does_not_return_token_type_for_token_from_non_existent_email(self):
-        self.email = 'a@a.com'
-        token = encode_token(email=self.email, token_type=self.token_type)
-        user, token_type, token_expired = decode_token(token)
         self.assertIsNone(token_type)
+        self.assertTrue(token_expired)
 
-    def test_returns_token_expired_for_token_from_non_existent_email(self):
-        self.email = 'a@a.com'
-        token = encode_token(email=self.email, token_type=self.token_type)
-        user, token_type, token_expired = decode_token(token)
+    def test_does_not_query_db_for_expired_token(self):
+        token = encode_token(user=self.user, token_type=self.token_type, days=-1)
+        with CaptureQueriesContext(connection) as queries:
+            user, token_type, token_expired = decode_token(token)
+        self.assertEqual(len(queries), 0)
         self.assertTrue(token_expired)
 
-    def test_does_not_return_user_for_token_from_invalid_email(self):
-        self.email = 'invalid_email'
-        token = encode_token(email=self.email, token_type=self.token_type)
+    def test_decodes_legacy_token(self):
+        token = encode_legacy_token(email=self.email, token_type=self.token_type)
         user, token_type, token_expired = decode_token(token)
-        self.assertIsNone(user)
+        self.assertEqual(user, self.user)
+        self.assertEqual(token_type, self.token_type)
+        self.assertFalse(token_expired)
 
-    def test_does_not_return_token_type_for_token_from_invalid_email(self):
-        self.email = 'invalid_email'
-        token = encode_token(email=self.email, token_type=self.token_type)
+    def test_does_not_return_user_for_legacy_token_from_non_existent_email(self):
+        token = encode_legacy_token(email='a@a.com', token_type=self.token_type)
         user, token_type, token_expired = decode_token(token)
+        self.assertIsNone(user)
         self.assertIsNone(token_type)
+        self.assertTrue(token_expired)
 
-    def test_returns_token_expired_for_token_from_invalid_email(self):
-        self.email = 'invalid_email'
-        token = encode_token(email=self.email, token_type=self.token_type)
+    def test_does_not_return_user_for_legacy_token_from_invalid_email(self):
+        token = encode_legacy_token(email='invalid_email', token_type=self.token_type)
         user, token_type, token_expired = decode_token(token)
+        self.assertIsNone(user)
+        self.assertIsNone(token_type)
         self.assertTrue(token_expired)
 
+    def test_rejects_legacy_token_after_migration_window(self):
+        token = encode_legacy_token(email=self.email, token_type=self.token_type)
+        with override_settings(ACCEPT_LEGACY_TOKENS=False):
+            user, token_type, token_expired = decode_token(token)
+        self.assertIsNone(user)
+
 
 @pytest.mark.django_db
 class TestIsTokenValid(unittest.TestCase):
@@ -177,12 +235,18 @@ class TestIsTokenValid(unittest.TestCase):
         self.expired_token = base64.urlsafe_b64encode(self.expired_token).decode('utf-8')
 
     def test_returns_valid_token(self):
-        token = encode_token(email=self.email, token_type=self.token_type)
+        token = encode_token(user=self.user, token_type=self.token_type)
         self.assertTrue(is_token_valid(token))
 
-    def test_returns_false_if_no_user_exists(self):
+    def test_validates_signed_token_without_db(self):
+        token = encode_token(user=self.user, token_type=self.token_type)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(is_token_valid(token))
+        self.assertEqual(len(queries), 0)
+
+    def test_returns_false_if_no_user_exists_for_legacy_token(self):
         User.objects.all().delete()
-        token = encode_token(email=self.email, token_type=self.token_type)
+        token = encode_legacy_token(email=self.email, token_type=self.token_type)
         self.assertFalse(is_token_valid(token))
 
     def test_returns_false_if_token_expired(self):
@@ -11,6 +11,8 @@ from django.db.utils import IntegrityError
 from django.core.urlresolvers import reverse, reverse_lazy
 from django.core.files.uploadedfile import SimpleUploadedFile
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 # third-party django imports
 import pytest
@@ -23,6 +25,12 @@ from sportsvitae.shared.factories import UserFactory, MidoutUserFactory, Cricket
 from ..models import User, FriendRequest, Message
 from ..utils import encode_token
 
+
+# Fetch User 1, New Session Key Check 1, Session Insert 3 (With Savepoints),
+# last_login Update 1, Session Save On Response 3 (With Savepoints)
+MAX_SUCCESSFUL_LOGIN_QUERIES = 9
+
+
 @pytest.mark.django_db
 class TestHomePageView(unittest.TestCase):
 
@@ -523,6 +531,22 @@ class TestLoginView(unittest.TestCase):
         self.assertIn('form', response.context)
         self.assertFalse(response.context['form'].is_valid())
 
+    def test_successful_login_fetches_user_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, self.login_post_data)
+        user_selects = [query for query in queries if query['sql'].startswith('SELECT') and 'FROM "accounts_user"' in query['sql']]
+        self.assertEqual(len(user_selects), 1)
+
+    def test_successful_login_query_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(self.url, self.login_post_data)
+        self.assertLessEqual(len(queries), MAX_SUCCESSFUL_LOGIN_QUERIES)
+
+    def test_reports_login_phase_timings(self):
+        response = self.client.post(self.url, self.login_post_data)
+        for phase in ('authenticate', 'login'):
+            self.assertIn('{};dur='.format(phase), response['Server-Timing'])
+
 
 @pytest.mark.django_db
 class TestLogoutView(unittest.TestCase):
@@ -886,7 +910,7 @@ class TestEmailVerificationView(unittest.TestCase):
     def setUp(self):
         self.client = Client()
         self.user = UserFactory(is_email_verified=False)
-        self.token = encode_token(self.user.email, 1)
+        self.token = encode_token(self.user, 1)
         self.url = reverse('email_verification', kwargs={'token': self.token})
         self.response = self.client.get(self.url)
 
@@ -907,11 +931,19 @@ class TestEmailVerificationView(unittest.TestCase):
         self.assertEqual(response_url, reverse('profile_specific_registration'))
 
     def test_user_gets_loggedin(self):
-        self.client.session.flush()
-        response = self.client.get(self.url)
         self.assertTrue(self.client.session.has_key('_auth_user_id'))
         self.assertEqual(self.client.session['_auth_user_id'], str(self.user.id))
 
+    def test_token_used_up_when_link_opened(self):
+        client = Client()
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(client.session.has_key('_auth_user_id'))
+
+    def test_session_that_opened_link_can_reopen_it(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
     def test_sets_is_email_verified_flag(self):
         self.assertFalse(self.user.is_email_verified)
         response = self.client.get(self.url)
@@ -919,7 +951,7 @@ class TestEmailVerificationView(unittest.TestCase):
         self.assertTrue(self.user.is_email_verified)
 
     def test_redirects_to_homepage_if_invalid_token(self):
-        token = encode_token('a@a.com', 1)
+        token = encode_token(User(id=999999, email='a@a.com'), 1)
         url = reverse('email_verification', kwargs={'token': token})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 302)
@@ -977,7 +1009,7 @@ class TestChangePasswordView(unittest.TestCase):
     def setUp(self):
         self.client = Client()
         self.user = UserFactory()
-        self.token = encode_token(self.user.email, 1)
+        self.token = encode_token(self.user, 1)
         self.url = reverse('change_password', kwargs={'token': self.token})
         self.response = self.client.get(self.url)
 
@@ -1000,13 +1032,21 @@ class TestChangePasswordView(unittest.TestCase):
         self.assertIn('accounts/change_password.html', self.response.template_name)
 
     def test_user_gets_loggedin(self):
-        self.client.session.flush()
-        response = self.client.get(self.url)
         self.assertTrue(self.client.session.has_key('_auth_user_id'))
         self.assertEqual(self.client.session['_auth_user_id'], str(self.user.id))
 
+    def test_token_used_up_when_link_opened(self):
+        client = Client()
+        response = client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(client.session.has_key('_auth_user_id'))
+
+    def test_session_that_opened_link_can_reopen_it(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+
     def test_redirects_to_homepage_if_invalid_token(self):
-        token = encode_token('a@a.com', 1)
+        token = encode_token(User(id=999999, email='a@a.com'), 1)
         url = reverse('email_verification', kwargs={'token': token})
         response = self.client.get(url)
         self.assertEqual(response.status_code, 302)
@@ -1052,6 +1092,13 @@ class TestChangePasswordView(unittest.TestCase):
         response_url = response.url.replace(settings.TEST_SERVER_DOMAIN, '')
         self.assertEqual(response_url, reverse('my_wall'))
 
+    def test_token_cannot_be_reused_after_password_changed(self):
+        self.client.post(self.url, self.post_data)
+        self.client.session.flush()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(self.client.session.has_key('_auth_user_id'))
+
 
 @pytest.mark.django_db
 class TestEditUserProfileView(unittest.TestCase):
@@ -0,0 +1,146 @@
+"""
+User Cache
+
+Authentication Backends Fetch request.user On Every Authenticated Request.
+With USER_CACHE_ENABLED the User Is Kept in a Process Local LRU For
+USER_CACHE_TTL Seconds, And Optionally in the Shared Cache Named By
+USER_CACHE_SHARED_ALIAS, Instead of Being Queried Each Time.
+
+Saving Or Deleting a User Evicts It From the Local LRU And the Shared Cache.
+Other Processes' LRUs Expire Within USER_CACHE_TTL, So Keep It Short.
+"""
+
+# Python Imports
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+# Django Imports
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+class UserCache(object):
+    """
+    Process Local LRU of Pickled Users With a TTL. Every Hit Unpickles a Fresh
+    Instance, So Requests Never Share (And Mutate) the Same User Object.
+    """
+
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.invalidation_count = 0
+
+    def get_shared_cache(self):
+        if not settings.USER_CACHE_SHARED_ALIAS:
+            return None
+        return caches[settings.USER_CACHE_SHARED_ALIAS]
+
+    def get_shared_key(self, user_id):
+        return 'accounts.user.{}'.format(user_id)
+
+    def get_local(self, user_id):
+        with self.lock:
+            entry = self.entries.get(user_id)
+            if entry is None:
+                return None
+
+            pickled_user, expires_at = entry
+            if expires_at < time.monotonic():
+                del self.entries[user_id]
+                return None
+
+            self.entries.move_to_end(user_id)
+            return pickled_user
+
+    def set_local(self, user_id, pickled_user, invalidation_count):
+        with self.lock:
+            if invalidation_count != self.invalidation_count:
+                return  # A User Was Saved While This One Was Being Read, It May Be Stale
+
+            self.entries[user_id] = (pickled_user, time.monotonic() + self.ttl)
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def get(self, user_id, load_user):
+        """
+        Returns the User From the Local LRU, Then the Shared Cache, Then
+        `load_user(user_id)` (Which Returns None If There Is No Such User).
+        """
+        pickled_user = self.get_local(user_id)
+        if pickled_user is not None:
+            return pickle.loads(pickled_user)
+
+        invalidation_count = self.invalidation_count
+        shared_cache = self.get_shared_cache()
+        pickled_user = shared_cache.get(self.get_shared_key(user_id)) if shared_cache else None
+
+        if pickled_user is None:
+            user = load_user(user_id)
+            if user is None:
+                return None
+            pickled_user = pickle.dumps(user, pickle.HIGHEST_PROTOCOL)
+            if shared_cache:
+                shared_cache.set(self.get_shared_key(user_id), pickled_user, self.ttl)
+
+        self.set_local(user_id, pickled_user, invalidation_count)
+        return pickle.loads(pickled_user)
+
+    def invalidate(self, user_id):
+        with self.lock:
+            self.invalidation_count += 1
+            self.entries.pop(user_id, None)
+
+        shared_cache = self.get_shared_cache()
+        if shared_cache:
+            shared_cache.delete(self.get_shared_key(user_id))
+
+    def clear(self):
+        with self.lock:
+            self.invalidation_count += 1
+            self.entries.clear()
+
+
+USER_CACHE = UserCache(max_size=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+
+
+def load_user(user_id):
+    UserModel = get_user_model()
+    try:
+        return UserModel.objects.get(pk=user_id)
+    except UserModel.DoesNotExist:
+        return None
+
+
+def get_user_by_id(user_id):
+    """
+    Returns a User Against a Given User Id, From the User Cache If Enabled
+    """
+    if not settings.USER_CACHE_ENABLED:
+        return load_user(user_id)
+
+    try:
+        user_id = get_user_model()._meta.pk.to_python(user_id)  # Session Ids Are Strings
+    except ValidationError:
+        return None
+    return USER_CACHE.get(user_id, load_user)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    USER_CACHE.invalidate(instance.pk)
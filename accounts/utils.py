@@ -1,12 +1,14 @@
 # Python Imports
 import base64
+import time
 from datetime import datetime, timedelta
 
 # Django Imports
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.core import signing
+from django.utils.crypto import salted_hmac
+from django.utils.http import base36_to_int, int_to_base36
 
 # Third Party Django Imports
 from Crypto.Cipher import XOR
@@ -14,6 +16,15 @@ from Crypto.Cipher import XOR
 # Inter App Imports
 
 # Local Imports
+from .digests import NEW_USER_DIGEST
+from .mail_rendering import render_mail
+from .outbox import queue_mail
+from .stats import get_registered_user_count
+
+
+TOKEN_SALT = 'accounts.utils.token'
+TOKEN_SEPARATOR = ':'
+TOKEN_SIGNER = signing.Signer(sep=TOKEN_SEPARATOR, salt=TOKEN_SALT)
 
 
 def get_first_and_last_name(name):
@@ -36,9 +47,41 @@ def get_first_and_last_name(name):
     return name, ''
 
 
-def encode_token(email, token_type, days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT, hours=0):
+def encode_token(user, token_type, days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT, hours=0):
     """
     Encodes token. Used for autologin token in emails
+
+    Token is `<user id>.<token type>.<expiry timestamp in base36>:<signature>`,
+    signed with HMAC over SECRET_KEY, so it is verified without the db.
+    """
+    user, token = next(encode_tokens([user], token_type, days=days, hours=hours))
+    return token
+
+
+def encode_tokens(users, token_type, days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT, hours=0):
+    """
+    Encodes tokens for many users at once. Used for mass mails
+
+    The expiry and the salted HMAC key are computed once for the batch, each
+    token copies the keyed HMAC. The tokens are the same as TOKEN_SIGNER.sign
+    makes. Yields (user, token) pairs as it goes, so users may be a lazily
+    iterated queryset.
+    """
+    token_expiry_timestamp = int(time.time()) + days * 86400 + hours * 3600
+    value_suffix = '.{token_type}.{token_expiry}'.format(token_type=token_type, token_expiry=int_to_base36(token_expiry_timestamp))
+    signer_hmac = salted_hmac(TOKEN_SALT + 'signer', '', settings.SECRET_KEY)  # As Signer.signature Keys It
+
+    for user in users:
+        value = str(user.id) + value_suffix
+        token_hmac = signer_hmac.copy()
+        token_hmac.update(value.encode('utf-8'))
+        yield user, value + TOKEN_SEPARATOR + signing.b64_encode(token_hmac.digest()).decode('ascii')
+
+
+def encode_legacy_token(email, token_type, days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT, hours=0):
+    """
+    Encodes token in the old XOR format. Only kept to test decoding of old
+    tokens during the migration window.
     """
 
     token_expiry_date = (datetime.now() + timedelta(days=days, hours=hours)).strftime(settings.TOKEN_DATE_FORMAT)
@@ -53,14 +96,45 @@ def encode_token(email, token_type, days=settings.EMAIL_TOKEN_EXPIRY_DAYS_LIMIT,
     return encoded_token
 
 
-def decode_token(token):
+def unsign_token(token):
     """
-    Decodes token.
-    token parameter must be in string format.
+    Verifies a signed token in memory.
 
     Returns:
 
-        token -> (user, token_type, token_expired)
+        (user_id, token_type, token_expiry_timestamp), or None if the token is not valid
+    """
+    try:
+        value = TOKEN_SIGNER.unsign(token)
+        user_id, token_type, token_expiry = value.split('.')
+        return int(user_id), int(token_type), base36_to_int(token_expiry)
+    except (signing.BadSignature, ValueError):
+        return None
+
+
+def read_signed_token(token):
+    """
+    Verifies a signed token in memory.
+
+    Returns:
+
+        (user_id, token_type, token_expired), or None if the token is not valid
+    """
+    token_data = unsign_token(token)
+    if not token_data:
+        return None
+
+    user_id, token_type, token_expiry_timestamp = token_data
+    return user_id, token_type, token_expiry_timestamp < time.time()
+
+
+def read_legacy_token(token):
+    """
+    Decrypts an old XOR token in memory.
+
+    Returns:
+
+        (email, token_type, token_expired), or None if the token is not valid
     """
     try:
         token_bytestring = bytes(token, 'utf-8')
@@ -71,7 +145,7 @@ def decode_token(token):
             token_bytestring = bytes(token, 'utf-8')
             decoded_token = base64.urlsafe_b64decode(token_bytestring)
         else:
-            return None, None, True
+            return None
 
     try:
         xor_cipher = XOR.new(key=settings.TOKEN_ENCODE_SALT)
@@ -82,22 +156,57 @@ def decode_token(token):
         email = input_string_parameters[1]
         token_type = int(input_string_parameters[2])
         token_expiry_date = datetime.strptime(input_string_parameters[3], settings.TOKEN_DATE_FORMAT)
-        token_expired = token_expiry_date < datetime.now()
-
-        auth_user_model = get_user_model()
-        users = list(auth_user_model.objects.filter(email=email))
-        if users:
-            user = users[0]
-            return user, token_type, token_expired
-        else:
-            return None, None, True
+        return email, token_type, token_expiry_date < datetime.now()
 
     except:
         # Some Thing Is Wrong with Token
+        return None
+
+
+def is_signed_token(token):
+    return TOKEN_SEPARATOR in token  # Legacy Tokens Are Urlsafe Base64, Which Has No Separator
+
+
+def decode_token(token):
+    """
+    Decodes token.
+    token parameter must be in string format.
+
+    The db is only queried to fetch the user of a valid, unexpired token.
+
+    Returns:
+
+        token -> (user, token_type, token_expired)
+    """
+    if is_signed_token(token):
+        token_data = read_signed_token(token)
+        user_lookup = 'pk'
+    elif settings.ACCEPT_LEGACY_TOKENS:
+        token_data = read_legacy_token(token)
+        user_lookup = 'email'
+    else:
+        token_data = None
+
+    if not token_data or token_data[2]:
         return None, None, True
 
+    user_identifier, token_type, token_expired = token_data
+    user = get_user_model().objects.filter(**{user_lookup: user_identifier}).first()
+    if not user:
+        return None, None, True
+
+    return user, token_type, token_expired
+
 
 def is_token_valid(token):
+    """
+    Returns True if the token is genuine and unexpired. Signed tokens are
+    checked without the db.
+    """
+    if is_signed_token(token):
+        token_data = read_signed_token(token)
+        return bool(token_data) and not token_data[2]
+
     user, token_type, token_expired = decode_token(token)
     if not user or token_expired:
         return False
@@ -108,31 +217,34 @@ def send_email_verification_mail(user, host='www.sportsvitae.com'):
     subject = 'Important: Verify Email for your Sportsvitae.com account now'
     context = {
         'user': user,
-        'token': encode_token(user.email, 1),
+        'token': encode_token(user, 1),
         'host': host
         }
-    body = render_to_string('accounts/mailers/email_verification_mail.html', context=context)
+    body = render_mail('accounts/mailers/email_verification_mail.html', context=context)
 
-    send_mail(subject=subject, message='', from_email='support@sportsvitae.com', recipient_list=[user.email], html_message=body)
+    queue_mail(subject=subject, html_message=body, from_email='support@sportsvitae.com', recipient_list=[user.email])
 
 
 def send_forgot_password_mail(user, host='www.sportsvitae.com'):
     subject = 'Sportsvitae.com: Choose a new password'
     context = {
         'user': user,
-        'token': encode_token(user.email, 1),
+        'token': encode_token(user, 1),
         'host': host
         }
-    body = render_to_string('accounts/mailers/forgot_password.html', context=context)
+    body = render_mail('accounts/mailers/forgot_password.html', context=context)
 
-    send_mail(subject=subject, message='', from_email='support@sportsvitae.com', recipient_list=[user.email], html_message=body)
+    queue_mail(subject=subject, html_message=body, from_email='support@sportsvitae.com', recipient_list=[user.email])
 
 
 def send_admin_mail_on_user_profile_completion(new_user_email, host='www.sportsvitae.com'):
     subject = '[Important] New User Has Joined!'
 
-    auth_user_model = get_user_model()
-    users_count = auth_user_model.objects.filter(is_email_verified=True, registration_midout=False).count()
+    users_count = get_registered_user_count()
     body = 'New User email: {} Total Registered Users Currently: {}'.format(new_user_email, users_count)
 
-    send_mail(subject=subject, message='', from_email='root@sportsvitae.com', recipient_list=['care@sportsvitae.com'], html_message=body)
+    if settings.MAIL_DIGEST_ENABLED:
+        NEW_USER_DIGEST.add(body)
+        return
+
+    queue_mail(subject=subject, html_message=body, from_email='root@sportsvitae.com', recipient_list=['care@sportsvitae.com'])
@@ -10,6 +10,7 @@ from django.contrib.auth import login, logout
 from django.core.urlresolvers import reverse_lazy
 from django.contrib.auth import get_user_model
 from django.contrib import messages
+from django.db import transaction
 from django.db.models import Q
 from django.core.paginator import Paginator
 from django.shortcuts import render
@@ -21,7 +22,8 @@ from django.shortcuts import redirect, get_object_or_404, render
 
 # Inter App Imports
 # from competition_mania.shared.common_mixins import EmailNotVerifiedMixin, EmailVerifiedMixin, LoginRequiredMixin, UserProfileMidoutRequiredMixin, SportsProfileRequiredMixin, TokenAutoLoginMixin, ImageCropperMixin, CheckLoggedInMixin, UserProfileRequiredMixin, CompleteCricketerRequiredMixin, SuperUserRequiredMixin
-from competition_mania.shared.common_mixins import CheckLoggedInMixin, TokenAutoLoginMixin
+from competition_mania.shared.common_mixins import USED_TOKEN_SESSION_KEY, CheckLoggedInMixin, TokenAutoLoginMixin
+from competition_mania.shared.utils import PhaseTimer
 # from cricket.models import Cricketer, CricketTeam, CricketMatch
 # from lookup.choices import STATE_TO_CITY_CHOICES
 
@@ -66,8 +68,9 @@ class RegistrationView(TemplateView):
         # Bind the Relevant Form with Post Data
         registration_form = UserRegistrationForm(request.POST, prefix='registration')
         if registration_form.is_valid():
-            user = registration_form.save()
-            send_email_verification_mail(user, host=request.get_host())
+            with transaction.atomic():  # The Verification Mail Is Queued Only If the User Is Saved
+                user = registration_form.save()
+                send_email_verification_mail(user, host=request.get_host())
             # user.backend = 'accounts.backends.EmailAuthenticationBackend'
             # login(request, user)
             return HttpResponseRedirect(reverse_lazy('home_page'))
@@ -232,10 +235,22 @@ class LoginView(FormView):
             return next_url
         return reverse_lazy('home_page')
 
+    def dispatch(self, request, *args, **kwargs):
+        self.timer = PhaseTimer()
+        return super(LoginView, self).dispatch(request, *args, **kwargs)
+
+    def get_form_kwargs(self):
+        kwargs = super(LoginView, self).get_form_kwargs()
+        kwargs['timer'] = self.timer
+        return kwargs
+
     def form_valid(self, form):
         user = form.get_authenticated_user()
-        login(self.request, user)
-        return super(LoginView, self).form_valid(form)
+        with self.timer.phase('login'):
+            login(self.request, user)
+        response = super(LoginView, self).form_valid(form)
+        response['Server-Timing'] = self.timer.as_server_timing()  # Session Save in Middleware Not Included
+        return response
 
 
 class LogoutView(FormView):
@@ -445,8 +460,10 @@ class ChangePassword(TokenAutoLoginMixin, FormView):
     form_class = ChangePasswordForm
     template_name = 'accounts/change_password.html'
     success_url = reverse_lazy('home_page')
+    single_use_token = True  # Password Reset Links Work Only Once
 
     def form_valid(self, form):
+        self.request.session.pop(USED_TOKEN_SESSION_KEY, None)  # The Link Is Done With
         self.request.user.set_password(form.cleaned_data['password1'])
         self.request.user.save()
 
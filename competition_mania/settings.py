@@ -33,7 +33,8 @@ EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 # Authentication Backend
 # Custom Authentication Backend
 AUTHENTICATION_BACKENDS = (
-    'accounts.backends.EmailAuthenticationBackend',
+    'accounts.backends.IdentifierAuthenticationBackend',
+    'accounts.backends.EmailAuthenticationBackend',  # Only Loads Users For Sessions Logged In Before the Identifier Backend, Authenticates No One
     )
 
 
@@ -105,6 +106,19 @@ DATABASES = {
     }
 }
 
+# Cache
+# https://docs.djangoproject.com/en/1.10/ref/settings/#caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'shared': {  # Shared By All Processes, Needs python-memcached
+        'BACKEND': 'django.core.cache.backends.memcached.MemcachedCache',
+        'LOCATION': '127.0.0.1:11211',
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/1.10/ref/settings/#auth-password-validators
 
@@ -147,6 +161,39 @@ EMAIL_TOKEN_EXPIRY_DAYS_LIMIT = 180
 EMAIL_TOKEN_EXPIRY_DAYS_LIMIT = 180
 TOKEN_ENCODE_SALT = 'BBog'
 TOKEN_DATE_FORMAT = '%Y%m%d%H%M%S'
+ACCEPT_LEGACY_TOKENS = True  # Decode Old XOR Tokens Until All of Them Have Expired
+TOKEN_REVOCATION_BLOOM_CAPACITY = 100000  # Revoked Tokens the In Memory Filter Is Sized For Before It Is Rebuilt
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = 0.001  # Share of Never Revoked Tokens That Still Need a Query
+TOKEN_REVOCATION_SYNC_SECONDS = 5  # How Often Tokens Revoked By Other Processes Are Picked Up
+USER_CACHE_ENABLED = False  # Cache request.user Instead of Querying It On Every Request
+USER_CACHE_SIZE = 10000  # Users Kept in Each Process
+USER_CACHE_TTL = 60  # Seconds, Also the Longest Another Process May Serve a Stale User
+USER_CACHE_SHARED_ALIAS = None  # Name of a CACHES Entry Shared By All Processes, Optional
+PASSWORD_HASHING_POOL_SIZE = os.cpu_count() or 1  # Processes Hashing Passwords Per Worker, 0 to Hash On the Request Thread
+PASSWORD_HASHING_QUEUE_SIZE = 64  # Hashes Queued Or Running Per Worker Before Callers Have to Wait
+PASSWORD_HASHING_QUEUE_TIMEOUT = 2  # Seconds to Wait For a Queue Slot Before Giving Up
+MAIL_OUTBOX_CONCURRENCY = 4  # Mails `send_queued_mails` Sends At a Time
+MAIL_OUTBOX_MAX_ATTEMPTS = 8  # Attempts Before a Queued Mail Is Marked Failed
+MAIL_OUTBOX_RETRY_BASE_SECONDS = 60  # Delay Before the First Retry, Doubled On Each Further Retry
+MAIL_OUTBOX_RETRY_MAX_SECONDS = 60 * 60 * 6  # Longest Delay Between Retries
+MAIL_OUTBOX_LEASE_SECONDS = 300  # How Long a Claimed Mail Is Hidden From Other Workers
+MAIL_BATCH_CHUNK_SIZE = 100  # Mails Per Chunk in Bulk Mailings
+MAIL_BATCH_CONNECTION_COUNT = 2  # Smtp Connections Sending Chunks in Parallel
+MAIL_BATCH_RETRIES = 3  # Retries On a Fresh Connection Before a Chunk's Undelivered Mails Count As Failed
+CRON_REMINDER_CHUNK_SIZE = 500  # Users Each Reminder Job Loads, Mails And Marks At a Time
+MAIL_RENDER_POOL_SIZE = os.cpu_count()  # Processes Rendering a Campaign's Mails, 1 to Render in Process
+MAIL_DIGEST_ENABLED = True  # Collect Admin Notifications Into Digest Mails Instead of One Mail Each
+MAIL_DIGEST_INTERVAL_SECONDS = 60 * 60  # Longest a Line Waits Before Its Digest Is Sent
+MAIL_DIGEST_BUFFER_SIZE = 1000  # Lines That Send a Digest Early, And the Most Lines Per Digest Mail
+EVENTS_BROKER = 'accounts.events.CacheEventBroker'  # Keeps Users' Events For the Events Endpoint
+EVENTS_CACHE_ALIAS = 'shared'  # CACHES Entry Holding Events, Must Be Shared By All Processes Or the Project Refuses to Start
+EVENTS_LONG_POLL_SECONDS = 25  # Longest the Events Endpoint Waits For an Event
+EVENTS_WAIT_CHECK_SECONDS = 1  # How Often a Waiting Request Checks For Events Published By Other Processes
+EVENTS_TIMEOUT = 60 * 10  # Seconds an Event Is Kept For Clients to Catch Up
+EVENTS_BUFFER_SIZE = 50  # Latest Events a Client Can Catch Up On, Older Clients Reload
+EVENTS_MAX_USERS = 10000  # Users Whose Events the Local (Test) Broker Keeps
+USER_COUNTERS_CACHE_TTL = 60 * 5  # Seconds a User's Header Counts Stay Cached, Changes Clear Them Earlier
+LOOKUP_RESPONSE_MAX_AGE = 60 * 60 * 24 * 30  # Seconds Browsers May Cache Lookup Api Responses
 # Custom User Model For Authentication
 AUTH_USER_MODEL = 'accounts.User'
 
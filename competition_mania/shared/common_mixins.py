@@ -19,10 +19,14 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from accounts.models import User
 # from cricket.models import CricketTeam, CricketMatch, CricketTeamMember, TeamMemberVacancy
 from accounts.utils import decode_token
+from accounts.revocation import TOKEN_REVOCATION_STORE, get_token_hash
 
 # Local Imports
 
 
+USED_TOKEN_SESSION_KEY = '_used_token_hash'
+
+
 # class CsrfExemptMixin(object):
 
 #     @csrf_exempt
@@ -72,8 +76,14 @@ class CheckLoggedInMixin(object):
 class TokenAutoLoginMixin(object):
     """
     Validates the Token in the Url And Autologin the User.
+    Used Up Or Revoked Tokens Are Rejected.
+
+    With single_use_token Set, Opening the Link Uses Up the Token. Only the
+    Session That Opened It Can Keep Using the Link (E.g. to Submit the Form).
     """
 
+    single_use_token = False
+
     def dispatch(self, request, *args, **kwargs):
         token = self.kwargs['token']
         user, token_type, token_expired = decode_token(token)
@@ -81,9 +91,22 @@ class TokenAutoLoginMixin(object):
         if not user or token_expired:
             return HttpResponseRedirect(reverse_lazy('change_password'))
 
+        token_hash = get_token_hash(token)
+        if self.single_use_token and request.session.get(USED_TOKEN_SESSION_KEY) == token_hash and request.user.pk == user.pk:
+            return super(TokenAutoLoginMixin, self).dispatch(request, *args, **kwargs)  # Opened By This Session
+
+        if self.single_use_token:
+            token_usable = TOKEN_REVOCATION_STORE.revoke(token)  # Checked Against the Table, False If Already Used
+        else:
+            token_usable = not TOKEN_REVOCATION_STORE.is_revoked(token)
+        if not token_usable:
+            return HttpResponseRedirect(reverse_lazy('change_password'))
+
         # perform login
-        user.backend = 'accounts.backends.EmailAuthenticationBackend'
+        user.backend = 'accounts.backends.IdentifierAuthenticationBackend'
         login(request, user)
+        if self.single_use_token:
+            request.session[USED_TOKEN_SESSION_KEY] = token_hash
 
         return super(TokenAutoLoginMixin, self).dispatch(request, *args, **kwargs)
 
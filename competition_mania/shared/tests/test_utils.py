@@ -0,0 +1,54 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# third-party django imports
+import pytest
+
+# inter-app imports
+from accounts.models import User
+from sportsvitae.shared.factories import UserFactory
+
+# local imports
+from ..utils import get_percentiles, iter_queryset_chunks
+
+
+@pytest.mark.django_db
+class TestIterQuerysetChunks(unittest.TestCase):
+
+    def setUp(self):
+        self.users = [UserFactory(is_email_verified=False) for index in range(5)]
+
+    def test_yields_all_objects_in_pk_order(self):
+        chunks = list(iter_queryset_chunks(User.objects.all(), 2))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual([user.id for chunk in chunks for user in chunk], sorted(user.id for user in self.users))
+
+    def test_fetches_one_chunk_per_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            chunks = iter_queryset_chunks(User.objects.all(), 2)
+            next(chunks)
+        self.assertEqual(len(queries), 1)
+
+    def test_resumes_after_objects_updated_out_of_filter(self):
+        users = User.objects.filter(is_email_verified=False)
+        mailed_user_ids = []
+        for chunk in iter_queryset_chunks(users, 2):
+            mailed_user_ids.extend(user.id for user in chunk)
+            User.objects.filter(id__in=[user.id for user in chunk]).update(is_email_verified=True)
+        self.assertEqual(sorted(mailed_user_ids), sorted(user.id for user in self.users))
+
+
+class TestGetPercentiles(unittest.TestCase):
+
+    def test_no_samples(self):
+        self.assertEqual(get_percentiles([]), {'p50': None, 'p90': None, 'p99': None})
+
+    def test_nearest_rank(self):
+        self.assertEqual(get_percentiles(range(100, 0, -1)), {'p50': 50, 'p90': 90, 'p99': 99})
+
+    def test_nearest_rank_of_few_samples(self):
+        self.assertEqual(get_percentiles([4, 1, 3, 2]), {'p50': 2, 'p90': 4, 'p99': 4})
@@ -1,4 +1,8 @@
 # Python Imports
+import math
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 
 # Django Imports
 from django.template.defaultfilters import slugify
@@ -14,3 +18,53 @@ def prepare_name_and_id_slug(name, object_id):
     slug_string = '{} {}'.format(name, object_id)
     slug = slugify(slug_string)
     return slug
+
+
+class PhaseTimer(object):
+    """
+    Records How Long Each Named Phase of a Request Takes, Reported in the
+    Server-Timing Response Header.
+    """
+
+    def __init__(self):
+        self.durations = OrderedDict()
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0) + time.perf_counter() - start
+
+    def as_server_timing(self):
+        return ', '.join('{};dur={:.1f}'.format(name, seconds * 1000) for name, seconds in self.durations.items())
+
+
+def iter_queryset_chunks(queryset, chunk_size):
+    """
+    Yields the Objects of a Queryset As Lists of Upto `chunk_size`, In Primary
+    Key Order. Each Chunk Is a Separate Query Starting After the Last Primary
+    Key Seen, So Memory Use Does Not Grow With the Table.
+    """
+    queryset = queryset.order_by('pk')
+    last_pk = None
+    while True:
+        chunk_queryset = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1].pk
+
+
+def get_percentiles(samples, percentiles=(50, 90, 99)):
+    """
+    Returns {'p50': .., 'p90': .., 'p99': ..} For the Samples (Nearest Rank),
+    With None Values If There Are No Samples.
+    """
+    samples = sorted(samples)
+    return {
+        'p{}'.format(percentile): samples[max(0, math.ceil(len(samples) * percentile / 100) - 1)] if samples else None
+        for percentile in percentiles
+    }
@@ -8,4 +8,5 @@ urlpatterns = [
 
     url(r'^admin/', include(admin.site.urls)),
     url(r'^', include('accounts.urls')),  # Add Auth
+    url(r'^', include('lookup.urls')),
 ]
@@ -0,0 +1,111 @@
+# Python Imports
+import gzip
+import hashlib
+import json
+
+# Django Imports
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+
+# Third Party Django Imports
+
+# Inter App Imports
+from lookup.choices import COUNTRY_CHOICES, COUNTRY_CODE_MAPPING, STATE_CHOICES, STATE_TO_CITY_CHOICES
+
+# Local Imports
+
+
+def render_json(data, sort_keys=False):
+    """
+    Renders Data to Compact Utf-8 Json Bytes, Same As Rest Framework's JSONRenderer
+    """
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=sort_keys).encode('utf-8')
+
+
+def accepts_gzip(request):
+    return 'gzip' in request.META.get('HTTP_ACCEPT_ENCODING', '')
+
+
+class PreRenderedResponse(object):
+    """
+    Holds a Response Body Rendered Once Along with Its Strong ETag.
+
+    Lookup Data Never Changes For the Life of a Process, So the Body Is Built
+    a Single Time And Every Request Is Served From the Cached Bytes. With
+    `compress` a Gzipped Copy Is Also Built And Served to Clients Accepting It.
+    """
+
+    content_type = 'application/json'
+
+    def __init__(self, data, status=200, cache_control=None, compress=False, sort_keys=False):
+        self.body = render_json(data, sort_keys=sort_keys)
+        self.etag = '"{}"'.format(hashlib.sha1(self.body).hexdigest())
+        self.status = status
+        self.compressed_body = gzip.compress(self.body, compresslevel=9) if compress else None
+        self.compressed_etag = '{}-gzip"'.format(self.etag[:-1])  # Each Encoding Needs Its Own Strong ETag
+
+        if cache_control is None:
+            cache_control = 'public, max-age={}'.format(settings.LOOKUP_RESPONSE_MAX_AGE) if status == 200 else 'no-cache'
+        self.cache_control = cache_control
+
+    def is_not_modified(self, request):
+        """
+        Returns True If the Client Already Has This Body (If-None-Match Matches the ETag)
+        """
+        if self.status != 200:
+            return False
+
+        if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+        if not if_none_match:
+            return False
+
+        client_etags = [etag.strip() for etag in if_none_match.split(',')]
+        client_etags = [etag[2:] if etag.startswith('W/') else etag for etag in client_etags]  # Weak Comparison
+        return '*' in client_etags or self.etag in client_etags or self.compressed_etag in client_etags
+
+    def as_response(self, request):
+        serve_compressed = self.compressed_body is not None and accepts_gzip(request)
+
+        if self.is_not_modified(request):
+            response = HttpResponseNotModified()
+        elif serve_compressed:
+            response = HttpResponse(self.compressed_body, content_type=self.content_type, status=self.status)
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = HttpResponse(self.body, content_type=self.content_type, status=self.status)
+
+        response['ETag'] = self.compressed_etag if serve_compressed else self.etag
+        response['Cache-Control'] = self.cache_control
+        if self.compressed_body is not None:
+            response['Vary'] = 'Accept-Encoding'
+        return response
+
+
+COUNTRY_RESPONSE = PreRenderedResponse(COUNTRY_CHOICES)
+
+STATE_RESPONSE = PreRenderedResponse(STATE_CHOICES)
+
+COUNTRY_TO_COUNTRY_CODE_RESPONSES = {country: PreRenderedResponse({'country_code': country_code}) for country, country_code in COUNTRY_CODE_MAPPING.items()}
+INVALID_COUNTRY_RESPONSE = PreRenderedResponse({'country_code': 'Invalid value for country.'}, status=400)
+
+STATE_TO_CITY_RESPONSES = {state: PreRenderedResponse({'city': cities}) for state, cities in STATE_TO_CITY_CHOICES.items()}
+INVALID_STATE_RESPONSE = PreRenderedResponse({'city': 'Invalid value for state.'}, status=400)
+
+
+# Lookup Bundle
+# All Lookups in One Payload, Addressed By a Hash of Its Content. The Versioned
+# Url Never Changes Content So It Is Cached Forever; the Unversioned Url Is
+# Always Revalidated And Tells Clients the Current Version.
+
+LOOKUP_BUNDLE = {
+    'country': COUNTRY_CHOICES,
+    'country_code': COUNTRY_CODE_MAPPING,
+    'state': STATE_CHOICES,
+    'city': STATE_TO_CITY_CHOICES,
+}
+
+LOOKUP_BUNDLE_VERSION = hashlib.sha1(render_json(LOOKUP_BUNDLE, sort_keys=True)).hexdigest()[:12]
+
+LOOKUP_BUNDLE_RESPONSE = PreRenderedResponse(dict(LOOKUP_BUNDLE, version=LOOKUP_BUNDLE_VERSION), cache_control='no-cache', compress=True, sort_keys=True)
+VERSIONED_LOOKUP_BUNDLE_RESPONSE = PreRenderedResponse(dict(LOOKUP_BUNDLE, version=LOOKUP_BUNDLE_VERSION), cache_control='public, max-age=31536000, immutable', compress=True, sort_keys=True)
+INVALID_LOOKUP_BUNDLE_VERSION_RESPONSE = PreRenderedResponse({'version': 'Invalid value for version.'}, status=404)
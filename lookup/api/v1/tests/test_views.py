@@ -1,6 +1,7 @@
 # inbuilt python imports
 import unittest
 import json
+import gzip
 
 # inbuilt django imports
 from django.test import Client
@@ -13,18 +14,23 @@ from django.test import Client
 from lookup.choices import COUNTRY_CHOICES, COUNTRY_CODE_MAPPING, STATE_CHOICES, STATE_TO_CITY_CHOICES
 
 
+def as_json_lists(choices):
+    return [list(choice) for choice in choices]
+
+
 class TestCountryLookup(unittest.TestCase):
 
     def setUp(self):
         self.client = Client()
         self.url = '/api/v1/lookup/country/'
         self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
 
     def test_returns_200_response(self):
         self.assertEqual(self.response.status_code, 200)
 
     def test_returns_countries_choices(self):
-        self.assertEqual(self.response.data, COUNTRY_CHOICES)
+        self.assertEqual(self.data, as_json_lists(COUNTRY_CHOICES))
 
 
 class TestCountryToCountryCodeLookup(unittest.TestCase):
@@ -33,24 +39,25 @@ class TestCountryToCountryCodeLookup(unittest.TestCase):
         self.client = Client()
         self.url = '/api/v1/lookup/country-code/?country=IN'
         self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
 
     def test_returns_200_response(self):
         self.assertEqual(self.response.status_code, 200)
 
     def test_returns_country_code(self):
-        self.assertEqual(self.response.data['country_code'], '91')
+        self.assertEqual(self.data['country_code'], '91')
 
     def test_returns_error_if_country_missing(self):
         url = '/api/v1/lookup/country-code/'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data['country_code'], 'Invalid value for country.')
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['country_code'], 'Invalid value for country.')
 
     def test_returns_error_if_country_invalid(self):
         url = '/api/v1/lookup/country-code/?country=AAAAA'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data['country_code'], 'Invalid value for country.')
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['country_code'], 'Invalid value for country.')
 
 
 class TestStateLookup(unittest.TestCase):
@@ -59,12 +66,13 @@ class TestStateLookup(unittest.TestCase):
         self.client = Client()
         self.url = '/api/v1/lookup/state/'
         self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
 
     def test_returns_200_response(self):
         self.assertEqual(self.response.status_code, 200)
 
     def test_returns_countries_choices(self):
-        self.assertEqual(self.response.data, STATE_CHOICES)
+        self.assertEqual(self.data, as_json_lists(STATE_CHOICES))
 
 
 class TestStateToCityLookup(unittest.TestCase):
@@ -74,21 +82,120 @@ class TestStateToCityLookup(unittest.TestCase):
         self.state = 1012
         self.url = '/api/v1/lookup/city/?state={}'.format(self.state)
         self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
 
     def test_returns_200_response(self):
         self.assertEqual(self.response.status_code, 200)
 
     def test_returns_country_code(self):
-        self.assertEqual(self.response.data['city'], STATE_TO_CITY_CHOICES[self.state])
+        self.assertEqual(self.data['city'], as_json_lists(STATE_TO_CITY_CHOICES[self.state]))
 
     def test_returns_error_if_country_missing(self):
         url = '/api/v1/lookup/city/'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data['city'], 'Invalid value for state.')
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['city'], 'Invalid value for state.')
 
     def test_returns_error_if_country_invalid(self):
         url = '/api/v1/lookup/city/?state=99999999'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(response.data['city'], 'Invalid value for state.')
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['city'], 'Invalid value for state.')
+
+
+class TestLookupConditionalRequests(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/api/v1/lookup/city/?state=1012'
+        self.response = self.client.get(self.url)
+
+    def test_returns_strong_etag(self):
+        self.assertTrue(self.response['ETag'].startswith('"'))
+
+    def test_returns_long_cache_control(self):
+        self.assertIn('max-age=', self.response['Cache-Control'])
+
+    def test_returns_304_if_etag_matches(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=self.response['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_returns_200_if_etag_does_not_match(self):
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_returns_different_etag_per_state(self):
+        response = self.client.get('/api/v1/lookup/city/?state=1013')
+        self.assertNotEqual(response['ETag'], self.response['ETag'])
+
+    def test_error_response_is_not_cached(self):
+        response = self.client.get('/api/v1/lookup/city/?state=99999999', HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response['Cache-Control'], 'no-cache')
+
+
+class TestCitySearchLookup(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/api/v1/lookup/city/search/?q=kolk'
+        self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
+
+    def test_returns_200_response(self):
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_returns_matching_cities(self):
+        self.assertEqual(self.data['city'], [[10662, 'Kolkata', 1036]])
+
+    def test_returns_cities_of_state_only(self):
+        response = self.client.get('/api/v1/lookup/city/search/?q=north&state=1036')
+        cities = json.loads(response.content.decode('utf-8'))['city']
+        self.assertTrue(cities)
+        self.assertTrue(all(city[2] == 1036 for city in cities))
+
+    def test_returns_error_if_query_missing(self):
+        response = self.client.get('/api/v1/lookup/city/search/')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['q'], 'This field is required.')
+
+    def test_returns_error_if_state_invalid(self):
+        response = self.client.get('/api/v1/lookup/city/search/?q=kol&state=99999999')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content.decode('utf-8'))['state'], 'Invalid value for state.')
+
+
+class TestLookupBundle(unittest.TestCase):
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/api/v1/lookup/bundle/'
+        self.response = self.client.get(self.url)
+        self.data = json.loads(self.response.content.decode('utf-8'))
+
+    def test_returns_200_response(self):
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_returns_all_lookups(self):
+        self.assertEqual(self.data['country'], as_json_lists(COUNTRY_CHOICES))
+        self.assertEqual(self.data['country_code'], COUNTRY_CODE_MAPPING)
+        self.assertEqual(self.data['state'], as_json_lists(STATE_CHOICES))
+        self.assertEqual(self.data['city'][str(1012)], as_json_lists(STATE_TO_CITY_CHOICES[1012]))
+
+    def test_unversioned_bundle_is_revalidated(self):
+        self.assertEqual(self.response['Cache-Control'], 'no-cache')
+
+    def test_returns_gzipped_bundle_if_accepted(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(response.content).decode('utf-8')), self.data)
+
+    def test_versioned_bundle_is_cached_forever(self):
+        response = self.client.get('{}{}/'.format(self.url, self.data['version']))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_returns_error_if_version_stale(self):
+        response = self.client.get('{}{}/'.format(self.url, 'abcdef123456'))
+        self.assertEqual(response.status_code, 404)
@@ -8,7 +8,7 @@ from django.conf.urls import url
 # Inter App Imports
 
 # Local Imports
-from .views import CountryLookup, CountryToCountryCodeLookup, StateLookup, StateToCityLookup
+from .views import CountryLookup, CountryToCountryCodeLookup, StateLookup, StateToCityLookup, CitySearchLookup, LookupBundle
 
 
 urlpatterns = [
@@ -16,4 +16,7 @@ urlpatterns = [
     url(r'^country-code/$', CountryToCountryCodeLookup.as_view()),
     url(r'^state/$', StateLookup.as_view()),
     url(r'^city/$', StateToCityLookup.as_view()),
+    url(r'^city/search/$', CitySearchLookup.as_view()),
+    url(r'^bundle/$', LookupBundle.as_view()),
+    url(r'^bundle/(?P<version>[0-9a-f]+)/$', LookupBundle.as_view()),
 ]
@@ -1,58 +1,103 @@
 # Python Imports
 
 # Django Imports
+from django.http import HttpResponse
+from django.views.generic import View
 
 # Third Party Django Imports
-from rest_framework.views import APIView
-from rest_framework.response import Response
 
 # Inter App Imports
-from lookup.choices import COUNTRY_CHOICES, COUNTRY_CODE_MAPPING, STATE_CHOICES, STATE_TO_CITY_CHOICES
+from lookup.search import CITY_SEARCH_INDEX
 
 # Local Imports
+from .responses import COUNTRY_RESPONSE, COUNTRY_TO_COUNTRY_CODE_RESPONSES, INVALID_COUNTRY_RESPONSE, STATE_RESPONSE, STATE_TO_CITY_RESPONSES, INVALID_STATE_RESPONSE, LOOKUP_BUNDLE_VERSION, LOOKUP_BUNDLE_RESPONSE, VERSIONED_LOOKUP_BUNDLE_RESPONSE, INVALID_LOOKUP_BUNDLE_VERSION_RESPONSE, render_json
 
 
-class CountryLookup(APIView):
+class CountryLookup(View):
     """
     Returns Countries Lookup
     """
 
     def get(self, request):
-        return Response(data=COUNTRY_CHOICES, content_type='application/json')
+        return COUNTRY_RESPONSE.as_response(request)
 
 
-class CountryToCountryCodeLookup(APIView):
+class CountryToCountryCodeLookup(View):
     """
     Returns Country Code Based On Country Selected
     """
 
     def get(self, request):
-        country = request.query_params.get('country')
+        country = request.GET.get('country')
+        pre_rendered_response = COUNTRY_TO_COUNTRY_CODE_RESPONSES.get(country, INVALID_COUNTRY_RESPONSE)
+        return pre_rendered_response.as_response(request)
 
-        if country not in COUNTRY_CODE_MAPPING:
-            return Response(data={'country_code': 'Invalid value for country.'}, content_type='application/json', status=400)
 
-        return Response(data={'country_code': COUNTRY_CODE_MAPPING[country]}, content_type='application/json')
+class StateLookup(View):
+    """
+    Returns Indian States Lookup
+    """
+
+    def get(self, request):
+        return STATE_RESPONSE.as_response(request)
 
 
-class StateLookup(APIView):
+class StateToCityLookup(View):
     """
-    Returns Indian States Lookup
+    Returns Cities Based On State Selected
     """
 
     def get(self, request):
-        return Response(data=STATE_CHOICES, content_type='application/json')
+        state = request.GET.get('state', '')
+
+        if not state.isdigit():
+            return INVALID_STATE_RESPONSE.as_response(request)
+
+        pre_rendered_response = STATE_TO_CITY_RESPONSES.get(int(state), INVALID_STATE_RESPONSE)
+        return pre_rendered_response.as_response(request)
 
 
-class StateToCityLookup(APIView):
+class LookupBundle(View):
     """
-    Returns Country Code Based On Country Selected
+    Returns Countries, Country Codes, States And State To Cities in One Payload.
+
+    URL: <host>/api/v1/lookup/bundle/ (Always Revalidated, Gives Current Version)
+    URL: <host>/api/v1/lookup/bundle/<version>/ (Cached Forever)
     """
 
+    def get(self, request, version=None):
+        if version is None:
+            return LOOKUP_BUNDLE_RESPONSE.as_response(request)
+
+        if version != LOOKUP_BUNDLE_VERSION:
+            return INVALID_LOOKUP_BUNDLE_VERSION_RESPONSE.as_response(request)
+
+        return VERSIONED_LOOKUP_BUNDLE_RESPONSE.as_response(request)
+
+
+class CitySearchLookup(View):
+    """
+    Returns Cities Matching a Typeahead Query, Optionally Within a State
+    URL: <host>/api/v1/lookup/city/search/?q=kol&state=1036&limit=10
+    """
+
+    default_limit = 10
+    max_limit = 50
+
+    def get_limit(self):
+        limit = self.request.GET.get('limit', '')
+        if not limit.isdigit() or not int(limit):
+            return self.default_limit
+        return min(int(limit), self.max_limit)
+
     def get(self, request):
-        state = request.query_params.get('state', '')
+        query = request.GET.get('q', '').strip()
+        if not query:
+            return HttpResponse(render_json({'q': 'This field is required.'}), content_type='application/json', status=400)
 
-        if not state.isdigit() or int(state) not in STATE_TO_CITY_CHOICES:
-            return Response(data={'city': 'Invalid value for state.'}, content_type='application/json', status=400)
+        state = request.GET.get('state', '')
+        if state and (not state.isdigit() or not CITY_SEARCH_INDEX.has_state(int(state))):
+            return HttpResponse(render_json({'state': 'Invalid value for state.'}), content_type='application/json', status=400)
 
-        return Response(data={'city': STATE_TO_CITY_CHOICES[int(state)]}, content_type='application/json')
+        cities = CITY_SEARCH_INDEX.search(query, state=int(state) if state else None, limit=self.get_limit())
+        return HttpResponse(render_json({'city': cities}), content_type='application/json')
@@ -0,0 +1,19 @@
+# Python Imports
+
+# Django Imports
+from django.apps import AppConfig
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+
+
+class LookupConfig(AppConfig):
+    name = 'lookup'
+
+    def ready(self):
+        # Build Lookup Api Responses And Search Index At Startup Instead of On the First Request
+        from .api.v1 import responses  # noqa
+        from . import search  # noqa
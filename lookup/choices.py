@@ -1,5 +1,6 @@
 # Python Imports
-from functools import reduce
+from itertools import chain
+from operator import itemgetter
 
 # Django Imports
 
@@ -17,13 +18,6 @@ SPORTS_CHOICES = [
     ('cricket', 'Cricket'),
 ]
 
-COUNTRY_CODE_CHOICES = [(x, x) for x in COUNTRY_CODE_MAPPING.values()]
-
-CITY_CHOICES = reduce(lambda x, y: x+y, STATE_TO_CITY_CHOICES.values())  # Prepare List of Tuples
-CITY_CHOICES = sorted(CITY_CHOICES, key=lambda x: x[0])  # Sort Them Via City_id
-
-CITY_CHOICES_ALPHABETIC = sorted(CITY_CHOICES, key=lambda x: x[1])  # Sorted By Alphabet
-
 NUMBER_OF_VACANCY = [
     (1, '01'),
     (2, '02'),
@@ -53,10 +47,6 @@ USER_WALL_POST_TYPE_CHOICES = [
     (3, 'location')
 ]
 
-STATE_TO_CITY_IDS = {}
-for state, cities in STATE_TO_CITY_CHOICES.items():
-    STATE_TO_CITY_IDS[state] = [city[0] for city in cities]
-
 USER_NOTIFICATION_TYPE_TO_MESSAGES_MAPPING = {
     1: 'You and <b>{friend}</b> are now friends.',
     2: 'You have been added as a member of {cricket_team}',
@@ -74,3 +64,63 @@ USER_NOTIFICATION_TYPE_TO_MESSAGES_MAPPING = {
     14: '{friend} has Liked Your Post',
     15: '{cricket_team} is looking for Players for their Team',
 }
+
+
+# Derived Lookups
+# These Are Built On First Access (Not At Import) Through the Module Level
+# `__getattr__` Below, And Then Cached As Regular Module Attributes.
+
+def build_country_code_choices():
+    return [(x, x) for x in COUNTRY_CODE_MAPPING.values()]
+
+
+def build_city_choices():
+    """
+    Returns List of (city_id, city_name) Sorted Via City_id.
+
+    Kept As a List Because It Is Used As Model Field Choices.
+    """
+    return sorted(chain.from_iterable(STATE_TO_CITY_CHOICES.values()), key=itemgetter(0))
+
+
+def build_city_choices_alphabetic():
+    return tuple(sorted(get_derived_lookup('CITY_CHOICES'), key=itemgetter(1)))  # Sorted By Alphabet
+
+
+def build_state_to_city_ids():
+    return {state: tuple(city[0] for city in cities) for state, cities in STATE_TO_CITY_CHOICES.items()}
+
+
+def build_state_to_city_id_sets():
+    return {state: frozenset(city_ids) for state, city_ids in get_derived_lookup('STATE_TO_CITY_IDS').items()}
+
+
+DERIVED_LOOKUP_BUILDERS = {
+    'COUNTRY_CODE_CHOICES': build_country_code_choices,
+    'CITY_CHOICES': build_city_choices,
+    'CITY_CHOICES_ALPHABETIC': build_city_choices_alphabetic,
+    'STATE_TO_CITY_IDS': build_state_to_city_ids,
+    'STATE_TO_CITY_ID_SETS': build_state_to_city_id_sets,
+}
+
+
+def get_derived_lookup(name):
+    """
+    Builds a Derived Lookup Once And Caches It On the Module
+    """
+    if name in globals():
+        return globals()[name]
+
+    value = DERIVED_LOOKUP_BUILDERS[name]()
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name not in DERIVED_LOOKUP_BUILDERS:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    return get_derived_lookup(name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(DERIVED_LOOKUP_BUILDERS))
@@ -0,0 +1,65 @@
+# Python Imports
+import statistics
+import subprocess
+import sys
+import timeit
+from functools import reduce
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Third Party Django Imports
+
+# Inter App Imports
+from lookup import choices
+from lookup.static_lookups import STATE_TO_CITY_CHOICES
+
+# Local Imports
+
+
+IMPORT_TIMER_SCRIPT = 'import time; start = time.perf_counter(); import lookup.choices; print(time.perf_counter() - start)'
+
+
+def build_derived_lookups_eagerly():
+    """
+    The Derived Lookups As They Were Built At Import Before They Became Lazy
+    """
+    city_choices = reduce(lambda x, y: x+y, STATE_TO_CITY_CHOICES.values())
+    city_choices = sorted(city_choices, key=lambda x: x[0])
+    sorted(city_choices, key=lambda x: x[1])
+    state_to_city_ids = {}
+    for state, cities in STATE_TO_CITY_CHOICES.items():
+        state_to_city_ids[state] = [city[0] for city in cities]
+
+
+def build_derived_lookups_lazily():
+    for builder in choices.DERIVED_LOOKUP_BUILDERS.values():
+        builder()
+
+
+class Command(BaseCommand):
+    help = 'Measures the startup cost of importing lookup.choices and of building its derived lookups.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=10, help='Number of fresh interpreter imports to time.')
+        parser.add_argument('--iterations', type=int, default=1000, help='Number of in-process builds to time.')
+
+    def time_fresh_import(self, runs):
+        timings = []
+        for run in range(runs):
+            output = subprocess.check_output([sys.executable, '-c', IMPORT_TIMER_SCRIPT], cwd=settings.BASE_DIR)
+            timings.append(float(output))
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+
+        import_seconds = self.time_fresh_import(options['runs'])
+        eager_seconds = timeit.timeit(build_derived_lookups_eagerly, number=iterations) / iterations
+        lazy_seconds = timeit.timeit(build_derived_lookups_lazily, number=iterations) / iterations
+
+        self.stdout.write('import lookup.choices (median, fresh interpreter): {:.3f} ms'.format(import_seconds * 1000))
+        self.stdout.write('derived lookups, old eager build at import:       {:.3f} ms'.format(eager_seconds * 1000))
+        self.stdout.write('derived lookups, lazy build on first access:      {:.3f} ms'.format(lazy_seconds * 1000))
+        self.stdout.write('import-time saving per process:                   {:.3f} ms'.format(eager_seconds * 1000))
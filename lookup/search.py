@@ -0,0 +1,104 @@
+# Python Imports
+import re
+import unicodedata
+from bisect import bisect_left
+
+# Django Imports
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from .static_lookups import STATE_TO_CITY_CHOICES
+
+
+WORD_REGEX = re.compile(r'\w+')
+
+
+def normalize_search_text(text):
+    """
+    Returns Lowercase Words of the Text with Accents And Punctuation Removed,
+    Joined By Single Spaces. E.g. 'Burdwan (Bardhamān)' -> 'burdwan bardhaman'
+    """
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(character for character in text if not unicodedata.combining(character))
+    return ' '.join(WORD_REGEX.findall(text.casefold()))
+
+
+class PrefixIndex(object):
+    """
+    Sorted Array of (Key, Value) Pairs Searched By Prefix Using Binary Search.
+    """
+
+    def __init__(self, pairs):
+        pairs = sorted(pairs, key=lambda pair: pair[0])
+        self.keys = [key for key, value in pairs]
+        self.values = [value for key, value in pairs]
+
+    def iter_prefix(self, prefix):
+        """
+        Yields Values Whose Key Starts with the Prefix, In Key Order
+        """
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and self.keys[position].startswith(prefix):
+            yield self.values[position]
+            position += 1
+
+
+class CitySearchIndex(object):
+    """
+    In Memory Typeahead Index Over Cities.
+
+    Cities Whose Name Starts with the Query Are Ranked First, Followed By Cities
+    Having Any Other Word Starting with the Query (E.g. 'medi' Matches
+    'Paschim Medinipur (West Medinipur)').
+    """
+
+    def __init__(self, state_to_city_choices):
+        name_pairs = {None: []}
+        word_pairs = {None: []}
+
+        for state, cities in state_to_city_choices.items():
+            name_pairs[state] = []
+            word_pairs[state] = []
+            for city_id, city_name in cities:
+                city = (city_id, city_name, state)
+                words = normalize_search_text(city_name).split(' ')
+                name_pair = (' '.join(words), city)
+                name_pairs[None].append(name_pair)
+                name_pairs[state].append(name_pair)
+                for word_position in range(1, len(words)):
+                    word_pair = (' '.join(words[word_position:]), city)
+                    word_pairs[None].append(word_pair)
+                    word_pairs[state].append(word_pair)
+
+        self.name_indexes = {state: PrefixIndex(pairs) for state, pairs in name_pairs.items()}
+        self.word_indexes = {state: PrefixIndex(pairs) for state, pairs in word_pairs.items()}
+
+    def has_state(self, state):
+        return state in self.name_indexes
+
+    def search(self, query, state=None, limit=10):
+        """
+        Returns Upto `limit` Cities (city_id, city_name, state_id) Matching the
+        Query, Optionally Scoped to a State.
+        """
+        query = normalize_search_text(query)
+        if not query or not self.has_state(state):
+            return []
+
+        results = []
+        city_ids_seen = set()
+        for index in (self.name_indexes[state], self.word_indexes[state]):
+            for city in index.iter_prefix(query):
+                if city[0] in city_ids_seen:
+                    continue
+                city_ids_seen.add(city[0])
+                results.append(city)
+                if len(results) >= limit:
+                    return results
+        return results
+
+
+CITY_SEARCH_INDEX = CitySearchIndex(STATE_TO_CITY_CHOICES)
@@ -0,0 +1,35 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from .. import choices
+from ..static_lookups import STATE_TO_CITY_CHOICES
+
+
+class TestDerivedLookups(unittest.TestCase):
+
+    def test_city_choices_sorted_via_city_id(self):
+        city_ids = [city_id for city_id, city_name in choices.CITY_CHOICES]
+        self.assertEqual(city_ids, sorted(city_ids))
+
+    def test_city_choices_contains_all_cities(self):
+        self.assertEqual(len(choices.CITY_CHOICES), sum(len(cities) for cities in STATE_TO_CITY_CHOICES.values()))
+
+    def test_city_choices_alphabetic_sorted_via_city_name(self):
+        city_names = [city_name for city_id, city_name in choices.CITY_CHOICES_ALPHABETIC]
+        self.assertEqual(city_names, sorted(city_names))
+
+    def test_state_to_city_ids(self):
+        self.assertEqual(choices.STATE_TO_CITY_IDS[1012], tuple(city[0] for city in STATE_TO_CITY_CHOICES[1012]))
+
+    def test_derived_lookup_built_only_once(self):
+        self.assertIs(choices.STATE_TO_CITY_IDS, choices.STATE_TO_CITY_IDS)
+
+    def test_raises_attribute_error_for_unknown_lookup(self):
+        self.assertRaises(AttributeError, getattr, choices, 'UNKNOWN_CHOICES')
@@ -0,0 +1,60 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..search import CitySearchIndex, normalize_search_text
+
+
+class TestNormalizeSearchText(unittest.TestCase):
+
+    def test_removes_case(self):
+        self.assertEqual(normalize_search_text('KOLKATA'), 'kolkata')
+
+    def test_removes_accents(self):
+        self.assertEqual(normalize_search_text('Bardhamān'), 'bardhaman')
+
+    def test_removes_punctuation(self):
+        self.assertEqual(normalize_search_text('Burdwan  (Bardhaman)'), 'burdwan bardhaman')
+
+
+class TestCitySearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = CitySearchIndex({
+            1: [(11, 'Kolkata'), (12, 'Paschim Medinipur (West Medinipur)'), (13, 'North 24 Parganas')],
+            2: [(21, 'Kolar'), (22, 'North Goa')],
+        })
+
+    def test_returns_cities_matching_prefix(self):
+        self.assertEqual(self.index.search('kol'), [(21, 'Kolar', 2), (11, 'Kolkata', 1)])
+
+    def test_matches_accent_and_case_insensitively(self):
+        self.assertEqual(self.index.search('KÓL', limit=1), [(21, 'Kolar', 2)])
+
+    def test_matches_inner_words(self):
+        self.assertEqual(self.index.search('west'), [(12, 'Paschim Medinipur (West Medinipur)', 1)])
+
+    def test_returns_each_city_once(self):
+        self.assertEqual(self.index.search('medinipur'), [(12, 'Paschim Medinipur (West Medinipur)', 1)])
+
+    def test_ranks_name_prefix_matches_first(self):
+        self.index = CitySearchIndex({1: [(11, 'West Goa'), (12, 'Goa')]})
+        self.assertEqual(self.index.search('goa'), [(12, 'Goa', 1), (11, 'West Goa', 1)])
+
+    def test_scopes_search_to_state(self):
+        self.assertEqual(self.index.search('north', state=2), [(22, 'North Goa', 2)])
+
+    def test_limits_results(self):
+        self.assertEqual(len(self.index.search('north', limit=1)), 1)
+
+    def test_returns_nothing_for_unknown_state(self):
+        self.assertEqual(self.index.search('kol', state=3), [])
+
+    def test_returns_nothing_for_blank_query(self):
+        self.assertEqual(self.index.search(' ( '), [])
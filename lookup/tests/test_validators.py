@@ -0,0 +1,58 @@
+# inbuilt python imports
+import unittest
+
+# inbuilt django imports
+from django.core.exceptions import ValidationError
+
+# third-party django imports
+
+# inter-app imports
+
+# local imports
+from ..validators import is_city_in_state, validate_city_in_state, find_cities_not_in_state
+
+
+class TestIsCityInState(unittest.TestCase):
+
+    def test_returns_true_for_city_of_state(self):
+        self.assertTrue(is_city_in_state(10662, 1036))
+
+    def test_returns_false_for_city_of_other_state(self):
+        self.assertFalse(is_city_in_state(10662, 1012))
+
+    def test_returns_false_for_unknown_city(self):
+        self.assertFalse(is_city_in_state(99999, 1036))
+
+    def test_returns_false_for_unknown_state(self):
+        self.assertFalse(is_city_in_state(10662, 99999))
+
+    def test_returns_false_for_missing_city(self):
+        self.assertFalse(is_city_in_state(None, None))
+
+    def test_returns_true_for_city_listed_under_two_states(self):
+        self.assertTrue(is_city_in_state(10671, 1034))  # Noida
+        self.assertTrue(is_city_in_state(10671, 1036))  # Uttar Dinajpur
+
+
+class TestValidateCityInState(unittest.TestCase):
+
+    def test_accepts_city_of_state(self):
+        validate_city_in_state(10662, 1036)
+
+    def test_raises_error_for_city_of_other_state(self):
+        self.assertRaises(ValidationError, validate_city_in_state, 10662, 1012)
+
+
+class TestFindCitiesNotInState(unittest.TestCase):
+
+    def test_returns_positions_of_invalid_pairs(self):
+        city_state_pairs = [(10662, 1036), (10662, 1012), (None, 1036), (10178, 1013)]
+        self.assertEqual(list(find_cities_not_in_state(city_state_pairs)), [1, 2])
+
+    def test_accepts_city_listed_under_two_states(self):
+        city_state_pairs = [(10671, 1034), (10671, 1036), (10671, 1012)]
+        self.assertEqual(list(find_cities_not_in_state(city_state_pairs)), [2])
+
+    def test_accepts_generator(self):
+        city_state_pairs = ((10662, 1036) for i in range(3))
+        self.assertEqual(list(find_cities_not_in_state(city_state_pairs)), [])
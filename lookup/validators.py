@@ -0,0 +1,37 @@
+# Python Imports
+
+# Django Imports
+from django.core.exceptions import ValidationError
+
+# Third Party Django Imports
+
+# Inter App Imports
+
+# Local Imports
+from . import choices
+
+
+def is_city_in_state(city, state):
+    """
+    Returns True If the City Belongs to the State. Set Lookup, O(1).
+
+    Checked Against the State's Cities Because a City Id Can Be Listed Under
+    More Than One State (E.g. 10671).
+    """
+    return city in choices.STATE_TO_CITY_ID_SETS.get(state, ())
+
+
+def validate_city_in_state(city, state):
+    if not is_city_in_state(city, state):
+        raise ValidationError('Please choose a correct city value')
+
+
+def find_cities_not_in_state(city_state_pairs):
+    """
+    Yields Position of Every (city, state) Pair Where the City Does Not Belong
+    to the State. Meant For Bulk Imports, Pairs Can Be Any Iterable.
+    """
+    state_to_city_id_sets = choices.STATE_TO_CITY_ID_SETS  # Bind Once, Used Per Row
+    for position, (city, state) in enumerate(city_state_pairs):
+        if city not in state_to_city_id_sets.get(state, ()):
+            yield position